@@ -267,10 +267,10 @@ def sample_files_for_shortcut(manifest: Manifest, parent_folder_id: str, shortcu
     matching_files = []
 
     for f in parent_folder.files:
-        path = f.get("path", "") if isinstance(f, dict) else f.path
+        path = f.get("path", "")
         if path.startswith(prefix):
-            modified = f.get("modified", "") if isinstance(f, dict) else getattr(f, "modified", "")
-            file_id = f.get("id", "") if isinstance(f, dict) else f.id
+            modified = f.get("modified", "")
+            file_id = f.get("id", "")
             if file_id and modified:
                 matching_files.append({"id": file_id, "modified": modified, "path": path})
 
@@ -462,7 +462,7 @@ def rescan_shortcut_folder(
     # Build lookup of existing files under this shortcut path
     existing_paths = {}
     for i, f in enumerate(parent_folder.files):
-        path = f.get("path") if isinstance(f, dict) else f.path
+        path = f.get("path")
         if path.startswith(prefix + "/") or path == prefix:
             existing_paths[path] = i
 
@@ -480,7 +480,7 @@ def rescan_shortcut_folder(
             # Check if modified
             old_idx = existing_paths[path]
             old_file = parent_folder.files[old_idx]
-            old_md5 = old_file.get("md5") if isinstance(old_file, dict) else old_file.md5
+            old_md5 = old_file.get("md5")
             new_md5 = new_file.get("md5", "")
 
             if old_md5 != new_md5:
@@ -504,13 +504,11 @@ def rescan_shortcut_folder(
 
     # Add new files
     parent_folder.files.extend(new_files)
+    parent_folder.reindex_files()
 
     # Update counts
     parent_folder.file_count = len(parent_folder.files)
-    parent_folder.total_size = sum(
-        f.get("size", 0) if isinstance(f, dict) else f.size
-        for f in parent_folder.files
-    )
+    parent_folder.total_size = sum(f.get("size", 0) for f in parent_folder.files)
 
     return added, modified, removed
 
@@ -665,6 +663,7 @@ def generate_incremental():
     # (NFC Unicode, sanitize chars, dedupe case-insensitively)
     for folder in manifest.folders:
         folder.files = normalize_manifest_files(folder.files)
+        folder.reindex_files()
         folder.file_count = len(folder.files)
         folder.total_size = sum(f.get("size", 0) for f in folder.files)
 
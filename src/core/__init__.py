@@ -31,6 +31,7 @@ from .paths import (
 from .files import (
     file_exists_with_size,
     find_unexpected_files,
+    write_atomic,
 )
 
 from .formatting import (
@@ -69,6 +70,7 @@ __all__ = [
     # Files
     "file_exists_with_size",
     "find_unexpected_files",
+    "write_atomic",
     # Formatting
     "format_size",
     "format_duration",
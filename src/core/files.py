@@ -2,6 +2,8 @@
 File system utilities for DM Chart Sync.
 """
 
+import os
+import tempfile
 from pathlib import Path
 from typing import Set, List, Tuple
 
@@ -16,6 +18,33 @@ def file_exists_with_size(path: Path, expected_size: int) -> bool:
         return False
 
 
+def write_atomic(path: Path, data: bytes, fsync: bool = True):
+    """
+    Replace a file's contents atomically.
+
+    Writes to a uniquely named temp file beside the target, then renames it
+    over the target - readers and crashes see the old or new file, never
+    half of one, and concurrent writers can't share (and tear) a temp file.
+    With fsync, the data is on disk before the rename.
+
+    Raises OSError on failure (the temp file is removed).
+    """
+    fd, tmp_name = tempfile.mkstemp(dir=path.parent, prefix=f"{path.name}.", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+            if fsync:
+                f.flush()
+                os.fsync(f.fileno())
+        os.replace(tmp_name, path)
+    except BaseException:
+        try:
+            os.unlink(tmp_name)
+        except OSError:
+            pass
+        raise
+
+
 def find_unexpected_files(folder_path: Path, expected_paths: Set[Path]) -> List[Path]:
     """
     Find local files not in the expected set.
@@ -4,6 +4,7 @@ Formatting and sanitization utilities for DM Chart Sync.
 
 import re
 import unicodedata
+from functools import lru_cache
 from pathlib import Path
 from typing import Any, Callable, List, Optional, Union
 
@@ -18,6 +19,9 @@ def normalize_fs_name(name: str) -> str:
     macOS returns NFD (decomposed), Windows/manifest use NFC (composed).
     Without normalization, "Pokémon" (NFD) won't match "Pokémon" (NFC).
     """
+    # ASCII is already NFC, and isascii() is O(1)
+    if name.isascii():
+        return name
     return unicodedata.normalize("NFC", name)
 
 
@@ -29,6 +33,8 @@ def normalize_path_key(path: str) -> str:
 
     Use this when comparing paths across sources (scanner, manifest, disk, markers).
     """
+    if path.isascii():
+        return path.lower()
     return unicodedata.normalize("NFC", path).lower()
 
 
@@ -52,6 +58,14 @@ ILLEGAL_CHAR_MAP = {
 # Control characters (0x00-0x1F) and DEL (0x7F)
 CONTROL_CHARS = set(chr(i) for i in range(32)) | {chr(127)}
 
+# Any character sanitize_filename rewrites - clean names skip the per-char pass
+_UNSAFE_CHAR_RE = re.compile(
+    "[" + re.escape("".join(ILLEGAL_CHAR_MAP)) + "\x00-\x1f\x7f]"
+)
+
+# Single "/" separators - "//" is an escaped slash inside a name
+_PATH_SEPARATOR_RE = re.compile(r"(?<!/)/(?!/)")
+
 # Windows reserved device names (case-insensitive)
 WINDOWS_RESERVED_NAMES = {
     "CON", "PRN", "AUX", "NUL",
@@ -73,11 +87,13 @@ def escape_name_slashes(name: str) -> str:
     return name.replace("/", "//")
 
 
+@lru_cache(maxsize=65536)
 def sanitize_drive_name(name: str) -> str:
     """Sanitize a raw Google Drive item name for filesystem use.
 
     Combines slash escaping with full filename sanitization.
     Use this for any name coming directly from the Drive API.
+    Cached - folder names recur across every file beneath them.
     """
     return sanitize_filename(escape_name_slashes(name))
 
@@ -98,17 +114,18 @@ def sanitize_filename(filename: str) -> str:
     # Normalize Unicode to NFC to match scan_local_files behavior.
     # macOS and some sources use NFD (decomposed), Windows expects NFC (composed).
     # Without this, "Pokémon" (NFD) won't match "Pokémon" (NFC) in path comparisons.
-    filename = unicodedata.normalize("NFC", filename)
-
-    result = []
-    for char in filename:
-        if char in ILLEGAL_CHAR_MAP:
-            result.append(ILLEGAL_CHAR_MAP[char])
-        elif char in CONTROL_CHARS:
-            result.append("_")
-        else:
-            result.append(char)
-    filename = "".join(result)
+    filename = normalize_fs_name(filename)
+
+    if _UNSAFE_CHAR_RE.search(filename):
+        result = []
+        for char in filename:
+            if char in ILLEGAL_CHAR_MAP:
+                result.append(ILLEGAL_CHAR_MAP[char])
+            elif char in CONTROL_CHARS:
+                result.append("_")
+            else:
+                result.append(char)
+        filename = "".join(result)
 
     # Strip trailing dots and spaces
     filename = filename.rstrip(". ")
@@ -135,7 +152,7 @@ def sanitize_path(path: str) -> str:
     path = path.replace("\\", "/")
     # Split only on single "/" - consecutive slashes like "//" are part of folder names
     # e.g., "Setlist/Heart // Mind/song.ini" → ["Setlist", "Heart // Mind", "song.ini"]
-    parts = re.split(r"(?<!/)/(?!/)", path)
+    parts = _PATH_SEPARATOR_RE.split(path)
     sanitized_parts = [sanitize_filename(part) for part in parts]
     return "/".join(sanitized_parts)
 
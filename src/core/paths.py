@@ -18,10 +18,14 @@ Directory structure:
 
 import os
 import sys
+from concurrent.futures import ThreadPoolExecutor
+from itertools import repeat
 from pathlib import Path
 
 import certifi
 
+from .logging import debug_log
+
 
 def get_certifi_ssl_context() -> str:
     """Get path to certifi CA bundle, handling PyInstaller bundles."""
@@ -186,12 +190,12 @@ def migrate_legacy_files() -> list[str]:
     ]
 
     for path in obsolete_files:
-        if path.exists():
-            try:
-                path.unlink()
-                migrated.append(f"removed {path.name}")
-            except Exception:
-                pass
+        # Single unlink() syscall; a missing file raises FileNotFoundError
+        try:
+            path.unlink()
+        except OSError:
+            continue
+        migrated.append(f"removed {path.name}")
 
     # =========================================================================
     # OBSOLETE DIRECTORIES: Remove empty/obsolete directories
@@ -202,17 +206,70 @@ def migrate_legacy_files() -> list[str]:
     ]
 
     for dir_path in obsolete_dirs:
-        if dir_path.exists():
+        try:
+            # Try to remove if empty
+            dir_path.rmdir()
+            migrated.append(f"removed {dir_path.name}/")
+        except OSError:
+            # Missing or not empty - leave non-empty dirs alone for now
+            pass
+
+    return migrated
+
+
+def _scan_entries(dirpath: str) -> list[tuple[str, bool, bool]]:
+    """List (name, is_dir, is_symlink) for dirpath's children, or [] on error."""
+    try:
+        with os.scandir(dirpath) as it:
+            # DirEntry answers both from the readdir d_type - no extra stat,
+            # and never recurse through symlinked chart libraries
+            return [
+                (entry.name, entry.is_dir(follow_symlinks=False), entry.is_symlink())
+                for entry in it
+            ]
+    except OSError:
+        return []
+
+
+def _rename_entries(base: str, entries, sanitize, renamed: list[str]):
+    """Rename dirpath's children (base = dirpath + os.sep) to sanitized names."""
+    for name, _, is_link in entries:
+        sanitized = sanitize(name)
+        if sanitized != name:
+            if is_link:
+                # Renaming a link the user created would break their setup
+                debug_log(f"SANITIZE_SKIP | symlink={base + name}")
+                continue
+            new = base + sanitized
+            if os.path.lexists(new):
+                continue
             try:
-                # Try to remove if empty
-                dir_path.rmdir()
-                migrated.append(f"removed {dir_path.name}/")
+                os.rename(base + name, new)
+                renamed.append(f"{name} -> {sanitized}")
             except OSError:
-                # Not empty - try removing all contents if it's truly obsolete
-                # For now, just leave non-empty dirs alone
                 pass
 
-    return migrated
+
+def _sanitize_tree(dirpath: str, sanitize, renamed: list[str]):
+    """
+    Bottom-up rename of everything under dirpath to its sanitized name.
+
+    Works on plain strings with os.scandir - the inner loop runs once per
+    file on disk, so avoid Path objects and per-child os.path.join().
+    """
+    entries = _scan_entries(dirpath)
+    base = dirpath + os.sep
+    for name, is_dir, _ in entries:
+        if is_dir:
+            _sanitize_tree(base + name, sanitize, renamed)
+    _rename_entries(base, entries, sanitize, renamed)
+
+
+def _sanitize_subtree(dirpath: str, sanitize) -> list[str]:
+    """Worker entry point: sanitize one top-level drive folder."""
+    renamed = []
+    _sanitize_tree(dirpath, sanitize, renamed)
+    return renamed
 
 
 def migrate_unsanitized_paths() -> list[str]:
@@ -237,22 +294,20 @@ def migrate_unsanitized_paths() -> list[str]:
         flag_file.touch()
         return []
 
+    # Drive folders are independent subtrees and the work is rename/stat
+    # bound, so walk them in parallel and handle the root level last
+    root = os.fspath(download_dir)
+    base = root + os.sep
+    entries = _scan_entries(root)
+    subtrees = [base + name for name, is_dir, _ in entries if is_dir]
+
     renamed = []
-    for dirpath, dirnames, filenames in os.walk(download_dir, topdown=False):
-        parent = Path(dirpath)
-
-        for name in filenames + dirnames:
-            sanitized = sanitize_filename(name)
-            if sanitized != name:
-                old = parent / name
-                new = parent / sanitized
-                if new.exists():
-                    continue
-                try:
-                    old.rename(new)
-                    renamed.append(f"{name} -> {sanitized}")
-                except OSError:
-                    pass
+    if subtrees:
+        workers = min(len(subtrees), 32, (os.cpu_count() or 1) * 4)
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            for result in executor.map(_sanitize_subtree, subtrees, repeat(sanitize_filename)):
+                renamed.extend(result)
+    _rename_entries(base, entries, sanitize_filename, renamed)
 
     flag_file.touch()
     return renamed
@@ -4,10 +4,19 @@ OAuth authentication manager for DM Chart Sync.
 Handles Google OAuth 2.0 flow for the Changes API.
 """
 
+from __future__ import annotations
+
 import sys
 from pathlib import Path
+from types import MappingProxyType
 from typing import Callable, Optional
 
+from ..core.constants import (
+    USER_OAUTH_CLIENT_ID,
+    USER_OAUTH_CLIENT_SECRET,
+    USER_OAUTH_SCOPES,
+)
+
 # OAuth imports are optional (only needed for admin script)
 try:
     from google.oauth2.credentials import Credentials
@@ -17,6 +26,17 @@ try:
 except ImportError:
     OAUTH_AVAILABLE = False
 
+# Embedded client config (same format as credentials.json), built once at import
+_CLIENT_CONFIG = MappingProxyType({
+    "installed": MappingProxyType({
+        "client_id": USER_OAUTH_CLIENT_ID,
+        "client_secret": USER_OAUTH_CLIENT_SECRET,
+        "auth_uri": "https://accounts.google.com/o/oauth2/auth",
+        "token_uri": "https://oauth2.googleapis.com/token",
+        "redirect_uris": ("http://localhost",),
+    })
+})
+
 
 class OAuthManager:
     """
@@ -247,26 +267,8 @@ class UserOAuthManager:
         if not OAUTH_AVAILABLE:
             return False
 
-        # Import credentials from constants
-        from ..core.constants import (
-            USER_OAUTH_CLIENT_ID,
-            USER_OAUTH_CLIENT_SECRET,
-            USER_OAUTH_SCOPES,
-        )
-
-        # Build client config dict (same format as credentials.json)
-        client_config = {
-            "installed": {
-                "client_id": USER_OAUTH_CLIENT_ID,
-                "client_secret": USER_OAUTH_CLIENT_SECRET,
-                "auth_uri": "https://accounts.google.com/o/oauth2/auth",
-                "token_uri": "https://oauth2.googleapis.com/token",
-                "redirect_uris": ["http://localhost"],
-            }
-        }
-
         try:
-            flow = InstalledAppFlow.from_client_config(client_config, USER_OAUTH_SCOPES)
+            flow = InstalledAppFlow.from_client_config(_CLIENT_CONFIG, USER_OAUTH_SCOPES)
             creds = flow.run_local_server(port=0)
 
             if creds:
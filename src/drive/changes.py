@@ -4,6 +4,7 @@ Change tracking for DM Chart Sync.
 Uses Google Drive Changes API for incremental manifest updates.
 """
 
+from collections import deque
 from typing import Optional, Set
 from dataclasses import dataclass
 
@@ -22,6 +23,11 @@ class ChangeStats:
     api_calls: int = 0
 
 
+def _join_path(prefix: str, parts: list[str]) -> str:
+    """Join path parts under an already-resolved prefix ("" for the root)."""
+    return "/".join([prefix, *parts]) if prefix else "/".join(parts)
+
+
 class ChangeTracker:
     """
     Tracks changes using Google Drive Changes API.
@@ -43,6 +49,13 @@ class ChangeTracker:
         """
         self.client = client
         self.manifest = manifest
+        # Per-run metadata caches - changes in one batch share most ancestors.
+        # Folders found under a tracked root are also written through to
+        # manifest.parent_cache so the next run starts warm.
+        self._parent_cache: dict[str, list[str]] = {}
+        self._name_cache: dict[str, str] = {}
+        # folder_id -> (root_folder_id, path from root), persisted in the manifest
+        self._path_cache = manifest.path_cache
 
     def get_start_token(self) -> str:
         """
@@ -74,6 +87,8 @@ class ChangeTracker:
 
         start_api_calls = self.client.api_calls
         stats = ChangeStats()
+        self._parent_cache.clear()
+        self._name_cache.clear()
 
         # Fetch changes
         changes, new_token = self.client.get_changes(saved_token)
@@ -85,17 +100,26 @@ class ChangeTracker:
 
         # Build lookup for existing files
         file_lookup = self.manifest.build_file_lookup()
-        files_to_remove = []
 
+        # Drive may report several changes for one file in a poll (edit,
+        # rename, move) - only the final state matters
+        latest = {}
         for change in changes:
+            latest[change.get("fileId")] = change
+
+        self._invalidate_changed_folders(latest.values())
+
+        for change in latest.values():
             file_id = change.get("fileId")
+            # Shortcuts live at the shortcut's location, not the target's
+            path_id = file_id
             is_removed = change.get("removed", False)
             file_data = change.get("file")
 
             # Handle removals and trashed files
             if is_removed or (file_data and file_data.get("trashed")):
                 if file_id in file_lookup:
-                    files_to_remove.append(file_lookup[file_id])
+                    self._remove_file(file_lookup[file_id], file_id)
                     stats.removed += 1
                 continue
 
@@ -146,7 +170,7 @@ class ChangeTracker:
 
                 # Find which root folder this belongs to
                 for folder in self.manifest.folders:
-                    file_path = self._get_file_path(file_id, folder.folder_id)
+                    file_path = self._get_file_path(path_id, folder.folder_id)
                     if file_path:
                         self._update_file_in_folder(
                             folder, file_id, file_data, file_path,
@@ -157,14 +181,6 @@ class ChangeTracker:
             if progress_callback:
                 progress_callback(stats)
 
-        # Remove deleted files (in reverse order to maintain indices)
-        for fi, fli in sorted(files_to_remove, reverse=True):
-            folder = self.manifest.folders[fi]
-            removed_file = folder.files.pop(fli)
-            folder.file_count -= 1
-            size = removed_file.get("size", 0) if isinstance(removed_file, dict) else removed_file.size
-            folder.total_size -= size
-
         # Update token
         self.manifest.changes_token = new_token
         stats.api_calls = self.client.api_calls - start_api_calls
@@ -172,52 +188,170 @@ class ChangeTracker:
         return stats
 
     def _is_in_tracked_folders(self, file_data: dict, tracked_ids: Set[str]) -> bool:
-        """Check if file is within tracked folders by walking parent chain."""
+        """
+        Check if file is within tracked folders by walking parent chain.
+
+        Walks one level of ancestors at a time so each level costs a single
+        batched metadata request instead of one request per parent. Folders
+        already known to sit under a tracked root (manifest's
+        known_subfolder_ids) end the walk without any request, and every
+        folder on a successful walk is recorded there (and in parent_cache)
+        for the next change. Folders outside tracked roots are not persisted.
+        """
         parents = file_data.get("parents", [])
         if not parents:
             return False
 
+        known = self.manifest.known_subfolder_ids
         visited = set()
-        to_check = list(parents)
+        child_of: dict[str, str] = {}
+        level = list(parents)
 
-        while to_check:
-            parent_id = to_check.pop(0)
-            if parent_id in visited:
-                continue
-            visited.add(parent_id)
+        while level:
+            to_fetch = []
+            for parent_id in level:
+                if parent_id in visited:
+                    continue
+                visited.add(parent_id)
+
+                root_id = parent_id if parent_id in tracked_ids else known.get(parent_id)
+                if root_id in tracked_ids:
+                    # Remember the chain that led here so siblings short-circuit
+                    node = child_of.get(parent_id)
+                    while node is not None:
+                        known[node] = root_id
+                        self._persist_folder(node)
+                        node = child_of.get(node)
+                    return True
+                to_fetch.append(parent_id)
+
+            if not to_fetch:
+                break
+
+            # Get parents' parents
+            self._fetch_metadata(to_fetch)
+            level = []
+            for parent_id in to_fetch:
+                for grandparent_id in self._parent_cache[parent_id]:
+                    child_of.setdefault(grandparent_id, parent_id)
+                    level.append(grandparent_id)
 
-            if parent_id in tracked_ids:
-                return True
+        return False
 
-            # Get parent's parents
-            parent_data = self.client.get_file_metadata(parent_id, "parents")
-            if parent_data:
-                to_check.extend(parent_data.get("parents", []))
+    def _invalidate_changed_folders(self, changes):
+        """
+        Drop persisted folder data that this batch of changes makes stale.
 
-        return False
+        A renamed, moved or removed folder loses its own parent_cache entry.
+        Since cached paths and known subfolders of everything beneath it may
+        now be wrong too, those caches are cleared whenever such a folder was
+        cached - they rebuild on demand.
+        """
+        parent_cache = self.manifest.parent_cache
+        stale = False
+        for change in changes:
+            file_data = change.get("file")
+            is_folder = file_data and file_data.get("mimeType") == self.FOLDER_MIME
+            if not (is_folder or change.get("removed")):
+                continue
+            folder_id = change.get("fileId")
+            if folder_id in parent_cache:
+                del parent_cache[folder_id]
+                stale = True
+            if folder_id in self._path_cache or folder_id in self.manifest.known_subfolder_ids:
+                stale = True
+        if stale:
+            self._path_cache.clear()
+            self.manifest.known_subfolder_ids.clear()
+
+    def _load_persisted(self, folder_id: str) -> bool:
+        """Load a folder's name/parents from manifest.parent_cache, if there."""
+        data = self.manifest.parent_cache.get(folder_id)
+        if data is None:
+            return False
+        self._store_metadata(folder_id, data)
+        return True
+
+    def _persist_folder(self, folder_id: str):
+        """Write a folder's cached name/parents through to the manifest."""
+        self.manifest.parent_cache[folder_id] = {
+            "name": self._name_cache[folder_id],
+            "parents": self._parent_cache[folder_id],
+        }
+
+    def _store_metadata(self, file_id: str, data: Optional[dict]):
+        """Cache name/parents for a file. Missing files cache as no parents."""
+        if data:
+            self._parent_cache[file_id] = data.get("parents", [])
+            self._name_cache[file_id] = data.get("name", "")
+        else:
+            self._parent_cache[file_id] = []
+
+    def _fetch_metadata(self, folder_ids: list[str]):
+        """Fetch name/parents for any uncached folder IDs in one batched request."""
+        missing = [
+            fid for fid in folder_ids
+            if fid not in self._parent_cache and not self._load_persisted(fid)
+        ]
+        if not missing:
+            return
+        metadata = self.client.get_files_metadata_batch(missing, "name,parents")
+        for folder_id in missing:
+            self._store_metadata(folder_id, metadata.get(folder_id))
+
+    def _get_parents(self, file_id: str) -> list[str]:
+        """Get a file's parent IDs, fetching name/parents on cache miss."""
+        if file_id not in self._parent_cache and not self._load_persisted(file_id):
+            self._store_metadata(
+                file_id, self.client.get_file_metadata(file_id, "name,parents")
+            )
+        return self._parent_cache[file_id]
 
     def _get_file_path(self, file_id: str, root_folder_id: str) -> Optional[str]:
-        """Get file path relative to a root folder."""
-        path_parts = []
+        """
+        Get file path relative to a root folder.
+
+        Stops at the first ancestor whose path under this root is already
+        cached, and caches every folder resolved on the way up so later
+        files in the same subtree finish in a hop or two.
+        """
+        path_parts = deque()
+        chain = []  # IDs walked, file first
         current_id = file_id
+        prefix = None
 
         while current_id and current_id != root_folder_id:
-            data = self.client.get_file_metadata(current_id, "name,parents")
-            if not data:
+            cached = self._path_cache.get(current_id)
+            if cached is not None and cached[0] == root_folder_id:
+                prefix = cached[1]
+                break
+
+            parents = self._get_parents(current_id)
+            if current_id not in self._name_cache:
                 return None
 
-            name = sanitize_drive_name(data.get("name", ""))
-            path_parts.insert(0, name)
-            parents = data.get("parents", [])
+            name = sanitize_drive_name(self._name_cache[current_id])
+            path_parts.appendleft(name)
+            chain.append(current_id)
             if not parents:
                 return None
 
             current_id = parents[0]
 
-        if current_id == root_folder_id:
-            return "/".join(path_parts)
+        if prefix is None:
+            if current_id != root_folder_id:
+                return None
+            prefix = ""
+
+        # Cache the folders walked (chain[1:]); chain[i] owns parts[:-i]
+        parts = list(path_parts)
+        for i, folder_id in enumerate(chain[1:], start=1):
+            self._path_cache[folder_id] = (
+                root_folder_id, _join_path(prefix, parts[:-i])
+            )
+            self._persist_folder(folder_id)
 
-        return None
+        return _join_path(prefix, parts)
 
     def _update_file_in_folder(
         self,
@@ -239,16 +373,20 @@ class ChangeTracker:
         }
 
         if file_id in file_lookup:
-            # Update existing
-            fi, fli = file_lookup[file_id]
-            old_entry = self.manifest.folders[fi].files[fli]
-            old_size = old_entry.get("size", 0) if isinstance(old_entry, dict) else old_entry.size
-            self.manifest.folders[fi].files[fli] = new_entry
-            self.manifest.folders[fi].total_size += new_entry["size"] - old_size
+            # Update existing (in whichever folder already holds it)
+            owner = file_lookup[file_id]
+            old_entry = owner.replace_file(file_id, new_entry)
+            owner.total_size += new_entry["size"] - old_entry.get("size", 0)
             stats.modified += 1
         else:
             # Add new
-            folder.files.append(new_entry)
+            folder.add_file(new_entry)
             folder.file_count += 1
             folder.total_size += new_entry["size"]
             stats.added += 1
+
+    def _remove_file(self, folder: FolderEntry, file_id: str):
+        """Remove a file entry from its folder and update folder totals."""
+        removed_file = folder.remove_file(file_id)
+        folder.file_count -= 1
+        folder.total_size -= removed_file.get("size", 0)
@@ -6,12 +6,23 @@ Handles all HTTP interactions with the Google Drive API.
 
 import time
 import re
-import json
+import threading
 import requests
 from typing import Optional
 from dataclasses import dataclass
 from urllib.parse import urlencode
 
+from requests.adapters import HTTPAdapter
+
+from ..core.jsonio import json_loads
+
+# Batch response parsing (Content-Type header is str; the rest are bytes
+# patterns matched against response.content)
+_BOUNDARY_RE = re.compile(r'boundary=([^\s;]+)')
+_HEADER_END_RE = re.compile(rb'\r?\n\r?\n')
+_CONTENT_ID_RE = re.compile(rb'Content-ID:\s*<?\s*response-([^>\s]+)')
+_STATUS_RE = re.compile(rb'HTTP/[\d.]+ (\d+)')
+
 
 @dataclass
 class DriveClientConfig:
@@ -20,6 +31,7 @@ class DriveClientConfig:
     timeout: int = 60
     max_retries: int = 3
     max_qps: float = 100  # queries per second limit (0 = unlimited)
+    max_connections: int = 32  # pooled keep-alive connections (>= scanner workers)
 
 
 class DriveClient:
@@ -45,8 +57,21 @@ class DriveClient:
         self.config = config
         self.auth_token = auth_token
         self._api_calls = 0
-        self._last_request_time = 0.0
-        self._min_request_interval = 1.0 / config.max_qps if config.max_qps > 0 else 0
+        # Scanner threads share one client; += on an int isn't atomic
+        self._api_calls_lock = threading.Lock()
+        # Token bucket: bursts up to max_qps requests, refilled at max_qps/sec
+        self._refill_rate = max(config.max_qps, 0)
+        self._capacity = self._refill_rate
+        self._tokens = self._capacity
+        self._last_refill = time.monotonic()
+        self._rate_lock = threading.Lock()
+        # One pooled session so keep-alive connections (and their TLS
+        # handshakes) are reused across requests and scanner threads
+        self._session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=4, pool_maxsize=config.max_connections
+        )
+        self._session.mount("https://", adapter)
 
     @property
     def api_calls(self) -> int:
@@ -55,7 +80,13 @@ class DriveClient:
 
     def reset_api_calls(self):
         """Reset the API call counter."""
-        self._api_calls = 0
+        with self._api_calls_lock:
+            self._api_calls = 0
+
+    def record_api_calls(self, count: int):
+        """Add to the API call counter (safe from any thread)."""
+        with self._api_calls_lock:
+            self._api_calls += count
 
     def _get_headers(self) -> dict:
         """Get request headers."""
@@ -68,14 +99,26 @@ class DriveClient:
         params = {"key": self.config.api_key, **kwargs}
         return params
 
-    def _wait_for_rate_limit(self):
-        """Wait if necessary to respect rate limit."""
-        if self._min_request_interval <= 0:
+    def _acquire(self, n: int = 1):
+        """
+        Take n request tokens from the rate-limit bucket, sleeping if short.
+
+        Tokens may go negative so concurrent callers queue behind each
+        other's debt instead of all waking at once.
+        """
+        if self._refill_rate <= 0:
             return
-        elapsed = time.time() - self._last_request_time
-        if elapsed < self._min_request_interval:
-            time.sleep(self._min_request_interval - elapsed)
-        self._last_request_time = time.time()
+        with self._rate_lock:
+            now = time.monotonic()
+            self._tokens = min(
+                self._capacity,
+                self._tokens + (now - self._last_refill) * self._refill_rate,
+            )
+            self._last_refill = now
+            self._tokens -= n
+            wait = -self._tokens / self._refill_rate if self._tokens < 0 else 0
+        if wait > 0:
+            time.sleep(wait)
 
     def _request_with_retry(self, method: str, url: str, **kwargs) -> requests.Response:
         """Make a request with retry logic."""
@@ -83,9 +126,9 @@ class DriveClient:
 
         for attempt in range(self.config.max_retries):
             try:
-                self._wait_for_rate_limit()
-                response = requests.request(method, url, timeout=timeout, **kwargs)
-                self._api_calls += 1
+                self._acquire()
+                response = self._session.request(method, url, timeout=timeout, **kwargs)
+                self.record_api_calls(1)
                 response.raise_for_status()
                 return response
             except requests.exceptions.Timeout:
@@ -113,8 +156,23 @@ class DriveClient:
         Returns:
             List of file/folder metadata dicts
         """
+        return self.list_folder_from_token(folder_id, None)
+
+    def list_folder_from_token(self, folder_id: str, page_token: Optional[str]) -> list:
+        """
+        List a folder's contents starting from a given page.
+
+        Used to continue a listing whose first page already arrived in a
+        batch response, without re-fetching that page.
+
+        Args:
+            folder_id: Google Drive folder ID
+            page_token: nextPageToken to resume from (None = first page)
+
+        Returns:
+            List of file/folder metadata dicts from that page onward
+        """
         all_items = []
-        page_token = None
 
         while True:
             params = self._get_params(
@@ -134,7 +192,7 @@ class DriveClient:
                     params=params,
                     headers=self._get_headers()
                 )
-                data = response.json()
+                data = json_loads(response.content)
             except requests.exceptions.HTTPError as e:
                 if hasattr(e, 'response') and e.response.status_code == 403:
                     return []  # Access denied
@@ -170,7 +228,7 @@ class DriveClient:
                 params=params,
                 headers=self._get_headers()
             )
-            return response.json()
+            return json_loads(response.content)
         except requests.exceptions.HTTPError:
             return None
 
@@ -192,8 +250,8 @@ class DriveClient:
             params=params,
             headers=self._get_headers()
         )
-        self._api_calls += 1
-        return response.json().get("startPageToken")
+        self.record_api_calls(1)
+        return json_loads(response.content).get("startPageToken")
 
     def get_changes(self, page_token: str) -> tuple:
         """
@@ -217,7 +275,7 @@ class DriveClient:
             params = {
                 "pageToken": current_token,
                 "pageSize": 1000,
-                "fields": "nextPageToken, newStartPageToken, changes(fileId, removed, file(id, name, mimeType, size, md5Checksum, modifiedTime, parents, trashed))",
+                "fields": "nextPageToken, newStartPageToken, changes(fileId, removed, file(id, name, mimeType, size, md5Checksum, modifiedTime, parents, trashed, shortcutDetails))",
                 "supportsAllDrives": "true",
                 "includeItemsFromAllDrives": "true",
             }
@@ -227,7 +285,7 @@ class DriveClient:
                 params=params,
                 headers=self._get_headers()
             )
-            data = response.json()
+            data = json_loads(response.content)
 
             all_changes.extend(data.get("changes", []))
 
@@ -261,10 +319,8 @@ class DriveClient:
         for i in range(0, len(folder_ids), batch_size):
             batch_ids = folder_ids[i:i + batch_size]
 
-            # Rate limit: wait for enough "tokens" for this batch
-            # Each request in the batch counts toward quota
-            for _ in range(len(batch_ids)):
-                self._wait_for_rate_limit()
+            # Each request in the batch counts toward quota - take them in one go
+            self._acquire(len(batch_ids))
 
             boundary = f"batch_{int(time.time() * 1000)}_{i}"
 
@@ -298,13 +354,13 @@ class DriveClient:
                 headers["Authorization"] = f"Bearer {self.auth_token}"
 
             try:
-                response = requests.post(
+                response = self._session.post(
                     BATCH_URL,
                     headers=headers,
                     data=body,
                     timeout=self.config.timeout
                 )
-                self._api_calls += len(batch_ids)  # Count each batched call
+                self.record_api_calls(len(batch_ids))  # Count each batched call
                 response.raise_for_status()
 
                 # Parse multipart response, track folders needing follow-up
@@ -316,9 +372,11 @@ class DriveClient:
                 for folder_id in failed_ids:
                     results[folder_id] = self.list_folder(folder_id)
 
-                # Handle pagination for folders with >1000 items
+                # Folders with >1000 items: keep the batch's first page, fetch the rest
                 for folder_id, page_token in needs_pagination:
-                    results[folder_id] = self.list_folder(folder_id)
+                    results[folder_id].extend(
+                        self.list_folder_from_token(folder_id, page_token)
+                    )
 
             except requests.exceptions.HTTPError:
                 # On batch failure, fall back to individual calls for this batch
@@ -327,52 +385,158 @@ class DriveClient:
 
         return results
 
-    def _parse_batch_response(self, response: requests.Response, results: dict,
-                              needs_pagination: list = None, failed_ids: list = None):
-        """Parse a multipart/mixed batch response and populate results dict."""
+    def get_files_metadata_batch(
+        self, file_ids: list[str], fields: str = "id,name,parents", batch_size: int = 100
+    ) -> dict[str, Optional[dict]]:
+        """
+        Get metadata for multiple files in batched API calls.
+
+        Batched counterpart of get_file_metadata() - one HTTP call per
+        batch_size files instead of one per file.
+
+        Args:
+            file_ids: List of Google Drive file IDs
+            fields: Comma-separated list of fields to return
+            batch_size: Max requests per batch (Google limit is 100)
+
+        Returns:
+            Dict mapping file_id -> metadata dict, or None if not found
+        """
+        BATCH_URL = "https://www.googleapis.com/batch/drive/v3"
+        results: dict[str, Optional[dict]] = {fid: None for fid in file_ids}
+
+        for i in range(0, len(file_ids), batch_size):
+            batch_ids = file_ids[i:i + batch_size]
+
+            self._acquire(len(batch_ids))
+
+            boundary = f"batch_{int(time.time() * 1000)}_{i}"
+            query_params = urlencode({
+                "fields": fields,
+                "supportsAllDrives": "true",
+                "key": self.config.api_key,
+            })
+
+            parts = []
+            for file_id in batch_ids:
+                parts.append(
+                    f"--{boundary}\r\n"
+                    f"Content-Type: application/http\r\n"
+                    f"Content-ID: <{file_id}>\r\n"
+                    f"\r\n"
+                    f"GET /drive/v3/files/{file_id}?{query_params}\r\n"
+                )
+            body = "".join(parts) + f"--{boundary}--\r\n"
+
+            headers = {
+                "Content-Type": f"multipart/mixed; boundary={boundary}",
+            }
+            if self.auth_token:
+                headers["Authorization"] = f"Bearer {self.auth_token}"
+
+            try:
+                response = self._session.post(
+                    BATCH_URL,
+                    headers=headers,
+                    data=body,
+                    timeout=self.config.timeout
+                )
+                self.record_api_calls(len(batch_ids))
+                response.raise_for_status()
+            except requests.exceptions.HTTPError:
+                for file_id in batch_ids:
+                    results[file_id] = self.get_file_metadata(file_id, fields)
+                continue
+
+            failed_ids = []
+            for file_id, status, data in self._iter_batch_parts(response):
+                if file_id not in results:
+                    continue
+                if status == 404:
+                    continue  # Not found (or no access) - leave as None
+                if status >= 400 or data is None:
+                    failed_ids.append(file_id)
+                    continue
+                results[file_id] = data
+
+            # Retry other failed sub-requests individually (e.g. rate limit)
+            for file_id in failed_ids:
+                results[file_id] = self.get_file_metadata(file_id, fields)
+
+        return results
+
+    def _iter_batch_parts(self, response: requests.Response):
+        """
+        Split a multipart/mixed batch response into its sub-responses.
+
+        Works on the raw response bytes: no decode of the whole body to str,
+        no split() copy of it, and each JSON body is handed straight to the
+        JSON parser instead of being located with a DOTALL regex.
+
+        Yields:
+            Tuples of (content_id, http_status, json_body_or_None)
+        """
         content_type = response.headers.get("Content-Type", "")
-        boundary_match = re.search(r'boundary=([^\s;]+)', content_type)
+        boundary_match = _BOUNDARY_RE.search(content_type)
         if not boundary_match:
             return
 
-        boundary = boundary_match.group(1)
-        parts = response.text.split(f"--{boundary}")
+        content = response.content
+        delimiter = b"--" + boundary_match.group(1).encode()
+        pos = content.find(delimiter)
+
+        while pos != -1:
+            start = pos + len(delimiter)
+            pos = content.find(delimiter, start)
+            if pos == -1:
+                break  # Closing "--boundary--" delimiter
+            part = content[start:pos]
 
-        for part in parts:
-            if not part.strip() or part.strip() == "--":
+            # Outer headers (Content-ID) end at the first blank line
+            outer_end = _HEADER_END_RE.search(part)
+            if not outer_end:
                 continue
 
-            # Extract Content-ID (folder_id)
-            id_match = re.search(r'Content-ID:\s*<?\s*response-([^>\s]+)', part)
+            # Extract Content-ID (the ID we sent, prefixed with "response-")
+            id_match = _CONTENT_ID_RE.search(part, 0, outer_end.start())
             if not id_match:
                 continue
 
-            folder_id = id_match.group(1)
+            status_match = _STATUS_RE.match(part, outer_end.end())
+            status = int(status_match.group(1)) if status_match else 200
+
+            # JSON body follows the inner (HTTP response) headers
+            data = None
+            inner_end = _HEADER_END_RE.search(part, outer_end.end())
+            if inner_end:
+                try:
+                    data = json_loads(part[inner_end.end():])
+                except ValueError:
+                    pass
+
+            yield id_match.group(1).decode(), status, data
+
+    def _parse_batch_response(self, response: requests.Response, results: dict,
+                              needs_pagination: list = None, failed_ids: list = None):
+        """Parse a multipart/mixed batch response and populate results dict."""
+        for folder_id, status, data in self._iter_batch_parts(response):
             if folder_id not in results:
                 continue
 
             # Check HTTP status in this part — retry failures individually
-            status_match = re.search(r'HTTP/[\d.]+ (\d+)', part)
-            if status_match and int(status_match.group(1)) >= 400:
+            if status >= 400:
                 if failed_ids is not None:
                     failed_ids.append(folder_id)
                 continue
 
-            # Find JSON body (after blank line following headers)
-            json_match = re.search(r'\r?\n\r?\n({.*})', part, re.DOTALL)
-            if not json_match:
+            if data is None:
                 continue
 
-            try:
-                data = json.loads(json_match.group(1))
-                files = data.get("files", [])
-                results[folder_id] = files
-
-                # Track folders that need pagination follow-up
-                if data.get("nextPageToken") and needs_pagination is not None:
-                    needs_pagination.append((folder_id, data["nextPageToken"]))
-            except json.JSONDecodeError:
-                pass
+            results[folder_id] = data.get("files", [])
+
+            # Track folders that need pagination follow-up
+            if data.get("nextPageToken") and needs_pagination is not None:
+                needs_pagination.append((folder_id, data["nextPageToken"]))
 
     def validate_folder(self, folder_id: str) -> tuple[bool, Optional[str]]:
         """
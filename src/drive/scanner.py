@@ -4,9 +4,10 @@ Folder scanner for DM Chart Sync.
 Recursively scans Google Drive folders to build file lists.
 """
 
+import threading
 from pathlib import Path
 from typing import Callable, Optional, List
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
 from dataclasses import dataclass
 
 from .client import DriveClient
@@ -21,7 +22,7 @@ class ScanResult:
     folder_count: int
     shortcut_count: int
     api_calls: int
-    cancelled: bool = False  # True if scan was interrupted by Ctrl+C
+    cancelled: bool = False  # True if scan was interrupted (Ctrl+C or stop_event)
 
 
 class FolderScanner:
@@ -37,7 +38,13 @@ class FolderScanner:
     FOLDER_MIME = "application/vnd.google-apps.folder"
     SHORTCUT_MIME = "application/vnd.google-apps.shortcut"
 
-    def __init__(self, client: DriveClient, max_workers: int = 24, use_batch: bool = True):
+    def __init__(
+        self,
+        client: DriveClient,
+        max_workers: int = 24,
+        use_batch: bool = True,
+        stop_event: Optional[threading.Event] = None,
+    ):
         """
         Initialize the scanner.
 
@@ -45,10 +52,15 @@ class FolderScanner:
             client: DriveClient instance for API calls
             max_workers: Number of parallel scanning threads (for non-batch mode)
             use_batch: If True, use batch API for faster scanning
+            stop_event: Optional event that cancels the scan between requests
         """
         self.client = client
         self.max_workers = max_workers
         self.use_batch = use_batch
+        self.stop_event = stop_event
+
+    def _stop_requested(self) -> bool:
+        return self.stop_event is not None and self.stop_event.is_set()
 
     def scan(
         self,
@@ -89,11 +101,16 @@ class FolderScanner:
 
         try:
             while folders_to_scan:
+                if self._stop_requested():
+                    cancelled = True
+                    break
+
                 # Batch list all pending folders
                 folder_ids = list(folders_to_scan.keys())
                 results = self.client.list_folders_batch(folder_ids)
 
                 next_folders = {}
+                pending_shortcuts = []
 
                 for fid, items in results.items():
                     folder_path = folders_to_scan[fid]
@@ -117,19 +134,7 @@ class FolderScanner:
                                 shortcut_count += 1
                                 next_folders[target_id] = item_path
                             elif target_id:
-                                target_meta = self.client.get_file_metadata(
-                                    target_id,
-                                    fields="id,name,size,md5Checksum,modifiedTime"
-                                )
-                                if target_meta:
-                                    all_files.append({
-                                        "id": target_id,
-                                        "path": item_path,
-                                        "name": item_name,
-                                        "size": int(target_meta.get("size", 0)),
-                                        "md5": target_meta.get("md5Checksum", ""),
-                                        "modified": target_meta.get("modifiedTime", ""),
-                                    })
+                                pending_shortcuts.append((target_id, item_path, item_name))
                         else:
                             all_files.append({
                                 "id": item["id"],
@@ -143,6 +148,11 @@ class FolderScanner:
                     if progress_callback:
                         progress_callback(folder_count, len(all_files), shortcut_count, all_files)
 
+                if pending_shortcuts:
+                    self._resolve_file_shortcuts(pending_shortcuts, all_files)
+                    if progress_callback:
+                        progress_callback(folder_count, len(all_files), shortcut_count, all_files)
+
                 folders_to_scan = next_folders
 
         except KeyboardInterrupt:
@@ -163,26 +173,40 @@ class FolderScanner:
         base_path: str = "",
         progress_callback: Optional[Callable[[int, int, int], None]] = None,
     ) -> ScanResult:
-        """Scan using parallel individual requests - fallback mode."""
+        """
+        Scan using parallel individual requests - fallback mode.
+
+        Subfolders are submitted as soon as they're discovered rather than
+        level by level, so one slow or wide folder never leaves the rest of
+        the pool idle.
+        """
         all_files = []
-        folders_to_scan = [(folder_id, base_path)]
         folder_count = 0
         shortcut_count = 0
         start_api_calls = self.client.api_calls
         cancelled = False
+        pending_shortcuts = []
 
         try:
             with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
-                while folders_to_scan:
-                    # Submit batch of folder scans
-                    futures = {
-                        executor.submit(self.client.list_folder, fid): (fid, fpath)
-                        for fid, fpath in folders_to_scan
-                    }
-                    folders_to_scan = []
-
-                    for future in as_completed(futures):
-                        folder_id_done, folder_path = futures[future]
+                pending = {}
+
+                def submit(fid: str, fpath: str):
+                    pending[executor.submit(self.client.list_folder, fid)] = fpath
+
+                submit(folder_id, base_path)
+
+                while pending:
+                    if self._stop_requested():
+                        # Drop queued listings; only in-flight requests are waited on
+                        cancelled = True
+                        executor.shutdown(wait=False, cancel_futures=True)
+                        break
+
+                    done, _ = wait(pending, return_when=FIRST_COMPLETED)
+
+                    for future in done:
+                        folder_path = pending.pop(future)
                         try:
                             items = future.result()
                             folder_count += 1
@@ -195,7 +219,7 @@ class FolderScanner:
 
                                 # Handle regular folders
                                 if mime_type == self.FOLDER_MIME:
-                                    folders_to_scan.append((item["id"], item_path))
+                                    submit(item["id"], item_path)
 
                                 # Handle shortcuts (links to other drives)
                                 elif mime_type == self.SHORTCUT_MIME:
@@ -206,23 +230,11 @@ class FolderScanner:
                                     if target_id and target_mime == self.FOLDER_MIME:
                                         # Shortcut to folder - follow it
                                         shortcut_count += 1
-                                        folders_to_scan.append((target_id, item_path))
+                                        submit(target_id, item_path)
                                     elif target_id:
-                                        # Shortcut to file - need to fetch target's metadata
-                                        # (shortcuts don't have size/md5, only the target file does)
-                                        target_meta = self.client.get_file_metadata(
-                                            target_id,
-                                            fields="id,name,size,md5Checksum,modifiedTime"
-                                        )
-                                        if target_meta:
-                                            all_files.append({
-                                                "id": target_id,
-                                                "path": item_path,
-                                                "name": item_name,
-                                                "size": int(target_meta.get("size", 0)),
-                                                "md5": target_meta.get("md5Checksum", ""),
-                                                "modified": target_meta.get("modifiedTime", ""),
-                                            })
+                                        # Shortcut to file - target metadata is fetched
+                                        # in batches of up to 100
+                                        pending_shortcuts.append((target_id, item_path, item_name))
 
                                 # Handle regular files
                                 else:
@@ -243,6 +255,13 @@ class FolderScanner:
                             # Log error but continue scanning
                             print(f"\n  Error scanning folder: {e}")
 
+                    # Resolve file shortcuts once a full batch is queued, or at the end
+                    if len(pending_shortcuts) >= 100 or (pending_shortcuts and not pending):
+                        self._resolve_file_shortcuts(pending_shortcuts, all_files)
+                        pending_shortcuts = []
+                        if progress_callback:
+                            progress_callback(folder_count, len(all_files), shortcut_count, all_files)
+
         except KeyboardInterrupt:
             cancelled = True
             print("\n  Scan interrupted by user (Ctrl+C)")
@@ -255,6 +274,34 @@ class FolderScanner:
             cancelled=cancelled,
         )
 
+    def _resolve_file_shortcuts(self, pending: list[tuple[str, str, str]], all_files: list):
+        """
+        Fetch target metadata for shortcuts to files and add them to all_files.
+
+        Shortcuts don't carry size/md5 - only the target file does - so
+        the targets collected during a level are fetched in one batch call
+        rather than one request each.
+
+        Args:
+            pending: List of (target_id, item_path, item_name)
+            all_files: File list to append resolved entries to
+        """
+        target_ids = list(dict.fromkeys(target_id for target_id, _, _ in pending))
+        metadata = self.client.get_files_metadata_batch(
+            target_ids, fields="id,name,size,md5Checksum,modifiedTime"
+        )
+        for target_id, item_path, item_name in pending:
+            target_meta = metadata.get(target_id)
+            if target_meta:
+                all_files.append({
+                    "id": target_id,
+                    "path": item_path,
+                    "name": item_name,
+                    "size": int(target_meta.get("size", 0)),
+                    "md5": target_meta.get("md5Checksum", ""),
+                    "modified": target_meta.get("modifiedTime", ""),
+                })
+
     def scan_for_sync(
         self,
         folder_id: str,
@@ -40,15 +40,47 @@ class FileEntry:
         )
 
 
+def _entry_id(entry: dict) -> str:
+    """Get the file ID from a file entry."""
+    return entry.get("id")
+
+
+class _FolderFiles:
+    """
+    FolderEntry.files: the folder's file entries, with removals applied.
+
+    remove_file() tombstones its slot in the underlying list so a batch of
+    removals stays O(1) each; reading files compacts them away first, so
+    callers never see the tombstones.
+    """
+
+    def __get__(self, folder, owner=None):
+        if folder is None:
+            return None  # Dataclass default, replaced with [] on assignment
+        folder.compact_files()
+        return folder._files
+
+    def __set__(self, folder, files):
+        folder._files = [] if files is None else files
+        folder._tombstones = 0
+
+
 @dataclass
 class FolderEntry:
-    """A folder in the manifest."""
+    """
+    A folder in the manifest.
+
+    files is indexed by file ID (file_index(), and the manifest-wide lookup
+    from Manifest.build_file_lookup()). Change it through add_file,
+    replace_file and remove_file, which keep both indexes current. Code
+    that edits files directly must call reindex_files() afterwards.
+    """
     name: str
     folder_id: str
     description: str = ""
     file_count: int = 0
     total_size: int = 0
-    files: list = field(default_factory=list)
+    files: list = _FolderFiles()  # File entries as dicts (see FileEntry)
     # Chart statistics
     chart_count: int = 0
     charts: dict = field(default_factory=dict)  # {"folder": N, "zip": N, "sng": N, "total": N}
@@ -56,14 +88,100 @@ class FolderEntry:
     # Completion status (False if scan was interrupted)
     complete: bool = True
 
+    def __post_init__(self):
+        # Entries are always dicts - convert any FileEntry objects once here
+        # so hot paths never branch on the representation
+        for i, f in enumerate(self._files):
+            if isinstance(f, FileEntry):
+                self._files[i] = f.to_dict()
+        # file_id -> index into _files, built on first use and kept in sync by
+        # add_file/replace_file/remove_file. Removed slots hold None
+        # (tombstones) until compact_files() so indices stay stable.
+        self._file_index: Optional[dict[str, int]] = None
+        # Manifest-wide file_id -> FolderEntry lookup this folder keeps in
+        # sync (set by Manifest.build_file_lookup)
+        self._lookup: Optional[dict] = None
+
+    def file_index(self) -> dict[str, int]:
+        """Get the file_id -> index lookup for this folder's files."""
+        if self._file_index is None:
+            self._file_index = {
+                _entry_id(f): i for i, f in enumerate(self._files) if f is not None
+            }
+        return self._file_index
+
+    def get_file(self, file_id: str):
+        """Get a file entry by ID, or None if not in this folder."""
+        idx = self.file_index().get(file_id)
+        return None if idx is None else self._files[idx]
+
+    def add_file(self, entry):
+        """Append a file entry and index it."""
+        file_id = _entry_id(entry)
+        self.file_index()[file_id] = len(self._files)
+        self._files.append(entry)
+        if self._lookup is not None:
+            self._lookup[file_id] = self
+
+    def replace_file(self, file_id: str, entry):
+        """Replace an existing file entry in place. Returns the old entry."""
+        index = self.file_index()
+        idx = index[file_id]
+        new_id = _entry_id(entry)
+        if new_id != file_id:
+            del index[file_id]
+            index[new_id] = idx
+            if self._lookup is not None:
+                self._lookup.pop(file_id, None)
+                self._lookup[new_id] = self
+        old = self._files[idx]
+        self._files[idx] = entry
+        return old
+
+    def remove_file(self, file_id: str):
+        """Remove a file entry in O(1), leaving a tombstone. Returns the removed entry."""
+        idx = self.file_index().pop(file_id)
+        old = self._files[idx]
+        self._files[idx] = None
+        self._tombstones += 1
+        if self._lookup is not None and self._lookup.get(file_id) is self:
+            del self._lookup[file_id]
+        return old
+
+    def compact_files(self):
+        """Drop tombstones left by remove_file()."""
+        if self._tombstones:
+            self._files = [f for f in self._files if f is not None]
+            # IDs are unchanged, only positions - the manifest lookup stays valid
+            self._file_index = None
+            self._tombstones = 0
+
+    def reindex_files(self):
+        """Rebuild the file index lazily. Call after mutating files directly."""
+        stale_ids = self._file_index
+        self._file_index = None
+        self._tombstones = 0
+        if self._lookup is not None:
+            if stale_ids is None:
+                stale_ids = [fid for fid, owner in self._lookup.items() if owner is self]
+            for fid in stale_ids:
+                if self._lookup.get(fid) is self:
+                    del self._lookup[fid]
+            for fid in self.file_index():
+                self._lookup[fid] = self
+
     def to_dict(self) -> dict:
+        files = self._files
+        if self._tombstones:
+            # Leave the tombstones (and indices) alone - compacting is the caller's call
+            files = [f for f in files if f is not None]
         result = {
             "name": self.name,
             "folder_id": self.folder_id,
             "description": self.description,
             "file_count": self.file_count,
             "total_size": self.total_size,
-            "files": [f.to_dict() if isinstance(f, FileEntry) else f for f in self.files],
+            "files": files,
             "complete": self.complete,
         }
         # Include chart stats if present
@@ -100,6 +218,10 @@ class Manifest:
     - changes_token: Page token for Changes API (incremental updates)
     - folders: List of folder entries with their files
     - shortcut_folders: Dict tracking external shortcuts for incremental updates
+    - known_subfolder_ids: Dict of subfolder ID -> tracked root folder ID,
+      learned by the Changes API parent walk so later runs skip it
+    - parent_cache: Dict of folder ID -> {"name", "parents"} seen by that walk
+    - path_cache: Dict of folder ID -> [root folder ID, path from root]
     """
 
     VERSION = "2.0.0"
@@ -119,6 +241,15 @@ class Manifest:
         # Track external shortcut folders for incremental updates
         # Key: shortcut ID, Value: {target_id, name, parent_folder_id, last_modified}
         self.shortcut_folders: dict[str, dict] = {}
+        # Subfolders known to live under a tracked root (folder_id -> root_id)
+        self.known_subfolder_ids: dict[str, str] = {}
+        # Folder metadata and resolved paths from ChangeTracker, kept across
+        # runs so stable folder chains aren't re-fetched
+        self.parent_cache: dict[str, dict] = {}
+        self.path_cache: dict[str, tuple[str, str]] = {}
+        # Incrementally maintained file_id -> FolderEntry (see build_file_lookup)
+        self._file_lookup: Optional[dict] = None
+        self._lookup_folders: list[FolderEntry] = []
 
     @classmethod
     def load(cls, path: Path) -> "Manifest":
@@ -145,6 +276,11 @@ class Manifest:
                     FolderEntry.from_dict(f) for f in data.get("folders", [])
                 ]
                 manifest.shortcut_folders = data.get("shortcut_folders", {})
+                manifest.known_subfolder_ids = data.get("known_subfolder_ids", {})
+                manifest.parent_cache = data.get("parent_cache", {})
+                manifest.path_cache = {
+                    fid: tuple(entry) for fid, entry in data.get("path_cache", {}).items()
+                }
             except (json.JSONDecodeError, IOError):
                 pass
 
@@ -165,6 +301,12 @@ class Manifest:
         }
         if self.shortcut_folders:
             data["shortcut_folders"] = self.shortcut_folders
+        if self.known_subfolder_ids:
+            data["known_subfolder_ids"] = self.known_subfolder_ids
+        if self.parent_cache:
+            data["parent_cache"] = self.parent_cache
+        if self.path_cache:
+            data["path_cache"] = self.path_cache
 
         with open(self.path, "w") as f:
             json.dump(data, f, indent=2)
@@ -179,6 +321,12 @@ class Manifest:
         }
         if self.shortcut_folders:
             result["shortcut_folders"] = self.shortcut_folders
+        if self.known_subfolder_ids:
+            result["known_subfolder_ids"] = self.known_subfolder_ids
+        if self.parent_cache:
+            result["parent_cache"] = self.parent_cache
+        if self.path_cache:
+            result["path_cache"] = self.path_cache
         return result
 
     def get_folder(self, folder_id: str) -> Optional[FolderEntry]:
@@ -233,24 +381,34 @@ class Manifest:
             Tuple of (folder_index, file_index) or (None, None) if not found
         """
         for fi, folder in enumerate(self.folders):
-            for fli, file_entry in enumerate(folder.files):
-                fid = file_entry.get("id") if isinstance(file_entry, dict) else file_entry.id
-                if fid == file_id:
-                    return fi, fli
+            fli = folder.file_index().get(file_id)
+            if fli is not None:
+                return fi, fli
         return None, None
 
     def build_file_lookup(self) -> dict:
         """
-        Build a lookup table of file_id -> (folder_index, file_index).
+        Get the lookup table of file_id -> FolderEntry containing it.
 
-        Useful for efficient updates during incremental sync.
+        Useful for efficient updates during incremental sync. Positions
+        within the folder come from FolderEntry.file_index(). Built once,
+        then kept current by FolderEntry.add_file/replace_file/remove_file,
+        so repeat calls are O(1).
         """
-        lookup = {}
-        for fi, folder in enumerate(self.folders):
-            for fli, file_entry in enumerate(folder.files):
-                fid = file_entry.get("id") if isinstance(file_entry, dict) else file_entry.id
-                lookup[fid] = (fi, fli)
-        return lookup
+        folders = self.folders
+        if (
+            self._file_lookup is None
+            or len(self._lookup_folders) != len(folders)
+            or any(a is not b for a, b in zip(self._lookup_folders, folders))
+        ):
+            lookup = {}
+            for folder in folders:
+                for fid in folder.file_index():
+                    lookup[fid] = folder
+                folder._lookup = lookup
+            self._file_lookup = lookup
+            self._lookup_folders = list(folders)
+        return self._file_lookup
 
     def print_tree(self, sort_by: str = "charts"):
         """
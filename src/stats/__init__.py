@@ -12,12 +12,16 @@ from typing import Optional
 
 from .local import (
     LocalStatsScanner,
+    PersistentSetlistCache,
     SetlistStats,
     FolderStats,
     get_scanner,
     clear_local_stats_cache,
     scan_folder_charts,
     scan_setlist_charts,
+    is_chart_marker,
+    walk_chart_tree,
+    scan_chart_tree,
 )
 from .overrides import (
     ManifestOverrides,
@@ -31,12 +35,16 @@ from .overrides import (
 __all__ = [
     # Local scanning
     "LocalStatsScanner",
+    "PersistentSetlistCache",
     "SetlistStats",
     "FolderStats",
     "get_scanner",
     "clear_local_stats_cache",
     "scan_folder_charts",
     "scan_setlist_charts",
+    "is_chart_marker",
+    "walk_chart_tree",
+    "scan_chart_tree",
     # Overrides
     "ManifestOverrides",
     "SetlistOverride",
@@ -88,13 +96,12 @@ def get_best_stats(
         overrides = get_overrides()
 
     # 1. Try local scan first (most accurate for downloaded content)
+    # (missing folders are negative-cached by the scanner - no exists() check)
     if local_path is not None:
-        setlist_path = local_path / setlist_name
-        if setlist_path.exists():
-            stats = scanner.get_setlist_stats(setlist_path)
-            if stats.chart_count > 0:
-                # Local scan found charts - use this as the source of truth
-                return stats.chart_count, stats.total_size
+        stats = scanner.get_setlist_stats(local_path / setlist_name)
+        if stats.chart_count > 0:
+            # Local scan found charts - use this as the source of truth
+            return stats.chart_count, stats.total_size
 
     # 2. Try admin override for chart count (size always from Drive API - it's the download size)
     override = overrides.get_setlist_override(folder_name, setlist_name)
@@ -6,17 +6,44 @@ and extracted content on disk, which is more reliable than Drive API scan data
 (especially for nested archives like game rips).
 """
 
+import atexit
 import os
+import sys
+import threading
 import time
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Optional
+from typing import Callable, Optional
 
 from ..core.constants import CHART_MARKERS
+from ..core.files import write_atomic
 from ..core.formatting import normalize_fs_name, sanitize_drive_name
+from ..core.jsonio import json_dumps, json_loads
+from ..core.paths import get_data_dir
 
+# Lowercased once at import - checked against every file name in a scan
+_CHART_MARKERS_LOWER = frozenset(m.lower() for m in CHART_MARKERS)
+# Marker name lengths - most files fail this before any lower()/hash
+_CHART_MARKER_LENGTHS = frozenset(len(m) for m in _CHART_MARKERS_LOWER)
 
-@dataclass
+
+def is_chart_marker(name: str) -> bool:
+    """Check if a file name marks its folder as a chart (song.ini, notes.mid, ...), any case."""
+    return len(name) in _CHART_MARKER_LENGTHS and name.lower() in _CHART_MARKERS_LOWER
+
+
+def _cache_key(path) -> str:
+    """Cache key for a path - interned, since the same paths repeat every refresh."""
+    return sys.intern(os.fspath(path))
+
+
+# Setlists scanned concurrently per folder (I/O-bound - threads overlap syscalls)
+_SCAN_WORKERS = min(8, (os.cpu_count() or 1) * 2)
+
+
+@dataclass(slots=True)
 class SetlistStats:
     """Stats for a single setlist folder."""
     name: str
@@ -26,7 +53,7 @@ class SetlistStats:
     scanned_at: float = 0.0    # Unix timestamp when scanned
 
 
-@dataclass
+@dataclass(slots=True)
 class FolderStats:
     """Stats for an entire drive folder."""
     path: str
@@ -36,6 +63,217 @@ class FolderStats:
     scanned_at: float = 0.0    # Unix timestamp when scanned
 
 
+def _setlist_fingerprint(path_str: str) -> Optional[int]:
+    """
+    Get a change fingerprint for a setlist folder, or None if it's missing.
+
+    Newest mtime of the setlist and every folder below it - adding,
+    removing or renaming anything at any depth bumps its parent folder's
+    mtime. This still lists every folder in the setlist - it only saves
+    stat'ing chart files for their sizes, and a miss lists them all again
+    for the scan. Files rewritten in place aren't seen; the app's own
+    downloads and purges clear the cache explicitly.
+    """
+    try:
+        fingerprint = os.stat(path_str).st_mtime_ns
+    except OSError:
+        return None
+    stack = [path_str]
+    while stack:
+        try:
+            with os.scandir(stack.pop()) as entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        mtime = entry.stat(follow_symlinks=False).st_mtime_ns
+                        if mtime > fingerprint:
+                            fingerprint = mtime
+                        stack.append(entry.path)
+        except OSError:
+            pass
+    return fingerprint
+
+
+def _list_chart_dir(
+    dir_path: str, in_chart: bool
+) -> Optional[tuple[bool, int, list[str]]]:
+    """
+    Read one directory of a chart walk.
+
+    File sizes are only needed if the directory is a chart or sits inside
+    one, so outside charts the files are only stat'ed once a marker turns
+    up - plain non-chart folders cost no stat calls at all.
+
+    Returns (has_marker, direct_file_size, subdir_paths), or None if the
+    directory can't be read (it then contributes nothing).
+    """
+    has_marker = False
+    direct_size = 0
+    files = []
+    add_file = files.append
+    subdirs = []
+    add_subdir = subdirs.append
+    try:
+        with os.scandir(dir_path) as entries:
+            for entry in entries:
+                if entry.is_file(follow_symlinks=False):
+                    # One marker is enough - skip the check for the rest
+                    if not has_marker and is_chart_marker(entry.name):
+                        has_marker = True
+                    add_file(entry)
+                elif entry.is_dir(follow_symlinks=False):
+                    add_subdir(entry.path)
+    except OSError:
+        return None
+
+    if has_marker or in_chart:
+        for entry in files:
+            try:
+                direct_size += entry.stat(follow_symlinks=False).st_size
+            except OSError:
+                pass
+    return has_marker, direct_size, subdirs
+
+
+# list_dir(dir_path, in_chart) -> (has_marker, direct_file_size, subdir_paths),
+# or None if the directory can't be read
+ListChartDirFn = Callable[[str, bool], Optional[tuple[bool, int, list[str]]]]
+
+
+def walk_chart_tree(root: str, list_dir: ListChartDirFn) -> tuple[int, int]:
+    """
+    Count chart folders (including nested charts) under root.
+
+    A folder with a chart marker is a chart: its size is its direct files
+    plus any non-chart subfolders. Chart content never bubbles up into a
+    parent chart, so nested charts aren't double counted. Non-chart
+    content outside any chart isn't counted.
+
+    Each directory is read by list_dir, which is told whether the
+    directory sits inside a chart (callers that only need chart sizes can
+    skip stat'ing files outside charts) and may record whatever else it
+    needs along the way - the chart rules live here, once.
+
+    Iterative post-order walk on an explicit stack - no Python recursion,
+    so deep trees cost no frames and can't hit the recursion limit.
+
+    Returns:
+        Tuple of (chart_count, total_size)
+    """
+    chart_count = 0
+    total_size = 0
+
+    listed = list_dir(root, False)
+    if listed is None:
+        return 0, 0
+
+    # Frames are [subdir iterator, has_marker, size so far, inside a chart]
+    has_marker, direct_size, subdirs = listed
+    stack = [[iter(subdirs), has_marker, direct_size, has_marker]]
+
+    while stack:
+        frame = stack[-1]
+        subdir = next(frame[0], None)
+        if subdir is not None:
+            in_chart = frame[3]
+            listed = list_dir(subdir, in_chart)
+            if listed is not None:
+                has_marker, direct_size, subdirs = listed
+                stack.append([iter(subdirs), has_marker, direct_size, in_chart or has_marker])
+            continue
+
+        # All children done - settle this folder
+        stack.pop()
+        _, has_marker, size, _ = frame
+        if has_marker:
+            chart_count += 1
+            total_size += size
+        elif stack:
+            # Not a chart - its size belongs to the nearest chart above, if any
+            stack[-1][2] += size
+
+    return chart_count, total_size
+
+
+def scan_chart_tree(root: str) -> tuple[int, int]:
+    """
+    Count charts under root and their total size.
+
+    Files are only stat'ed inside charts. Returns (chart_count, total_size).
+    """
+    return walk_chart_tree(root, _list_chart_dir)
+
+
+class PersistentSetlistCache:
+    """
+    Setlist scan results persisted across runs in .dm-sync/local_stats.json.
+
+    Keyed by setlist path; each entry is (chart_count, total_size,
+    fingerprint) and is only valid while the folder's fingerprint matches.
+    New entries are saved once per folder scan (and at exit); each save
+    replaces the file atomically.
+    """
+    CACHE_FILE = "local_stats.json"
+
+    def __init__(self, path: Path):
+        self._path = path
+        self._entries: dict[str, tuple[int, int, int]] = {}
+        self._pending = 0
+        self._lock = threading.Lock()
+        self._load()
+
+    def _load(self):
+        """Load entries from disk."""
+        try:
+            data = json_loads(self._path.read_bytes())
+            self._entries = {
+                path: tuple(entry) for path, entry in data.get("setlists", {}).items()
+            }
+        except (OSError, TypeError, ValueError, AttributeError):
+            self._entries = {}
+
+    def save(self):
+        """Write entries to disk (only if there are unsaved changes)."""
+        with self._lock:
+            if not self._pending:
+                return
+            try:
+                write_atomic(self._path, json_dumps({"setlists": self._entries}))
+                self._pending = 0
+            except OSError:
+                pass
+
+    def get(self, path_str: str, fingerprint: int) -> Optional[tuple[int, int]]:
+        """Get (chart_count, total_size) if cached for this fingerprint."""
+        entry = self._entries.get(path_str)
+        if entry is None or entry[2] != fingerprint:
+            return None
+        return entry[0], entry[1]
+
+    def put(self, path_str: str, chart_count: int, total_size: int, fingerprint: int):
+        """Store a setlist's scan result (written on the next save())."""
+        with self._lock:
+            self._entries[path_str] = (chart_count, total_size, fingerprint)
+            self._pending += 1
+
+    def invalidate(self, prefix: Optional[str] = None):
+        """Drop entries at or under a folder path, or all entries if None."""
+        with self._lock:
+            if prefix is None:
+                removed = len(self._entries)
+                self._entries.clear()
+            else:
+                # Separator-terminated, so "Drive" doesn't also clear "Drive 2"
+                nested = os.path.join(prefix, "")
+                stale = [k for k in self._entries if k == prefix or k.startswith(nested)]
+                for k in stale:
+                    del self._entries[k]
+                removed = len(stale)
+            self._pending += removed
+        # Invalidation follows on-disk changes - persist it right away
+        if removed:
+            self.save()
+
+
 class LocalStatsScanner:
     """
     Scans local filesystem for chart statistics.
@@ -44,19 +282,40 @@ class LocalStatsScanner:
     song.ini, notes.mid, or notes.chart files) rather than relying on Drive API
     scan data which may be incomplete for nested archives.
 
-    Results are cached with a configurable TTL (time-to-live).
+    Results are cached with a configurable TTL (time-to-live), and
+    optionally persisted across runs via a PersistentSetlistCache. Setlists
+    found missing on disk are remembered briefly so repeated lookups (most
+    setlists are never downloaded) skip the stat.
     """
 
-    def __init__(self, cache_ttl: int = 300):
+    NEGATIVE_TTL = 30           # Seconds a missing setlist stays known-missing
+    NEGATIVE_MAX_ENTRIES = 4096  # Oldest known-missing entries evicted first
+
+    def __init__(
+        self,
+        cache_ttl: int = 300,
+        disk_cache: Optional[PersistentSetlistCache] = None,
+    ):
         """
         Initialize scanner with cache settings.
 
         Args:
             cache_ttl: Cache time-to-live in seconds (default: 5 minutes)
+            disk_cache: Optional persistent cache checked before walking a setlist
         """
         self.cache_ttl = cache_ttl
+        self._disk_cache = disk_cache
         self._folder_cache: dict[str, FolderStats] = {}
+        # Folder path -> (source stats, disabled set, filtered view)
+        self._filtered_cache: dict[str, tuple[FolderStats, frozenset[str], FolderStats]] = {}
         self._setlist_cache: dict[str, SetlistStats] = {}
+        # Setlist path -> expiry time for paths known not to exist
+        self._negative_cache: dict[str, float] = {}
+        # Parent folder -> setlist keys in either cache, so a folder can be
+        # cleared without scanning every cached path
+        self._folder_to_setlist_keys: dict[str, set[str]] = defaultdict(set)
+        # Guards cache writes - folder scans run setlists on worker threads
+        self._lock = threading.Lock()
 
     def get_folder_stats(
         self,
@@ -73,27 +332,31 @@ class LocalStatsScanner:
         Returns:
             FolderStats with chart counts and sizes
         """
-        cache_key = str(folder_path)
+        cache_key = _cache_key(folder_path)
         now = time.time()
 
         # Check cache
-        if cache_key in self._folder_cache:
-            cached = self._folder_cache[cache_key]
-            if now - cached.scanned_at < self.cache_ttl:
-                # Apply disabled filter to cached results
-                if disabled_setlists:
-                    sanitized_disabled = {sanitize_drive_name(n) for n in disabled_setlists}
-                    return self._filter_folder_stats(cached, sanitized_disabled)
-                return cached
+        stats = self._folder_cache.get(cache_key)
+        if stats is None or now - stats.scanned_at >= self.cache_ttl:
+            # Scan fresh
+            stats = self._scan_folder(folder_path)
+            with self._lock:
+                self._folder_cache[cache_key] = stats
+
+        if not disabled_setlists:
+            return stats
 
-        # Scan fresh
-        stats = self._scan_folder(folder_path)
-        self._folder_cache[cache_key] = stats
+        # Reuse the last filtered view while it was built from these exact
+        # stats with the same disabled set (UI refreshes repeat both)
+        sanitized_disabled = frozenset(sanitize_drive_name(n) for n in disabled_setlists)
+        view = self._filtered_cache.get(cache_key)
+        if view is not None and view[0] is stats and view[1] == sanitized_disabled:
+            return view[2]
 
-        if disabled_setlists:
-            sanitized_disabled = {sanitize_drive_name(n) for n in disabled_setlists}
-            return self._filter_folder_stats(stats, sanitized_disabled)
-        return stats
+        filtered = self._filter_folder_stats(stats, sanitized_disabled)
+        with self._lock:
+            self._filtered_cache[cache_key] = (stats, sanitized_disabled, filtered)
+        return filtered
 
     def get_setlist_stats(self, setlist_path: Path) -> SetlistStats:
         """
@@ -105,7 +368,7 @@ class LocalStatsScanner:
         Returns:
             SetlistStats with chart count and size
         """
-        cache_key = str(setlist_path)
+        cache_key = _cache_key(setlist_path)
         now = time.time()
 
         # Check cache
@@ -114,11 +377,35 @@ class LocalStatsScanner:
             if now - cached.scanned_at < self.cache_ttl:
                 return cached
 
-        # Scan fresh
+        # Known missing - no need to stat it again yet
+        expiry = self._negative_cache.get(cache_key)
+        if expiry is not None:
+            if now < expiry:
+                return SetlistStats(name=setlist_path.name, scanned_at=now)
+            with self._lock:
+                self._negative_cache.pop(cache_key, None)
+
+        # Scan fresh (missing setlists land in the negative cache instead)
         stats = self._scan_setlist(setlist_path)
-        self._setlist_cache[cache_key] = stats
+        if cache_key not in self._negative_cache:
+            with self._lock:
+                self._setlist_cache[cache_key] = stats
+                self._index_setlist_key(cache_key)
         return stats
 
+    def _index_setlist_key(self, key: str):
+        """Record a setlist cache key under its parent folder. Caller holds the lock."""
+        self._folder_to_setlist_keys[os.path.dirname(key)].add(key)
+
+    def _remember_missing(self, path_str: str):
+        """Record a setlist path as not existing for NEGATIVE_TTL seconds."""
+        with self._lock:
+            self._negative_cache.pop(path_str, None)
+            if len(self._negative_cache) >= self.NEGATIVE_MAX_ENTRIES:
+                del self._negative_cache[next(iter(self._negative_cache))]
+            self._negative_cache[path_str] = time.time() + self.NEGATIVE_TTL
+            self._index_setlist_key(path_str)
+
     def clear_cache(self, folder_path: Optional[Path] = None):
         """
         Clear cache for specific folder or all.
@@ -128,20 +415,37 @@ class LocalStatsScanner:
                         If None, clear all cached data.
         """
         if folder_path is None:
-            self._folder_cache.clear()
-            self._setlist_cache.clear()
+            with self._lock:
+                self._folder_cache.clear()
+                self._filtered_cache.clear()
+                self._setlist_cache.clear()
+                self._negative_cache.clear()
+                self._folder_to_setlist_keys.clear()
+            if self._disk_cache:
+                self._disk_cache.invalidate()
         else:
             path_str = str(folder_path)
-            # Clear folder cache
-            self._folder_cache.pop(path_str, None)
-            # Clear setlist caches under this folder
-            to_remove = [k for k in self._setlist_cache if k.startswith(path_str)]
-            for k in to_remove:
-                self._setlist_cache.pop(k, None)
+            with self._lock:
+                # Clear folder cache
+                self._folder_cache.pop(path_str, None)
+                self._filtered_cache.pop(path_str, None)
+                # Setlists live directly under their drive folder; also catch
+                # folders nested below this one (folder count, not setlist count)
+                nested = path_str.rstrip(os.sep) + os.sep
+                folders = [
+                    f for f in self._folder_to_setlist_keys
+                    if f == path_str or f.startswith(nested)
+                ]
+                for folder in folders:
+                    for key in self._folder_to_setlist_keys.pop(folder):
+                        self._setlist_cache.pop(key, None)
+                        self._negative_cache.pop(key, None)
+            if self._disk_cache:
+                self._disk_cache.invalidate(path_str)
 
     def is_cached(self, folder_path: Path) -> bool:
         """Check if folder stats are cached and fresh."""
-        cache_key = str(folder_path)
+        cache_key = _cache_key(folder_path)
         if cache_key not in self._folder_cache:
             return False
         cached = self._folder_cache[cache_key]
@@ -150,118 +454,125 @@ class LocalStatsScanner:
     def _filter_folder_stats(
         self,
         stats: FolderStats,
-        disabled_setlists: set[str]
+        disabled_setlists: frozenset[str]
     ) -> FolderStats:
-        """Create filtered stats excluding disabled setlists."""
-        filtered = FolderStats(
+        """
+        Create filtered stats excluding disabled setlists.
+
+        Only disabled setlists actually present on disk cost anything; when
+        none are, the cached stats are returned as-is.
+        """
+        disabled = stats.setlists.keys() & disabled_setlists
+        if not disabled:
+            return stats
+
+        setlists = dict(stats.setlists)
+        removed_charts = removed_size = 0
+        for name in disabled:
+            removed = setlists.pop(name)
+            removed_charts += removed.chart_count
+            removed_size += removed.total_size
+        return FolderStats(
             path=stats.path,
-            total_charts=stats.total_charts,
-            total_size=stats.total_size,
-            setlists={k: v for k, v in stats.setlists.items() if k not in disabled_setlists},
+            total_charts=max(0, stats.total_charts - removed_charts),
+            total_size=max(0, stats.total_size - removed_size),
+            setlists=setlists,
             scanned_at=stats.scanned_at
         )
 
-        # Subtract disabled setlists from totals
-        for name in disabled_setlists:
-            if name in stats.setlists:
-                filtered.total_charts -= stats.setlists[name].chart_count
-                filtered.total_size -= stats.setlists[name].total_size
-
-        filtered.total_charts = max(0, filtered.total_charts)
-        filtered.total_size = max(0, filtered.total_size)
-        return filtered
-
     def _scan_folder(self, folder_path: Path) -> FolderStats:
         """Scan a folder and all its setlists."""
+        now = time.time()
         stats = FolderStats(
-            path=str(folder_path),
-            scanned_at=time.time()
+            path=os.fspath(folder_path),
+            scanned_at=now
         )
 
-        if not folder_path.exists():
-            return stats
-
+        # One readdir pass for the setlists, then scan them concurrently -
+        # scandir/stat release the GIL, so threads overlap the I/O waits
         try:
             with os.scandir(folder_path) as entries:
-                for entry in entries:
-                    if entry.is_dir(follow_symlinks=False):
-                        setlist_stats = self._scan_setlist(Path(entry.path))
-                        name = normalize_fs_name(entry.name)
-                        setlist_stats.name = name
-                        stats.setlists[name] = setlist_stats
-                        stats.total_charts += setlist_stats.chart_count
-                        stats.total_size += setlist_stats.total_size
-                        # Cache individual setlist
-                        self._setlist_cache[entry.path] = setlist_stats
+                setlist_dirs = [
+                    (entry.name, sys.intern(entry.path))
+                    for entry in entries
+                    if entry.is_dir(follow_symlinks=False)
+                ]
         except OSError:
-            pass
+            return stats
+
+        if not setlist_dirs:
+            return stats
 
+        workers = min(len(setlist_dirs), _SCAN_WORKERS)
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            results = executor.map(
+                lambda d: self._scan_setlist(d[1], now), setlist_dirs
+            )
+            for (entry_name, entry_path), setlist_stats in zip(setlist_dirs, results):
+                name = normalize_fs_name(entry_name)
+                setlist_stats.name = name
+                stats.setlists[name] = setlist_stats
+                stats.total_charts += setlist_stats.chart_count
+                stats.total_size += setlist_stats.total_size
+                # Cache individual setlist
+                with self._lock:
+                    self._setlist_cache[entry_path] = setlist_stats
+                    self._index_setlist_key(entry_path)
+
+        if self._disk_cache:
+            self._disk_cache.save()
         return stats
 
-    def _scan_setlist(self, setlist_path: Path) -> SetlistStats:
-        """Scan a single setlist folder for charts."""
+    def _scan_setlist(
+        self, setlist_path: str | Path, scanned_at: Optional[float] = None
+    ) -> SetlistStats:
+        """
+        Scan a single setlist folder for charts.
+
+        Folder scans pass scandir's path strings straight through, and
+        their own timestamp as scanned_at so the whole batch shares one
+        time.time() call.
+        """
+        path_str = os.fspath(setlist_path)
         stats = SetlistStats(
-            name=setlist_path.name,
-            scanned_at=time.time()
+            name=os.path.basename(path_str),
+            scanned_at=time.time() if scanned_at is None else scanned_at
         )
 
-        if not setlist_path.exists():
+        fingerprint = _setlist_fingerprint(path_str)
+        if fingerprint is None:
+            self._remember_missing(path_str)
             return stats
 
-        chart_markers_lower = {m.lower() for m in CHART_MARKERS}
-
-        def scan_for_charts(dir_path: Path) -> int:
-            """
-            Recursively scan for chart folders, including nested charts.
-
-            Returns: size of non-chart content for parent to include.
-            """
-            try:
-                has_marker = False
-                subdirs = []
-                direct_size = 0
-
-                with os.scandir(dir_path) as entries:
-                    for entry in entries:
-                        if entry.is_file(follow_symlinks=False):
-                            if entry.name.lower() in chart_markers_lower:
-                                has_marker = True
-                            try:
-                                direct_size += entry.stat(follow_symlinks=False).st_size
-                            except OSError:
-                                pass
-                        elif entry.is_dir(follow_symlinks=False):
-                            subdirs.append(Path(entry.path))
-
-                # Recurse into all subdirs, collecting non-chart content size
-                subdir_non_chart_size = 0
-                for subdir in subdirs:
-                    subdir_non_chart_size += scan_for_charts(subdir)
-
-                if has_marker:
-                    # This folder is a chart - include direct files + non-chart subdirs
-                    stats.chart_count += 1
-                    stats.total_size += direct_size + subdir_non_chart_size
-                    return 0  # Chart content doesn't bubble up to parent
-                else:
-                    # Not a chart - return size for parent to potentially include
-                    return direct_size + subdir_non_chart_size
-            except OSError:
-                return 0
+        if self._disk_cache:
+            cached = self._disk_cache.get(path_str, fingerprint)
+            if cached is not None:
+                stats.chart_count, stats.total_size = cached
+                return stats
 
-        scan_for_charts(setlist_path)
+        stats.chart_count, stats.total_size = scan_chart_tree(path_str)
+        if self._disk_cache:
+            self._disk_cache.put(path_str, stats.chart_count, stats.total_size, fingerprint)
         return stats
 
 
 # Module-level scanner instance for convenience
 _default_scanner: Optional[LocalStatsScanner] = None
+_scanner_lock = threading.Lock()
 
 
 def get_scanner(cache_ttl: int = 300) -> LocalStatsScanner:
     """Get or create the default scanner instance."""
     global _default_scanner
     if _default_scanner is None:
-        _default_scanner = LocalStatsScanner(cache_ttl)
+        # Background and UI threads can race here on startup - a second
+        # scanner would throw away whatever the first one cached
+        with _scanner_lock:
+            if _default_scanner is None:
+                disk_cache = PersistentSetlistCache(get_data_dir() / PersistentSetlistCache.CACHE_FILE)
+                # Single-setlist scans leave entries pending until the next folder scan
+                atexit.register(disk_cache.save)
+                _default_scanner = LocalStatsScanner(cache_ttl, disk_cache)
     return _default_scanner
 
 
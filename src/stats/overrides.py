@@ -6,19 +6,21 @@ Drive API scan is known to be incomplete (e.g., nested archives where the
 scan only counts the archive file, not the charts inside).
 """
 
-import json
+import threading
 from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Optional
 
+from ..core.jsonio import json_loads
 
-@dataclass
+
+@dataclass(slots=True)
 class SetlistOverride:
     """Override values for a setlist (chart count only, size comes from local scan or Drive API)."""
     chart_count: Optional[int] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class FolderOverride:
     """Override values for a folder/drive."""
     folder_id: Optional[str] = None
@@ -70,26 +72,24 @@ class ManifestOverrides:
             return
 
         try:
-            with open(self.path) as f:
-                data = json.load(f)
+            data = json_loads(self.path.read_bytes())
 
-            overrides_data = data.get("overrides", {})
-            for folder_name, folder_data in overrides_data.items():
-                folder_override = FolderOverride(
+            self.overrides.update({
+                folder_name: FolderOverride(
                     folder_id=folder_data.get("_folder_id"),
-                    description=folder_data.get("_description")
+                    description=folder_data.get("_description"),
+                    setlists={
+                        setlist_name: SetlistOverride(
+                            chart_count=setlist_data.get("chart_count")
+                        )
+                        for setlist_name, setlist_data in folder_data.get("setlists", {}).items()
+                    },
                 )
-
-                setlists_data = folder_data.get("setlists", {})
-                for setlist_name, setlist_data in setlists_data.items():
-                    folder_override.setlists[setlist_name] = SetlistOverride(
-                        chart_count=setlist_data.get("chart_count")
-                    )
-
-                self.overrides[folder_name] = folder_override
+                for folder_name, folder_data in data.get("overrides", {}).items()
+            })
 
             self._loaded = True
-        except (json.JSONDecodeError, OSError) as e:
+        except (ValueError, OSError) as e:
             # Log error but don't crash - overrides are optional
             self._loaded = True
 
@@ -151,12 +151,16 @@ class ManifestOverrides:
 
     def has_override(self, folder_name: str, setlist_name: str) -> bool:
         """Check if an override exists for this folder/setlist combination."""
-        override = self.get_setlist_override(folder_name, setlist_name)
-        return override is not None
+        if not self._loaded:
+            self._load_file()
+        # Most folders have no overrides - one dict probe answers those
+        folder = self.overrides.get(folder_name)
+        return folder is not None and setlist_name in folder.setlists
 
 
 # Module-level instance for convenience
 _default_overrides: Optional[ManifestOverrides] = None
+_overrides_lock = threading.Lock()
 
 
 def get_overrides(path: Optional[Path] = None) -> ManifestOverrides:
@@ -171,17 +175,25 @@ def get_overrides(path: Optional[Path] = None) -> ManifestOverrides:
     """
     global _default_overrides
     if _default_overrides is None:
-        if path is None:
-            # Try default locations: bundle dir (PyInstaller) or source dir
-            from ..core.paths import get_bundle_dir
-            default_path = get_bundle_dir() / "manifest_overrides.json"
-            path = default_path if default_path.exists() else None
-        _default_overrides = ManifestOverrides.load(path) if path else ManifestOverrides()
+        with _overrides_lock:
+            if _default_overrides is None:
+                _default_overrides = _load_default(path)
     return _default_overrides
 
 
+def _load_default(path: Optional[Path]) -> ManifestOverrides:
+    """Load overrides from path, or the default location if None."""
+    if path is None:
+        # Try default locations: bundle dir (PyInstaller) or source dir
+        from ..core.paths import get_bundle_dir
+        default_path = get_bundle_dir() / "manifest_overrides.json"
+        path = default_path if default_path.exists() else None
+    return ManifestOverrides.load(path) if path else ManifestOverrides()
+
+
 def reload_overrides(path: Optional[Path] = None):
     """Force reload of overrides from file."""
     global _default_overrides
-    _default_overrides = None
-    get_overrides(path)
+    # Swap in the new instance in one step so readers never see None
+    with _overrides_lock:
+        _default_overrides = _load_default(path)
@@ -7,6 +7,7 @@ Uses three simple sets: all_setlists, enabled_setlists, scanned_setlists.
 
 import threading
 import time
+from collections import deque
 from dataclasses import dataclass, field
 from typing import Callable, TYPE_CHECKING
 
@@ -16,12 +17,14 @@ from ..drive import DriveClient, FolderScanner
 from ..drive.client import DriveClientConfig
 from ..core.formatting import sanitize_drive_name
 from ..core.logging import debug_log
+from .cache import get_persistent_stats_cache, get_scan_cache
+from .status import compute_setlist_stats
 
 if TYPE_CHECKING:
     from ..config import UserSettings
 
 
-@dataclass
+@dataclass(slots=True)
 class ScanStats:
     """Real-time scanning statistics."""
     api_calls: int = 0
@@ -71,6 +74,10 @@ class BackgroundScanner:
 
     FOLDER_MIME = "application/vnd.google-apps.folder"
     SHORTCUT_MIME = "application/vnd.google-apps.shortcut"
+    SCAN_WORKERS = 8  # Setlists scanned concurrently (network-bound; client rate-limits)
+    MAX_SCAN_ATTEMPTS = 3  # Per setlist, including the first scan
+    RETRY_BACKOFF_BASE = 1.0  # Seconds before the first retry; doubles per attempt
+    RETRY_BACKOFF_MAX = 60.0
 
     def __init__(
         self,
@@ -90,8 +97,18 @@ class BackgroundScanner:
         self._download_path = download_path
         self._force_rescan = force_rescan
 
+        # _lock guards the setlist id sets, pending queues and per-drive
+        # counters; _stats_lock serializes ScanStats updates (get_stats()
+        # reads a published snapshot without locking). Neither is reentrant:
+        # helpers that expect _lock held are documented as such, and
+        # _stats_lock is never held while taking _lock.
         self._lock = threading.Lock()
+        self._stats_lock = threading.Lock()
+        self._complete_lock = threading.Lock()  # Serializes per-drive completion work
         self._stop_event = threading.Event()
+        # Set while every discovered setlist is scanned (nothing discovered = done)
+        self._done_event = threading.Event()
+        self._done_event.set()
         self._thread: threading.Thread | None = None
 
         # The three core sets
@@ -99,14 +116,43 @@ class BackgroundScanner:
         self._enabled_setlist_ids: set[str] = set()
         self._scanned_setlist_ids: set[str] = set()
         self._failed_setlist_ids: set[str] = set()  # Setlists that threw during scan
+        # Failed setlists still due a retry: setlist_id -> (attempts, retry_at).
+        # retry_at is inf while a worker has the retry claimed.
+        self._failed_retries: dict[str, tuple[int, float]] = {}
+        self._in_progress_ids: set[str] = set()  # Claimed by a scan worker
+        # Work queues, enabled first. Entries can go stale (scanned, claimed,
+        # toggled) - they're checked and skipped when popped.
+        self._pending_enabled: deque[str] = deque()
+        self._pending_other: deque[str] = deque()
         self._last_check_count: int = 0
 
+        # Immutable copies of the sets above, rebound under the lock after
+        # every change. UI polling reads these without taking the lock.
+        self._enabled_snapshot: frozenset[str] = frozenset()
+        self._scanned_snapshot: frozenset[str] = frozenset()
+        self._done_snapshot: frozenset[str] = frozenset()  # Scanned or failed
+
         # Per-drive tracking
         self._drive_setlist_ids: dict[str, list[str]] = {}  # drive_id -> [setlist_ids]
         self._drive_setlist_names: dict[str, list[str]] = {}  # drive_id -> [names]
+        self._name_index: dict[tuple[str, str], str] = {}  # (drive_id, name) -> setlist_id
+        self._drive_failed_names: dict[str, set[str]] = {}  # drive_id -> names that failed
+        self._setlist_drives: dict[str, list[str]] = {}  # setlist_id -> drive_ids listing it
+        self._drive_total_size: dict[str, int] = {}  # drive_id -> size of accumulated files
+
+        # Per-drive running counts, kept in step with the sets above so the
+        # UI's progress getters are single dict lookups
+        self._drive_enabled_count: dict[str, int] = {}
+        self._drive_scanned_count: dict[str, int] = {}
+        self._drive_done_count: dict[str, int] = {}  # Scanned or failed
 
         # Stats
         self._stats = ScanStats(folders_total=len(folders))
+        # Read-only copy of _stats, rebound by _publish_stats() after each update
+        self._stats_snapshot = ScanStats(folders_total=len(folders))
+        # (current_folder, current_folder_start) - display only, so rebound
+        # as one tuple without the lock instead of living in _stats
+        self._current_folder: tuple[str, float] = ("", 0)
         self._client: DriveClient | None = None
         self._settings_changed = False
 
@@ -119,7 +165,9 @@ class BackgroundScanner:
         if self._client is not None:
             return  # Already discovered
 
-        self._stats.start_time = time.time()
+        with self._stats_lock:
+            self._stats.start_time = time.time()
+            self._publish_stats()
 
         auth_token = self._auth.get_token()
         client_config = DriveClientConfig(api_key=self._api_key)
@@ -133,7 +181,10 @@ class BackgroundScanner:
             self._settings_changed = False
 
         with self._lock:
-            self._stats.folders_total = len(self._all_setlists)
+            folders_total = len(self._all_setlists)
+        with self._stats_lock:
+            self._stats.folders_total = folders_total
+            self._publish_stats()
 
     def start(self):
         """Start background scanning. Call discover() first."""
@@ -153,91 +204,108 @@ class BackgroundScanner:
             self._thread.join(timeout=1.0)
             self._thread = None
 
+    # Read-only getters below are polled by the UI every tick. They read
+    # the published snapshots and take no lock, so they never wait on the
+    # scan worker.
+
     def is_scanning(self, drive_id: str) -> bool:
         """Check if a drive has any unscanned setlists."""
-        with self._lock:
-            setlist_ids = self._drive_setlist_ids.get(drive_id, [])
-            return any(sid not in self._scanned_setlist_ids for sid in setlist_ids)
+        total = len(self._drive_setlist_ids.get(drive_id, ()))
+        return self._drive_scanned_count.get(drive_id, 0) < total
 
     def is_ready_for_sync(self, drive_id: str) -> bool:
         """Check if a drive's ENABLED setlists are scanned (ready to download)."""
-        with self._lock:
-            setlist_ids = self._drive_setlist_ids.get(drive_id, [])
-            if not setlist_ids:
-                return False
-            # Only need enabled setlists to be scanned for sync
-            # Failed setlists count as "done" — they'll be retried later,
-            # but we don't block sync waiting for them
-            done = self._scanned_setlist_ids | self._failed_setlist_ids
-            enabled_ids = [sid for sid in setlist_ids if sid in self._enabled_setlist_ids]
-            if not enabled_ids:
-                return True  # No enabled setlists = ready (nothing to download)
-            return all(sid in done for sid in enabled_ids)
+        setlist_ids = self._drive_setlist_ids.get(drive_id, [])
+        if not setlist_ids:
+            return False
+        # Only need enabled setlists to be scanned for sync
+        # Failed setlists count as "done" — they'll be retried later,
+        # but we don't block sync waiting for them
+        done = self._done_snapshot
+        enabled = self._enabled_snapshot
+        # No enabled setlists = ready (nothing to download)
+        return all(sid in done for sid in setlist_ids if sid in enabled)
 
     def is_scanned(self, drive_id: str) -> bool:
         """Check if ALL of a drive's setlists are scanned (stats complete)."""
-        with self._lock:
-            setlist_ids = self._drive_setlist_ids.get(drive_id, [])
-            if not setlist_ids:
-                return False
-            return all(sid in self._scanned_setlist_ids for sid in setlist_ids)
+        total = len(self._drive_setlist_ids.get(drive_id, ()))
+        return total > 0 and self._drive_scanned_count.get(drive_id, 0) >= total
 
     def is_done(self) -> bool:
         """Check if all setlists across all drives are scanned."""
-        with self._lock:
-            return len(self._scanned_setlist_ids) >= len(self._all_setlists)
+        return self._done_event.is_set()
+
+    def wait_done(self, timeout: float | None = None) -> bool:
+        """Block until all setlists are scanned. Returns False on timeout."""
+        return self._done_event.wait(timeout)
 
     def is_all_enabled_scanned(self) -> bool:
         """Check if all enabled setlists across all drives are scanned."""
-        with self._lock:
-            if not self._enabled_setlist_ids:
-                return True
-            done = self._scanned_setlist_ids | self._failed_setlist_ids
-            return all(sid in done for sid in self._enabled_setlist_ids)
+        return self._enabled_snapshot <= self._done_snapshot
 
     def check_updates(self) -> bool:
         """Check if any setlists were scanned since last check. Used for UI refresh."""
-        with self._lock:
-            current_count = len(self._scanned_setlist_ids)
-            changed = current_count > self._last_check_count
-            self._last_check_count = current_count
-            return changed
+        current_count = len(self._scanned_snapshot)
+        changed = current_count > self._last_check_count
+        self._last_check_count = current_count
+        return changed
 
     def get_stats(self) -> ScanStats:
-        """Get current scanning statistics."""
-        with self._lock:
-            api_calls = self._client.api_calls if self._client else 0
-            return ScanStats(
-                api_calls=api_calls,
-                start_time=self._stats.start_time,
-                end_time=self._stats.end_time,
-                current_folder=self._stats.current_folder,
-                current_folder_start=self._stats.current_folder_start,
-                folders_done=self._stats.folders_done,
-                folders_total=self._stats.folders_total,
-            )
+        """
+        Get current scanning statistics. Treat the result as read-only.
+
+        Lock-free. While nothing has changed since the last published
+        snapshot (e.g. once scanning finishes) that snapshot is returned
+        as-is; otherwise the live API call count and current folder are
+        combined with it.
+        """
+        snapshot = self._stats_snapshot
+        current_folder, current_folder_start = self._current_folder
+        api_calls = self._client.api_calls if self._client else 0
+        if (
+            api_calls == snapshot.api_calls
+            and current_folder_start == snapshot.current_folder_start
+            and current_folder == snapshot.current_folder
+        ):
+            return snapshot
+        return ScanStats(
+            api_calls=api_calls,
+            start_time=snapshot.start_time,
+            end_time=snapshot.end_time,
+            current_folder=current_folder,
+            current_folder_start=current_folder_start,
+            folders_done=snapshot.folders_done,
+            folders_total=snapshot.folders_total,
+        )
+
+    def _publish_stats(self):
+        """Rebind the get_stats() snapshot from _stats. Caller holds _stats_lock."""
+        stats = self._stats
+        current_folder, current_folder_start = self._current_folder
+        self._stats_snapshot = ScanStats(
+            api_calls=self._client.api_calls if self._client else 0,
+            start_time=stats.start_time,
+            end_time=stats.end_time,
+            current_folder=current_folder,
+            current_folder_start=current_folder_start,
+            folders_done=stats.folders_done,
+            folders_total=stats.folders_total,
+        )
 
     def get_discovered_setlist_count(self, drive_id: str) -> tuple[int, int] | None:
         """Get (enabled_count, total_count) for a drive."""
-        with self._lock:
-            setlist_ids = self._drive_setlist_ids.get(drive_id)
-            if setlist_ids is None:
-                return None
-            total = len(setlist_ids)
-            enabled = sum(1 for sid in setlist_ids if sid in self._enabled_setlist_ids)
-            return (enabled, total)
+        setlist_ids = self._drive_setlist_ids.get(drive_id)
+        if setlist_ids is None:
+            return None
+        return (self._drive_enabled_count.get(drive_id, 0), len(setlist_ids))
 
     def get_scan_progress(self, drive_id: str) -> tuple[int, int] | None:
         """Get (scanned_count, total_count) for a drive's setlists.
         Failed setlists count toward progress so the UI doesn't stall."""
-        with self._lock:
-            setlist_ids = self._drive_setlist_ids.get(drive_id)
-            if setlist_ids is None:
-                return None
-            total = len(setlist_ids)
-            done = self._scanned_setlist_ids | self._failed_setlist_ids
-            scanned = sum(1 for sid in setlist_ids if sid in done)
-            return (scanned, total)
+        setlist_ids = self._drive_setlist_ids.get(drive_id)
+        if setlist_ids is None:
+            return None
+        return (self._drive_done_count.get(drive_id, 0), len(setlist_ids))
 
     def get_discovered_setlist_names(self, drive_id: str) -> list[str] | None:
         """Get setlist names for a drive."""
@@ -246,41 +314,31 @@ class BackgroundScanner:
 
     def is_setlist_scanned(self, drive_id: str, setlist_name: str) -> bool:
         """Check if a specific setlist was scanned this session."""
-        with self._lock:
-            for setlist_id, info in self._all_setlists.items():
-                if info.drive_id == drive_id and info.name == setlist_name:
-                    return setlist_id in self._scanned_setlist_ids
-            return False
+        setlist_id = self._name_index.get((drive_id, setlist_name))
+        return setlist_id is not None and setlist_id in self._scanned_snapshot
 
     def get_failed_setlist_names(self, drive_id: str) -> set[str]:
         """Get names of setlists that failed to scan for a given drive."""
         with self._lock:
-            names = set()
-            for setlist_id in self._failed_setlist_ids:
-                info = self._all_setlists.get(setlist_id)
-                if info and info.drive_id == drive_id:
-                    names.add(info.name)
-            return names
+            return set(self._drive_failed_names.get(drive_id, ()))
 
     def get_scanned_enabled_setlists(self) -> list[SetlistInfo]:
         """Get all enabled setlists that have finished scanning."""
-        with self._lock:
-            done = self._scanned_setlist_ids | self._failed_setlist_ids
-            return [
-                self._all_setlists[sid]
-                for sid in self._enabled_setlist_ids
-                if sid in done and sid in self._all_setlists
-            ]
+        done = self._done_snapshot
+        all_setlists = self._all_setlists
+        return [
+            all_setlists[sid]
+            for sid in self._enabled_snapshot
+            if sid in done and sid in all_setlists
+        ]
 
     def get_enabled_setlist_count(self) -> int:
         """Get total number of enabled setlists across all drives."""
-        with self._lock:
-            return len(self._enabled_setlist_ids)
+        return len(self._enabled_snapshot)
 
     def has_scan_failures(self) -> bool:
         """Check if any setlists failed to scan."""
-        with self._lock:
-            return len(self._failed_setlist_ids) > 0
+        return len(self._failed_setlist_ids) > 0
 
     @property
     def all_setlists(self) -> dict[str, "SetlistInfo"]:
@@ -294,24 +352,24 @@ class BackgroundScanner:
         Scanner will prioritize newly enabled setlists on next iteration.
         """
         with self._lock:
-            # Find the setlist_id for this name
-            for setlist_id, info in self._all_setlists.items():
-                if info.drive_id == drive_id and info.name == setlist_name:
-                    if enabled:
-                        self._enabled_setlist_ids.add(setlist_id)
-                    else:
-                        self._enabled_setlist_ids.discard(setlist_id)
-                    break
+            setlist_id = self._name_index.get((drive_id, setlist_name))
+            if setlist_id is None:
+                return
+            self._set_enabled(setlist_id, enabled)
+            self._publish_enabled()
+            if enabled:
+                # Jump the queue - the user is waiting on this one
+                self._pending_enabled.appendleft(setlist_id)
 
     def notify_drive_toggled(self, drive_id: str, enabled: bool):
         """Called when user toggles an entire drive on/off from the home page."""
         with self._lock:
-            for setlist_id, info in self._all_setlists.items():
-                if info.drive_id == drive_id:
-                    if enabled:
-                        self._enabled_setlist_ids.add(setlist_id)
-                    else:
-                        self._enabled_setlist_ids.discard(setlist_id)
+            setlist_ids = self._drive_setlist_ids.get(drive_id, ())
+            for setlist_id in setlist_ids:
+                self._set_enabled(setlist_id, enabled)
+            self._publish_enabled()
+            if enabled:
+                self._pending_enabled.extendleft(reversed(setlist_ids))
 
     def add_folder(self, folder: dict):
         """Add a new folder to scan (for custom folders added at runtime)."""
@@ -328,27 +386,91 @@ class BackgroundScanner:
             self._thread = threading.Thread(target=self._scan_worker, daemon=True)
             self._thread.start()
 
+    def _set_failed(self, setlist_id: str, failed: bool):
+        """Mark or unmark a setlist as failed, keeping per-drive names in step. Caller holds the lock."""
+        info = self._all_setlists.get(setlist_id)
+        was_done = setlist_id in self._scanned_setlist_ids or setlist_id in self._failed_setlist_ids
+        if failed:
+            self._failed_setlist_ids.add(setlist_id)
+            if info:
+                self._drive_failed_names.setdefault(info.drive_id, set()).add(info.name)
+        else:
+            self._failed_setlist_ids.discard(setlist_id)
+            if info:
+                self._drive_failed_names.get(info.drive_id, set()).discard(info.name)
+        is_done = setlist_id in self._scanned_setlist_ids or setlist_id in self._failed_setlist_ids
+        if is_done != was_done:
+            self._bump(self._drive_done_count, setlist_id, 1 if is_done else -1)
+
+    def _set_scanned(self, setlist_id: str):
+        """Mark a setlist as scanned, updating per-drive counts. Caller holds the lock."""
+        if setlist_id in self._scanned_setlist_ids:
+            return
+        self._scanned_setlist_ids.add(setlist_id)
+        self._bump(self._drive_scanned_count, setlist_id, 1)
+        if setlist_id not in self._failed_setlist_ids:
+            self._bump(self._drive_done_count, setlist_id, 1)
+        if len(self._scanned_setlist_ids) >= len(self._all_setlists):
+            self._done_event.set()
+
+    def _set_enabled(self, setlist_id: str, enabled: bool):
+        """Enable or disable a setlist, updating per-drive counts. Caller holds the lock."""
+        if enabled == (setlist_id in self._enabled_setlist_ids):
+            return
+        if enabled:
+            self._enabled_setlist_ids.add(setlist_id)
+        else:
+            self._enabled_setlist_ids.discard(setlist_id)
+        self._bump(self._drive_enabled_count, setlist_id, 1 if enabled else -1)
+
+    def _bump(self, counts: dict[str, int], setlist_id: str, delta: int):
+        """Adjust a per-drive count for every drive listing this setlist."""
+        for drive_id in self._setlist_drives.get(setlist_id, ()):
+            counts[drive_id] = counts.get(drive_id, 0) + delta
+
+    def _publish_enabled(self):
+        """Rebind the enabled snapshot. Caller holds the lock."""
+        self._enabled_snapshot = frozenset(self._enabled_setlist_ids)
+
+    def _publish_progress(self):
+        """Rebind the scanned/done snapshots. Caller holds the lock."""
+        self._scanned_snapshot = frozenset(self._scanned_setlist_ids)
+        self._done_snapshot = self._scanned_snapshot | self._failed_setlist_ids
+
     # =========================================================================
     # Discovery
     # =========================================================================
 
     def _discover_all_setlists(self):
         """Discover all setlists from all folders."""
+        # List every drive's top level in batched calls (up to 100 drives
+        # per HTTP request) rather than one request per drive
+        listings = {}
+        try:
+            listings = self._client.list_folders_batch([f["folder_id"] for f in self._folders])
+        except Exception:
+            pass  # Each drive is listed (and errors handled) individually below
+
         for folder in self._folders:
             if self._stop_event.is_set():
                 break
-            self._discover_folder_setlists(folder)
+            self._discover_folder_setlists(folder, listings.get(folder["folder_id"]))
 
-    def _discover_folder_setlists(self, folder: dict):
-        """Discover setlists within a single folder/drive."""
+    def _discover_folder_setlists(self, folder: dict, items: list[dict] | None = None):
+        """
+        Discover setlists within a single folder/drive.
+
+        Args:
+            folder: Drive folder dict
+            items: The drive's top-level listing if already fetched
+        """
         drive_id = folder["folder_id"]
         drive_name = folder.get("name", "")
-        with self._lock:
-            self._stats.current_folder = f"{drive_name} (discovering)"
-            self._stats.current_folder_start = time.time()
+        self._current_folder = (f"{drive_name} (discovering)", time.time())
 
         try:
-            items = self._client.list_folder(drive_id)
+            if items is None:
+                items = self._client.list_folder(drive_id)
         except Exception:
             # On error, treat whole drive as one unit
             self._register_setlist(
@@ -423,19 +545,36 @@ class BackgroundScanner:
 
         with self._lock:
             self._all_setlists[setlist_id] = info
+            if setlist_id not in self._scanned_setlist_ids:
+                self._done_event.clear()
 
-            # Track per-drive
+            # Track per-drive. Scans only ever append to the drive's files
+            # list, so it's created here and its size total seeded once.
             if drive_id not in self._drive_setlist_ids:
                 self._drive_setlist_ids[drive_id] = []
                 self._drive_setlist_names[drive_id] = []
                 if drive.get("files") is None:
                     drive["files"] = []
+                self._drive_total_size[drive_id] = sum(f.get("size", 0) for f in drive["files"])
             self._drive_setlist_ids[drive_id].append(setlist_id)
             self._drive_setlist_names[drive_id].append(name)
+            # First registration wins, matching a first-match search
+            self._name_index.setdefault((drive_id, name), setlist_id)
+            self._setlist_drives.setdefault(setlist_id, []).append(drive_id)
+
+            # Count state the setlist already has (same ID listed elsewhere)
+            if setlist_id in self._enabled_setlist_ids:
+                self._drive_enabled_count[drive_id] = self._drive_enabled_count.get(drive_id, 0) + 1
+            if setlist_id in self._scanned_setlist_ids:
+                self._drive_scanned_count[drive_id] = self._drive_scanned_count.get(drive_id, 0) + 1
+            if setlist_id in self._scanned_setlist_ids or setlist_id in self._failed_setlist_ids:
+                self._drive_done_count[drive_id] = self._drive_done_count.get(drive_id, 0) + 1
 
             # Check if enabled
             if self._is_setlist_enabled(drive_id, name):
-                self._enabled_setlist_ids.add(setlist_id)
+                self._set_enabled(setlist_id, True)
+                self._publish_enabled()
+            self._queue_setlist(setlist_id)
 
     def _is_setlist_enabled(self, drive_id: str, setlist_name: str) -> bool:
         """Check if a setlist is enabled (drive enabled AND setlist enabled)."""
@@ -451,70 +590,121 @@ class BackgroundScanner:
 
     def _scan_worker(self):
         """Background thread: scan setlists, prioritizing enabled ones."""
-        scanner = FolderScanner(self._client)
+        # Each setlist scan is a chain of Drive round trips - run several at
+        # once. Workers pull the next setlist themselves, so priority order
+        # (and toggles made mid-scan) still apply.
+        # Daemon threads, like this one - exiting without stop() mustn't wait
+        # for in-flight Drive scans to finish.
+        workers = [
+            threading.Thread(target=self._scan_loop, name=f"setlist-scan-{i}", daemon=True)
+            for i in range(self.SCAN_WORKERS)
+        ]
+        for worker in workers:
+            worker.start()
+        for worker in workers:
+            worker.join()
+
+        # Flush stats for drives whose completion save was debounced
+        self._save_persistent_cache(force=True)
 
+        # Done
+        self._current_folder = ("", 0)
+        with self._stats_lock:
+            self._stats.end_time = time.time()
+            self._publish_stats()
+
+    def _scan_loop(self):
+        """Scan worker: claim and scan setlists until none are left."""
+        scanner = FolderScanner(self._client, stop_event=self._stop_event)
         while not self._stop_event.is_set():
             setlist = self._get_next_setlist_to_scan()
             if setlist is None:
-                break  # All done
-
-            self._scan_setlist(setlist, scanner)
+                delay = self._next_retry_delay()
+                if delay is None:
+                    break  # All done or claimed
+                self._stop_event.wait(delay)  # Back off until a failed setlist is due
+                continue
 
-        # Retry failed setlists once
-        if not self._stop_event.is_set():
-            with self._lock:
-                retry_ids = list(self._failed_setlist_ids)
-            for setlist_id in retry_ids:
-                if self._stop_event.is_set():
-                    break
+            try:
+                self._scan_setlist(setlist, scanner)
+            finally:
                 with self._lock:
-                    setlist = self._all_setlists.get(setlist_id)
-                    # Remove from failed so _scan_setlist can re-add on failure
-                    self._failed_setlist_ids.discard(setlist_id)
-                if setlist:
-                    debug_log(f"SCAN_RETRY | setlist={setlist.name} | id={setlist_id}")
-                    self._scan_setlist(setlist, scanner)
-                    # If still not scanned after retry, it re-failed — mark as scanned
-                    # so is_done()/is_ready_for_sync() don't hang
-                    with self._lock:
-                        if setlist_id in self._failed_setlist_ids:
-                            self._scanned_setlist_ids.add(setlist_id)
-                            self._stats.folders_done += 1
-
-        # Done
-        with self._lock:
-            self._stats.current_folder = ""
-            self._stats.end_time = time.time()
+                    setlist_id = setlist.setlist_id
+                    self._in_progress_ids.discard(setlist_id)
+                    # Interrupted scans (stop requested) go back on the queue
+                    if setlist_id not in self._scanned_setlist_ids and setlist_id not in self._failed_setlist_ids:
+                        self._queue_setlist(setlist_id, front=True)
+
+    def _queue_setlist(self, setlist_id: str, front: bool = False):
+        """Queue a setlist by its enabled state. Caller holds the lock."""
+        queue = self._pending_enabled if setlist_id in self._enabled_setlist_ids else self._pending_other
+        if front:
+            queue.appendleft(setlist_id)
+        else:
+            queue.append(setlist_id)
 
     def _get_next_setlist_to_scan(self) -> SetlistInfo | None:
-        """Get next setlist to scan. Prioritizes enabled ones. Skips failed."""
+        """
+        Claim next setlist to scan. Prioritizes enabled ones.
+
+        Skips failed setlists and ones another worker already claimed.
+        """
         with self._lock:
-            done = self._scanned_setlist_ids | self._failed_setlist_ids
+            scanned = self._scanned_setlist_ids
+            failed = self._failed_setlist_ids
+            in_progress = self._in_progress_ids
 
             # Priority: enabled but not done
-            for setlist_id in self._enabled_setlist_ids:
-                if setlist_id not in done:
-                    return self._all_setlists[setlist_id]
+            pending = self._pending_enabled
+            while pending:
+                setlist_id = pending.popleft()
+                if setlist_id in scanned or setlist_id in failed or setlist_id in in_progress:
+                    continue
+                if setlist_id not in self._enabled_setlist_ids:
+                    # Disabled since it was queued - scan it with the rest
+                    self._pending_other.append(setlist_id)
+                    continue
+                in_progress.add(setlist_id)
+                return self._all_setlists[setlist_id]
 
             # Then: any not done
-            for setlist_id, info in self._all_setlists.items():
-                if setlist_id not in done:
-                    return info
-
-            return None  # All scanned or failed
+            pending = self._pending_other
+            while pending:
+                setlist_id = pending.popleft()
+                if setlist_id in scanned or setlist_id in failed or setlist_id in in_progress:
+                    continue
+                in_progress.add(setlist_id)
+                return self._all_setlists[setlist_id]
+
+            # Last: failed setlists whose backoff has elapsed
+            now = time.time()
+            for setlist_id, (attempts, retry_at) in self._failed_retries.items():
+                if retry_at <= now and setlist_id not in in_progress:
+                    self._failed_retries[setlist_id] = (attempts, float("inf"))
+                    # Unmark so _scan_setlist can re-add on failure
+                    self._set_failed(setlist_id, False)
+                    self._publish_progress()
+                    in_progress.add(setlist_id)
+                    setlist = self._all_setlists[setlist_id]
+                    debug_log(f"SCAN_RETRY | setlist={setlist.name} | id={setlist_id} | attempt={attempts + 1}")
+                    return setlist
+
+            return None  # All scanned, in progress or waiting to retry
+
+    def _next_retry_delay(self) -> float | None:
+        """Seconds until the next failed setlist is due a retry, or None if none are waiting."""
+        with self._lock:
+            retry_at = min((t for _, t in self._failed_retries.values()), default=float("inf"))
+        if retry_at == float("inf"):
+            return None
+        return max(0.0, retry_at - time.time())
 
     def _scan_setlist(self, setlist: SetlistInfo, scanner: FolderScanner):
         """Scan a single setlist and accumulate files into its drive."""
-        from .status import compute_setlist_stats
-        from .cache import get_persistent_stats_cache, get_scan_cache
-
         drive = setlist.drive
         display_name = f"{setlist.drive_name}/{setlist.name}" if setlist.name != setlist.drive_name else setlist.drive_name
 
-        scan_start = time.time()
-        with self._lock:
-            self._stats.current_folder = display_name
-            self._stats.current_folder_start = scan_start
+        self._current_folder = (display_name, time.time())
 
         try:
             base_path = sanitize_drive_name(setlist.name) if setlist.name != setlist.drive_name else ""
@@ -532,41 +722,62 @@ class BackgroundScanner:
                 if result.cancelled or self._stop_event.is_set():
                     return
 
-                new_files = [
-                    {
-                        "id": f["id"],
-                        "path": f["path"],
-                        "name": f["name"],
-                        "size": f.get("size", 0),
-                        "md5": f.get("md5", ""),
-                        "modified": f.get("modified", ""),
-                    }
-                    for f in result.files
-                ]
+                # FolderScanner already emits exactly the file dict shape we store
+                new_files = result.files
                 scan_cache.set(setlist.setlist_id, new_files)
 
+            added_size = sum(f.get("size", 0) for f in new_files)
             with self._lock:
-                if drive.get("files") is None:
-                    drive["files"] = []
-                drive["files"].extend(new_files)
-                drive["file_count"] = len(drive["files"])
-                drive["total_size"] = sum(f.get("size", 0) for f in drive["files"])
+                # drive["files"] is always a list once registered (see _register_setlist).
+                # Running total - summing the whole drive per setlist is quadratic
+                files = drive["files"]
+                files.extend(new_files)
+                total_size = self._drive_total_size[setlist.drive_id] + added_size
+                self._drive_total_size[setlist.drive_id] = total_size
+                drive["file_count"] = len(files)
+                drive["total_size"] = total_size
 
         except Exception:
             # Track failure — do NOT mark as scanned so purge can protect these files
+            setlist_id = setlist.setlist_id
             with self._lock:
-                self._failed_setlist_ids.add(setlist.setlist_id)
-                self._stats.current_folder_start = 0
-            debug_log(f"SCAN_FAIL | setlist={display_name} | id={setlist.setlist_id}")
+                self._set_failed(setlist_id, True)
+                attempts = self._failed_retries.get(setlist_id, (0, 0.0))[0] + 1
+                exhausted = attempts >= self.MAX_SCAN_ATTEMPTS
+                if exhausted:
+                    # Out of retries - mark as scanned (still failed) so
+                    # is_done()/is_ready_for_sync() don't hang
+                    self._failed_retries.pop(setlist_id, None)
+                    self._set_scanned(setlist_id)
+                else:
+                    delay = min(self.RETRY_BACKOFF_MAX, self.RETRY_BACKOFF_BASE * 2 ** (attempts - 1))
+                    self._failed_retries[setlist_id] = (attempts, time.time() + delay)
+                self._publish_progress()
+            if exhausted:
+                with self._stats_lock:
+                    self._stats.folders_done += 1
+                    self._publish_stats()
+            self._current_folder = (self._current_folder[0], 0)
+            debug_log(f"SCAN_FAIL | setlist={display_name} | id={setlist_id} | attempt={attempts}")
             return
 
-        # Mark as scanned
+        # Mark as scanned. Whoever marks a drive's last setlist sees it
+        # complete - decided under the lock so parallel workers can't both
+        # fire the completion callback.
         with self._lock:
-            self._scanned_setlist_ids.add(setlist.setlist_id)
+            self._failed_retries.pop(setlist.setlist_id, None)
+            self._set_scanned(setlist.setlist_id)
+            self._publish_progress()
+            drive_complete = self._drive_scanned_count.get(setlist.drive_id, 0) >= len(
+                self._drive_setlist_ids.get(setlist.drive_id, ())
+            )
+        with self._stats_lock:
             self._stats.folders_done += 1
-            self._stats.current_folder_start = 0
+            self._publish_stats()
+        self._current_folder = (self._current_folder[0], 0)
 
-        # Compute and cache stats for this setlist
+        # Compute and cache stats for this setlist. Pass its own files -
+        # filtering the drive's growing file list per setlist is quadratic
         if self._download_path:
             try:
                 stats = compute_setlist_stats(
@@ -574,6 +785,7 @@ class BackgroundScanner:
                     setlist_name=setlist.name,
                     base_path=self._download_path,
                     user_settings=self._user_settings,
+                    setlist_files=new_files,
                 )
                 persistent_cache = get_persistent_stats_cache()
                 persistent_cache.set_setlist(setlist.drive_id, setlist.name, stats)
@@ -581,20 +793,41 @@ class BackgroundScanner:
                 debug_log(f"STATS_FAIL | {display_name} | {e}")
 
         # Check if drive is now fully scanned
-        if self.is_scanned(setlist.drive_id):
+        if drive_complete:
+            self._complete_drive(drive)
+
+    def _complete_drive(self, drive: dict):
+        """
+        Finish a fully scanned drive: save caches and notify the caller.
+
+        Serialized across scan workers - the persistent cache save and the
+        on_folder_complete callback both write files and expect one caller
+        at a time.
+        """
+        with self._complete_lock:
             drive["scan_duration"] = time.time() - self._stats.start_time
             drive["scan_api_calls"] = self._client.api_calls
 
             # Save persistent cache after drive completes
-            if self._download_path:
-                try:
-                    persistent_cache = get_persistent_stats_cache()
-                    persistent_cache.save()
-                except Exception:
-                    pass
+            self._save_persistent_cache()
 
             if self._on_folder_complete:
                 try:
                     self._on_folder_complete(drive)
                 except Exception:
                     pass
+
+    def _save_persistent_cache(self, force: bool = False):
+        """
+        Save the persistent stats cache.
+
+        Unforced saves are rate-limited by the cache itself, so drives
+        completing back to back share a rewrite; force=True flushes at
+        the end of the scan.
+        """
+        if not self._download_path:
+            return
+        try:
+            get_persistent_stats_cache().save(force=force)
+        except Exception:
+            pass
@@ -5,24 +5,32 @@ Provides cached scanning of local files and chart folders.
 Cache is invalidated after downloads/purges.
 """
 
-import hashlib
-import json
+import atexit
+import operator
 import os
 import shutil
-from dataclasses import dataclass
+import sys
+import threading
+import time
+import zlib
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import MISSING, dataclass, fields
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import TYPE_CHECKING
 
-from ..stats import clear_local_stats_cache
+from ..stats import clear_local_stats_cache, is_chart_marker, scan_chart_tree, walk_chart_tree
+from ..core.files import write_atomic
 from ..core.formatting import normalize_fs_name, sanitize_drive_name
+from ..core.jsonio import json_dumps, json_loads
 from ..core.paths import get_data_dir
 
 if TYPE_CHECKING:
     from .status import SyncStatus
 
 
-@dataclass
+@dataclass(slots=True)
 class FolderStats:
     """Cached stats for a single folder."""
     folder_id: str
@@ -59,7 +67,7 @@ class FolderStatsCache:
         self._cache[folder_id] = stats
 
 
-@dataclass
+@dataclass(slots=True)
 class CachedFolderStats:
     """Persistent stats for a folder, saved to disk."""
     total_charts: int
@@ -74,7 +82,7 @@ class CachedFolderStats:
     settings_hash: str  # Hash of enabled setlists to detect settings changes
 
 
-@dataclass
+@dataclass(slots=True)
 class CachedSetlistStats:
     """Persistent stats for a single setlist within a folder."""
     # Manifest data (what should exist)
@@ -96,7 +104,18 @@ class CachedSetlistStats:
     purgeable_charts: int = 0
 
 
-@dataclass
+# On-disk column order for setlist stats rows (saved in the file as "_fields"),
+# derived from the dataclass so new fields can't drift out of the file format
+_SETLIST_FIELDS = [f.name for f in fields(CachedSetlistStats)]
+# Fallback for columns missing from an older file (required fields -> 0)
+_SETLIST_DEFAULTS = {
+    f.name: 0 if f.default is MISSING else f.default for f in fields(CachedSetlistStats)
+}
+# stats -> row tuple in _SETLIST_FIELDS order (attrgetter runs in C)
+_pack_setlist = operator.attrgetter(*_SETLIST_FIELDS)
+
+
+@dataclass(slots=True)
 class AggregatedFolderStats:
     """Aggregated stats for folder display (computed from setlist stats)."""
     total_charts: int = 0
@@ -117,74 +136,105 @@ class PersistentStatsCache:
 
     Stores per-setlist stats. Folder stats are computed on-the-fly via aggregation.
     Old folder-level cache entries are ignored on load (migration).
+
+    Each setlist is one positional row of ints, with the column names
+    stored once in "_fields" - field names aren't repeated per setlist.
+    Files from before rows (one dict per setlist) still load.
+
+    The file is read on first use, not at construction, so processes that
+    never touch setlist stats don't pay for parsing it.
     """
     CACHE_FILE = "folder_stats.json"
+    SAVE_INTERVAL = 2.0  # Min seconds between unforced saves
 
     def __init__(self):
         self._cache: dict[str, CachedFolderStats] = {}  # Legacy: kept for backwards compat with get()
         self._setlist_cache: dict[str, dict[str, CachedSetlistStats]] = {}  # folder_id -> setlist_name -> stats
         self._dirty = False
+        self._last_save = 0.0  # time.monotonic() of the last write
         self._path = get_data_dir() / self.CACHE_FILE
-        self._load()
+        self._loaded = False
+        self._load_lock = threading.Lock()
+        # save() runs from the UI thread and scan workers - one writer at a time
+        self._save_lock = threading.Lock()
+
+    def _ensure_loaded(self):
+        """Load the cache file on first use (double-checked - scan workers can race here)."""
+        if self._loaded:
+            return
+        with self._load_lock:
+            if not self._loaded:
+                self._load()
+                self._loaded = True
 
     def _load(self):
         """Load cache from disk. Only loads setlist stats (folder stats are computed via aggregation)."""
-        if not self._path.exists():
+        try:
+            data = json_loads(self._path.read_bytes())
+        except FileNotFoundError:
+            return
+        except (ValueError, OSError):
+            self._setlist_cache = {}
             return
         try:
-            with open(self._path) as f:
-                data = json.load(f)
-
             # Only load setlist stats - folder stats are computed via aggregation now
             # Old folder-level entries are ignored (migration)
             setlists_data = data.get("_setlists", {})
+            columns = data.get("_fields")
+            # Keys are interned - the same ids and names key the scanner's and
+            # settings' dicts, so lookups can hit the identity fast path
+            intern = sys.intern
             for folder_id, setlists in setlists_data.items():
-                self._setlist_cache[folder_id] = {}
+                loaded = self._setlist_cache[intern(folder_id)] = {}
                 for setlist_name, entry in setlists.items():
-                    self._setlist_cache[folder_id][setlist_name] = CachedSetlistStats(
-                        total_charts=entry.get("total_charts", 0),
-                        total_size=entry.get("total_size", 0),
-                        synced_charts=entry.get("synced_charts", 0),
-                        synced_size=entry.get("synced_size", 0),
-                        disk_files=entry.get("disk_files", 0),
-                        disk_size=entry.get("disk_size", 0),
-                        disk_charts=entry.get("disk_charts", 0),
-                        purgeable_files=entry.get("purgeable_files", 0),
-                        purgeable_size=entry.get("purgeable_size", 0),
-                        purgeable_charts=entry.get("purgeable_charts", 0),
+                    setlist_name = intern(setlist_name)
+                    if columns == _SETLIST_FIELDS:
+                        loaded[setlist_name] = CachedSetlistStats(*entry)
+                        continue
+                    if columns is not None:
+                        # Written with different columns - map by name
+                        entry = dict(zip(columns, entry))
+                    # (else pre-row format: one dict per setlist)
+                    loaded[setlist_name] = CachedSetlistStats(
+                        **{name: entry.get(name, default) for name, default in _SETLIST_DEFAULTS.items()}
                     )
-        except (json.JSONDecodeError, OSError):
+        except (AttributeError, TypeError):
+            # Parsed, but not the shape we wrote
             self._setlist_cache = {}
 
-    def save(self):
-        """Save cache to disk (only if dirty). Only saves setlist stats (not folder stats)."""
-        if not self._dirty:
-            return
+    def save(self, force: bool = False):
+        """
+        Save cache to disk (only if dirty). Only saves setlist stats (not folder stats).
 
-        # Save setlist stats only (folder stats are computed on-the-fly via aggregation)
-        data = {"_setlists": {}}
-        for folder_id, setlists in self._setlist_cache.items():
-            data["_setlists"][folder_id] = {}
-            for setlist_name, stats in setlists.items():
-                data["_setlists"][folder_id][setlist_name] = {
-                    "total_charts": stats.total_charts,
-                    "total_size": stats.total_size,
-                    "synced_charts": stats.synced_charts,
-                    "synced_size": stats.synced_size,
-                    "disk_files": stats.disk_files,
-                    "disk_size": stats.disk_size,
-                    "disk_charts": stats.disk_charts,
-                    "purgeable_files": stats.purgeable_files,
-                    "purgeable_size": stats.purgeable_size,
-                    "purgeable_charts": stats.purgeable_charts,
-                }
+        Unforced saves run at most once per SAVE_INTERVAL, so bursts of
+        updates coalesce into one rewrite; anything still dirty is written
+        by the forced save at exit.
 
-        try:
-            with open(self._path, "w") as f:
-                json.dump(data, f)
+        Saves are serialized, so overlapping callers can't interleave
+        writes or land an older snapshot over a newer one.
+        """
+        with self._save_lock:
+            if not self._dirty:
+                return
+            now = time.monotonic()
+            if not force and now - self._last_save < self.SAVE_INTERVAL:
+                return
+            self._last_save = now
+
+            # Save setlist stats only (folder stats are computed on-the-fly via aggregation).
+            # Iterate over item snapshots - scan workers may add setlists meanwhile.
             self._dirty = False
-        except OSError:
-            pass
+            data = {"_fields": _SETLIST_FIELDS, "_setlists": {}}
+            for folder_id, setlists in list(self._setlist_cache.items()):
+                data["_setlists"][folder_id] = {
+                    setlist_name: _pack_setlist(stats)
+                    for setlist_name, stats in list(setlists.items())
+                }
+
+            try:
+                write_atomic(self._path, json_dumps(data))
+            except OSError:
+                self._dirty = True
 
     def get(self, folder_id: str, settings_hash: str) -> CachedFolderStats | None:
         """
@@ -204,22 +254,29 @@ class PersistentStatsCache:
 
     def get_setlist(self, folder_id: str, setlist_name: str) -> CachedSetlistStats | None:
         """Get cached stats for a setlist."""
+        self._ensure_loaded()
         folder_setlists = self._setlist_cache.get(folder_id, {})
         return folder_setlists.get(setlist_name)
 
     def set_setlist(self, folder_id: str, setlist_name: str, stats: CachedSetlistStats):
-        """Store stats for a setlist."""
-        if folder_id not in self._setlist_cache:
-            self._setlist_cache[folder_id] = {}
-        self._setlist_cache[folder_id][setlist_name] = stats
+        """Store stats for a setlist. Unchanged stats don't mark the cache dirty."""
+        self._ensure_loaded()
+        folder_setlists = self._setlist_cache.get(folder_id)
+        if folder_setlists is None:
+            folder_setlists = self._setlist_cache[sys.intern(folder_id)] = {}
+        if folder_setlists.get(setlist_name) == stats:
+            return  # Rescans usually reproduce the cached stats - skip the file rewrite
+        folder_setlists[sys.intern(setlist_name)] = stats
         self._dirty = True
 
     def get_all_setlists(self, folder_id: str) -> dict[str, CachedSetlistStats]:
         """Get all cached setlist stats for a folder."""
+        self._ensure_loaded()
         return self._setlist_cache.get(folder_id, {})
 
     def invalidate(self, folder_id: str):
         """Remove cached stats for a folder (including setlists)."""
+        self._ensure_loaded()
         if folder_id in self._cache:
             del self._cache[folder_id]
             self._dirty = True
@@ -229,6 +286,7 @@ class PersistentStatsCache:
 
     def invalidate_setlist(self, folder_id: str, setlist_name: str):
         """Remove cached stats for a single setlist."""
+        self._ensure_loaded()
         if folder_id in self._setlist_cache:
             if setlist_name in self._setlist_cache[folder_id]:
                 del self._setlist_cache[folder_id][setlist_name]
@@ -236,6 +294,7 @@ class PersistentStatsCache:
 
     def invalidate_all(self):
         """Clear all cached stats."""
+        self._ensure_loaded()
         if self._cache or self._setlist_cache:
             self._cache.clear()
             self._setlist_cache.clear()
@@ -243,6 +302,7 @@ class PersistentStatsCache:
 
     def has_setlist_stats(self, folder_id: str) -> bool:
         """Check if any setlist stats are cached for a folder."""
+        self._ensure_loaded()
         return bool(self._setlist_cache.get(folder_id))
 
     @staticmethod
@@ -257,7 +317,9 @@ class PersistentStatsCache:
         enabled = user_settings.is_drive_enabled(folder_id)
         disabled_setlists = sorted(user_settings.get_disabled_subfolders(folder_id))
         key = f"{enabled}:{','.join(disabled_setlists)}"
-        return hashlib.md5(key.encode()).hexdigest()[:8]
+        # Change fingerprint, not security - CRC32 is stable across runs
+        # (unlike hash()) and needs no digest object
+        return f"{zlib.crc32(key.encode()):08x}"
 
 
 def aggregate_folder_stats(
@@ -278,36 +340,45 @@ def aggregate_folder_stats(
         user_settings: UserSettings for checking enabled states
         persistent_cache: PersistentStatsCache with setlist stats
     """
-    result = AggregatedFolderStats(total_setlists=len(setlist_names))
     drive_enabled = user_settings.is_drive_enabled(folder_id) if user_settings else True
+    # One dict and one disabled-set lookup for the whole folder, not per setlist
+    cached_setlists = persistent_cache.get_all_setlists(folder_id)
+    disabled = user_settings.get_disabled_subfolders(folder_id) if user_settings else ()
+
+    total_charts = synced_charts = total_size = synced_size = disk_size = 0
+    purgeable_files = purgeable_size = purgeable_charts = enabled_setlists = 0
 
     for setlist_name in setlist_names:
-        cached = persistent_cache.get_setlist(folder_id, setlist_name)
+        cached = cached_setlists.get(setlist_name)
         if not cached:
             continue
 
-        setlist_enabled = user_settings.is_subfolder_enabled(folder_id, setlist_name) if user_settings else True
-
-        if drive_enabled and setlist_enabled:
+        if drive_enabled and setlist_name not in disabled:
             # Enabled: contributes to sync totals
-            result.total_charts += cached.total_charts
-            result.synced_charts += cached.synced_charts
-            result.total_size += cached.total_size
-            result.synced_size += cached.synced_size
-            result.disk_size += cached.disk_size
-            result.enabled_setlists += 1
-        elif drive_enabled and not setlist_enabled and cached.disk_files > 0:
-            # Disabled with disk content: contributes to purgeable
-            result.purgeable_files += cached.disk_files
-            result.purgeable_size += cached.disk_size
-            result.purgeable_charts += cached.disk_charts
-        elif not drive_enabled and cached.disk_files > 0:
-            # Drive disabled with content: all content is purgeable
-            result.purgeable_files += cached.disk_files
-            result.purgeable_size += cached.disk_size
-            result.purgeable_charts += cached.disk_charts
-
-    return result
+            total_charts += cached.total_charts
+            synced_charts += cached.synced_charts
+            total_size += cached.total_size
+            synced_size += cached.synced_size
+            disk_size += cached.disk_size
+            enabled_setlists += 1
+        elif cached.disk_files > 0:
+            # Disabled setlist, or whole drive disabled, with disk content: purgeable
+            purgeable_files += cached.disk_files
+            purgeable_size += cached.disk_size
+            purgeable_charts += cached.disk_charts
+
+    return AggregatedFolderStats(
+        total_charts=total_charts,
+        synced_charts=synced_charts,
+        total_size=total_size,
+        synced_size=synced_size,
+        disk_size=disk_size,
+        purgeable_files=purgeable_files,
+        purgeable_size=purgeable_size,
+        purgeable_charts=purgeable_charts,
+        enabled_setlists=enabled_setlists,
+        total_setlists=len(setlist_names),
+    )
 
 
 # Global persistent cache instance
@@ -319,6 +390,8 @@ def get_persistent_stats_cache() -> PersistentStatsCache:
     global _persistent_stats_cache
     if _persistent_stats_cache is None:
         _persistent_stats_cache = PersistentStatsCache()
+        # Flush whatever the save interval held back
+        atexit.register(_persistent_stats_cache.save, force=True)
     return _persistent_stats_cache
 
 
@@ -333,11 +406,8 @@ class ScanCache:
 
     def get(self, setlist_id: str) -> list[dict] | None:
         path = self._dir / f"{setlist_id}.json"
-        if not path.exists():
-            return None
         try:
-            with open(path) as f:
-                data = json.load(f)
+            data = json_loads(path.read_bytes())
             if data.get("version") != self.CACHE_VERSION:
                 return None
             scanned_at = datetime.fromisoformat(data["scanned_at"])
@@ -345,7 +415,8 @@ class ScanCache:
             if age > self.MAX_AGE_SECONDS:
                 return None
             return data["files"]
-        except (json.JSONDecodeError, KeyError, OSError, ValueError):
+        except (KeyError, OSError, ValueError):
+            # Missing file, unreadable, or bad JSON (JSONDecodeError is a ValueError)
             return None
 
     def set(self, setlist_id: str, files: list[dict]):
@@ -357,8 +428,10 @@ class ScanCache:
             "files": files,
         }
         try:
-            with open(path, "w") as f:
-                json.dump(data, f)
+            # Unique temp + rename, so neither a crash nor an overlapping
+            # scan of the same setlist can leave a torn entry. No fsync -
+            # a lost entry just means a rescan.
+            write_atomic(path, json_dumps(data), fsync=False)
         except OSError:
             pass
 
@@ -383,12 +456,11 @@ class ScanCache:
         newest = None
         for path in self._dir.glob("*.json"):
             try:
-                with open(path) as f:
-                    data = json.load(f)
+                data = json_loads(path.read_bytes())
                 scanned_at = datetime.fromisoformat(data["scanned_at"])
                 if newest is None or scanned_at > newest:
                     newest = scanned_at
-            except (json.JSONDecodeError, KeyError, OSError, ValueError):
+            except (KeyError, OSError, ValueError):
                 continue
         return newest
 
@@ -410,24 +482,84 @@ class SyncCache:
     def __init__(self):
         self.local_files: dict[str, dict[str, int]] = {}  # folder_path -> {rel_path: size}
         self.actual_charts: dict[str, tuple[int, int]] = {}  # folder_path -> (count, size)
+        # Path tree over actual_charts keys: parent path -> child paths, linking
+        # every ancestor, so a folder's cached subfolders are found without a
+        # scan over all keys
+        self._children: defaultdict[str, set[str]] = defaultdict(set)
+        self.missing: dict[str, float] = {}  # folder_path -> monotonic time it was found missing
+        self.lock = threading.Lock()  # Guards bulk updates and clears
 
     def clear(self):
         """Clear all cached data (call after download/purge)."""
-        self.local_files.clear()
-        self.actual_charts.clear()
+        with self.lock:
+            self.local_files.clear()
+            self.actual_charts.clear()
+            self._children.clear()
+            self.missing.clear()
 
     def clear_folder(self, folder_path: str):
         """Clear cached data for a specific folder."""
-        self.local_files.pop(folder_path, None)
-        # Clear actual_charts for this folder and all subfolders
-        to_remove = [k for k in self.actual_charts if k.startswith(folder_path)]
-        for k in to_remove:
-            self.actual_charts.pop(k, None)
+        with self.lock:
+            self.local_files.pop(folder_path, None)
+            # Forget missing-folder results at or under this folder
+            subfolder_prefix = os.path.join(folder_path, "")
+            for path in [p for p in self.missing if p == folder_path or p.startswith(subfolder_prefix)]:
+                del self.missing[path]
+            # Clear actual_charts for this folder and all subfolders
+            stack = [folder_path]
+            while stack:
+                path = stack.pop()
+                self.actual_charts.pop(path, None)
+                stack.extend(self._children.pop(path, ()))
+
+    def add_actual_charts(self, results: dict[str, tuple[int, int]]):
+        """Cache (chart_count, total_size) results keyed by folder path."""
+        with self.lock:
+            children = self._children
+            for child, result in results.items():
+                child = sys.intern(child)
+                self.actual_charts[child] = result
+                parent = sys.intern(os.path.dirname(child))
+                # Link up the tree until reaching an already-linked ancestor
+                while parent != child and child not in children[parent]:
+                    children[parent].add(child)
+                    child, parent = parent, sys.intern(os.path.dirname(parent))
 
 
 # Global cache instance
 _cache = SyncCache()
 
+# Max concurrent chart walks in scan_actual_charts (I/O-bound)
+_CHART_SCAN_WORKERS = 8
+
+# Seconds a missing folder is trusted to stay missing without another stat
+_MISSING_TTL = 5.0
+
+
+def _folder_missing(folder_path: Path) -> bool:
+    """
+    Check whether a folder doesn't exist, remembering misses for _MISSING_TTL.
+
+    Disabled or not-yet-downloaded folders get queried on every UI refresh;
+    this skips their exists() stat until the entry expires or the folder's
+    cache is cleared (downloads clear it).
+    """
+    key = str(folder_path)
+    now = time.monotonic()
+    found_missing = _cache.missing.get(key)
+    if found_missing is not None and now - found_missing < _MISSING_TTL:
+        return True
+    # Stat outside the lock; only the dict writes need it (clear_folder
+    # iterates missing under the lock from other threads)
+    if folder_path.exists():
+        if found_missing is not None:
+            with _cache.lock:
+                _cache.missing.pop(key, None)
+        return False
+    with _cache.lock:
+        _cache.missing[key] = now
+    return True
+
 
 def get_cache() -> SyncCache:
     """Get the global cache instance."""
@@ -451,35 +583,66 @@ def scan_local_files(folder_path: Path) -> dict[str, int]:
     Scan local folder and return dict of {relative_path: size}.
 
     Uses os.scandir for better performance than individual exists()/stat() calls.
+    The same walk also counts the folder's charts, so a later
+    scan_actual_charts() of this folder is a cache hit.
     Results are cached until clear_cache() is called.
     """
     cache_key = str(folder_path)
     if cache_key in _cache.local_files:
         return _cache.local_files[cache_key]
 
-    local_files = {}
-    if not folder_path.exists():
-        return local_files
+    if _folder_missing(folder_path):
+        return {}
+
+    local_files, chart_count, chart_size = _scan_files_and_charts(cache_key)
+    _cache.local_files[sys.intern(cache_key)] = local_files
+    _cache.add_actual_charts({cache_key: (chart_count, chart_size)})
+    return local_files
+
+
+def _scan_files_and_charts(root: str) -> tuple[dict[str, int], int, int]:
+    """
+    One walk producing both scan_local_files' and the chart scan's results.
+
+    Runs the shared chart walk, recording every file's relative path and
+    size along the way, so charts are counted exactly like the local stats
+    scan does. An unreadable directory keeps whatever was read before the
+    error.
 
-    def scan_dir(dir_path: Path, prefix: str = ""):
+    Returns:
+        Tuple of ({rel_path: size}, chart_count, chart_size)
+    """
+    local_files: dict[str, int] = {}
+    # Relative prefix of each directory queued for the walk
+    prefixes = {root: ""}
+
+    def list_dir(dir_path: str, in_chart: bool) -> tuple[bool, int, list[str]]:
+        prefix = prefixes.pop(dir_path)
+        has_marker = False
+        direct_size = 0
+        subdirs = []
         try:
             with os.scandir(dir_path) as entries:
                 for entry in entries:
-                    name = normalize_fs_name(entry.name)
-                    rel_path = f"{prefix}{name}" if prefix else name
+                    rel_path = prefix + normalize_fs_name(entry.name)
                     if entry.is_file(follow_symlinks=False):
+                        if not has_marker and is_chart_marker(entry.name):
+                            has_marker = True
                         try:
-                            local_files[rel_path] = entry.stat(follow_symlinks=False).st_size
+                            size = entry.stat(follow_symlinks=False).st_size
                         except OSError:
-                            pass
+                            continue
+                        local_files[rel_path] = size
+                        direct_size += size
                     elif entry.is_dir(follow_symlinks=False):
-                        scan_dir(Path(entry.path), f"{rel_path}/")
+                        prefixes[entry.path] = rel_path + "/"
+                        subdirs.append(entry.path)
         except OSError:
             pass
+        return has_marker, direct_size, subdirs
 
-    scan_dir(folder_path)
-    _cache.local_files[cache_key] = local_files
-    return local_files
+    chart_count, chart_size = walk_chart_tree(root, list_dir)
+    return local_files, chart_count, chart_size
 
 
 def _scan_actual_charts_uncached(folder_path: Path) -> tuple[int, int]:
@@ -487,57 +650,13 @@ def _scan_actual_charts_uncached(folder_path: Path) -> tuple[int, int]:
     Scan folder for actual chart folders (containing song.ini, notes.mid, etc).
     Internal uncached version.
 
+    Shares the local stats walk (iterative, stats files only where a chart
+    needs their size), which counts charts exactly the same way.
+
     Returns:
         Tuple of (chart_count, total_size_bytes)
     """
-    if not folder_path.exists():
-        return 0, 0
-
-    chart_count = 0
-    total_size = 0
-    chart_markers = {"song.ini", "notes.mid", "notes.chart"}
-
-    def scan_for_charts(dir_path: Path) -> int:
-        """
-        Recursively scan for chart folders, including nested charts.
-        Returns: size of non-chart content for parent to include.
-        """
-        nonlocal chart_count, total_size
-        try:
-            has_marker = False
-            subdirs = []
-            direct_size = 0
-
-            with os.scandir(dir_path) as entries:
-                for entry in entries:
-                    if entry.is_file(follow_symlinks=False):
-                        if entry.name.lower() in chart_markers:
-                            has_marker = True
-                        try:
-                            direct_size += entry.stat(follow_symlinks=False).st_size
-                        except OSError:
-                            pass
-                    elif entry.is_dir(follow_symlinks=False):
-                        subdirs.append(Path(entry.path))
-
-            # Recurse into ALL subdirs first (before checking has_marker)
-            subdir_non_chart_size = 0
-            for subdir in subdirs:
-                subdir_non_chart_size += scan_for_charts(subdir)
-
-            if has_marker:
-                # This folder is a chart - include direct files + non-chart subdirs
-                chart_count += 1
-                total_size += direct_size + subdir_non_chart_size
-                return 0  # Chart content doesn't bubble up to parent
-            else:
-                # Not a chart - return size for parent to potentially include
-                return direct_size + subdir_non_chart_size
-        except OSError:
-            return 0
-
-    scan_for_charts(folder_path)
-    return chart_count, total_size
+    return scan_chart_tree(str(folder_path))
 
 
 def scan_disk_stats(folder_path: Path) -> tuple[int, int, int, int]:
@@ -547,53 +666,37 @@ def scan_disk_stats(folder_path: Path) -> tuple[int, int, int, int]:
     Returns:
         Tuple of (chart_count, chart_size, file_count, disk_size)
     """
-    if not folder_path.exists():
+    if _folder_missing(folder_path):
         return 0, 0, 0, 0
 
-    chart_count = 0
-    chart_size = 0
     file_count = 0
     disk_size = 0
-    chart_markers = {"song.ini", "notes.mid", "notes.chart"}
 
-    def scan(dir_path: Path) -> int:
-        nonlocal chart_count, chart_size, file_count, disk_size
+    def list_dir(dir_path: str, in_chart: bool) -> tuple[bool, int, list[str]]:
+        """Read one directory, counting every file toward the disk stats."""
+        nonlocal file_count, disk_size
+        has_marker = False
+        direct_size = 0
+        subdirs = []
         try:
-            has_marker = False
-            subdirs = []
-            direct_size = 0
-            local_file_count = 0
-
             with os.scandir(dir_path) as entries:
                 for entry in entries:
                     if entry.is_file(follow_symlinks=False):
-                        local_file_count += 1
-                        if entry.name.lower() in chart_markers:
+                        if not has_marker and is_chart_marker(entry.name):
                             has_marker = True
                         try:
-                            sz = entry.stat(follow_symlinks=False).st_size
-                            direct_size += sz
+                            direct_size += entry.stat(follow_symlinks=False).st_size
                             file_count += 1
-                            disk_size += sz
                         except OSError:
                             pass
                     elif entry.is_dir(follow_symlinks=False):
-                        subdirs.append(Path(entry.path))
-
-            subdir_non_chart_size = 0
-            for subdir in subdirs:
-                subdir_non_chart_size += scan(subdir)
-
-            if has_marker:
-                chart_count += 1
-                chart_size += direct_size + subdir_non_chart_size
-                return 0
-            else:
-                return direct_size + subdir_non_chart_size
+                        subdirs.append(entry.path)
         except OSError:
-            return 0
+            pass
+        disk_size += direct_size
+        return has_marker, direct_size, subdirs
 
-    scan(folder_path)
+    chart_count, chart_size = walk_chart_tree(str(folder_path), list_dir)
     return chart_count, chart_size, file_count, disk_size
 
 
@@ -611,31 +714,47 @@ def scan_actual_charts(folder_path: Path, disabled_setlists: set[str] = None) ->
     """
     cache_key = str(folder_path)
 
-    # Get or compute full scan (no filtering)
-    if cache_key in _cache.actual_charts:
-        full_count, full_size = _cache.actual_charts[cache_key]
-    else:
-        full_count, full_size = _scan_actual_charts_uncached(folder_path)
-        _cache.actual_charts[cache_key] = (full_count, full_size)
+    # Setlists are subfolders - nothing to subtract from an empty (or missing)
+    # folder, so skip looking them up or scanning them
+    cached_full = _cache.actual_charts.get(cache_key)
+    if cached_full is not None and cached_full[0] == 0:
+        return 0, 0
 
-    if not disabled_setlists:
+    # Full scan (no filtering) plus each disabled setlist, each cached separately
+    setlist_keys = []
+    for setlist_name in disabled_setlists or ():
+        setlist_keys.append(str(folder_path / sanitize_drive_name(setlist_name)))
+
+    # Scan whatever isn't cached - concurrently if there's more than one,
+    # since the walks are independent and spend their time in syscalls
+    found = {}
+    misses = []
+    for key in dict.fromkeys((cache_key, *setlist_keys)):
+        cached = _cache.actual_charts.get(key)
+        if cached is None:
+            misses.append(key)
+        else:
+            found[key] = cached
+    if len(misses) == 1:
+        found[misses[0]] = scan_chart_tree(misses[0])
+    elif misses:
+        with ThreadPoolExecutor(max_workers=min(_CHART_SCAN_WORKERS, len(misses))) as pool:
+            found.update(zip(misses, pool.map(scan_chart_tree, misses)))
+    if misses:
+        _cache.add_actual_charts({key: found[key] for key in misses})
+
+    full_count, full_size = found[cache_key]
+    if not setlist_keys:
         return full_count, full_size
 
-    # Subtract disabled setlists (each cached separately)
+    # Subtract disabled setlists, stopping once they've eclipsed everything
     result_count = full_count
     result_size = full_size
-
-    for setlist_name in disabled_setlists:
-        setlist_path = folder_path / sanitize_drive_name(setlist_name)
-        setlist_key = str(setlist_path)
-
-        if setlist_key in _cache.actual_charts:
-            setlist_count, setlist_size = _cache.actual_charts[setlist_key]
-        else:
-            setlist_count, setlist_size = _scan_actual_charts_uncached(setlist_path)
-            _cache.actual_charts[setlist_key] = (setlist_count, setlist_size)
-
+    for setlist_key in setlist_keys:
+        setlist_count, setlist_size = found[setlist_key]
         result_count -= setlist_count
         result_size -= setlist_size
+        if result_count <= 0:
+            return 0, 0
 
-    return max(0, result_count), max(0, result_size)
+    return result_count, max(0, result_size)
@@ -7,6 +7,7 @@ Uses marker files as source of truth for archive sync status.
 
 import os
 from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
 from typing import List, Tuple
 
@@ -24,8 +25,14 @@ EXCLUDED_FILES = {
 }
 
 
+@lru_cache(maxsize=1)
 def is_long_paths_enabled() -> bool:
-    """Check if Windows long paths are enabled in registry."""
+    """
+    Check if Windows long paths are enabled in registry.
+
+    Cached for the process - the setting only takes effect after a reboot,
+    and plan_downloads checks it once per file.
+    """
     if os.name != 'nt':
         return True
     try:
@@ -48,10 +55,28 @@ def exceeds_windows_path_limit(path: Path) -> bool:
 
 def has_long_filename(file_path: str) -> bool:
     """Check if any path component exceeds the 255 char filename limit."""
+    # No component can be longer than the whole path - true of nearly every file
+    if len(file_path) <= MAX_FILENAME_LENGTH:
+        return False
     parts = file_path.replace("\\", "/").split("/")
     return any(len(part) > MAX_FILENAME_LENGTH for part in parts)
 
 
+def _list_dir(dir_path: str) -> tuple[dict[str, os.DirEntry], set[str]]:
+    """
+    List a directory once for the planner: (entries by name, normalized names).
+
+    A missing directory lists as empty, so every file under it is known to be
+    absent without a stat each.
+    """
+    try:
+        with os.scandir(dir_path) as it:
+            entries = {entry.name: entry for entry in it}
+    except OSError:
+        return {}, set()
+    return entries, {normalize_path_key(name) for name in entries}
+
+
 @dataclass
 class DownloadTask:
     """A file to be downloaded."""
@@ -87,6 +112,9 @@ def plan_downloads(
     # Dedupes archives whose names differ only in case — NOT all archives in the same folder
     seen_archive_paths: set[str] = set()
 
+    # Directory listings for regular files, one scandir per parent folder
+    dir_listings: dict[str, tuple[dict[str, os.DirEntry], set[str]]] = {}
+
     for f in files:
         file_path = f["path"]
         file_name = file_path.split("/")[-1] if "/" in file_path else file_path
@@ -124,9 +152,12 @@ def plan_downloads(
             download_path = local_path.parent / f"_download_{file_name}"
         else:
             download_path = local_path
-            if delete_videos and Path(file_name).suffix.lower() in VIDEO_EXTENSIONS:
-                skipped += 1
-                continue
+            if delete_videos:
+                # Same as Path(file_name).suffix, without building a Path per file
+                dot = file_name.rfind(".")
+                if dot > 0 and file_name[dot:].lower() in VIDEO_EXTENSIONS:
+                    skipped += 1
+                    continue
 
         if has_long_filename(file_path):
             long_paths.append(file_path)
@@ -156,11 +187,32 @@ def plan_downloads(
             )
             is_synced = synced
         else:
-            is_synced = is_file_synced(
-                rel_path=file_path,
-                manifest_size=file_size,
-                local_path=local_path,
-            )
+            parent = str(local_path.parent)
+            listing = dir_listings.get(parent)
+            if listing is None:
+                listing = dir_listings[parent] = _list_dir(parent)
+            entries, normalized_names = listing
+
+            entry = entries.get(local_path.name)
+            local_size = None
+            if entry is not None:
+                try:
+                    local_size = entry.stat().st_size
+                except OSError:
+                    entry = None
+
+            if entry is None and normalize_path_key(local_path.name) not in normalized_names:
+                # Not on disk under any case/unicode variant of its name
+                is_synced = False
+            else:
+                # A variant match means a case-insensitive filesystem resolves
+                # it - let is_file_synced stat the path itself
+                is_synced = is_file_synced(
+                    rel_path=file_path,
+                    manifest_size=file_size,
+                    local_path=local_path,
+                    local_size=local_size,
+                )
 
         if is_synced:
             skipped += 1
@@ -138,9 +138,8 @@ def verify_marker(marker: dict, base_path: Path) -> bool:
 
     for rel_path, expected_size in files.items():
         full_path = base_path / rel_path
-        if not full_path.exists():
-            return False
         try:
+            # Missing files raise here - no separate exists() stat needed
             actual_size = full_path.stat().st_size
             is_ini = full_path.suffix.lower() == ".ini"
             # .ini files: Clone Hero appends leaderboard data, so just check >= original
@@ -438,14 +437,11 @@ def rebuild_markers_from_disk(
     Returns:
         Tuple of (created_count, skipped_count)
     """
-    from ..core.constants import CHART_ARCHIVE_EXTENSIONS
+    from .sync_checker import is_archive_file as is_archive
 
     created = 0
     skipped = 0
 
-    def is_archive(filename: str) -> bool:
-        return any(filename.lower().endswith(ext) for ext in CHART_ARCHIVE_EXTENSIONS)
-
     for folder in folders:
         folder_name = folder.get("name", "")
         folder_path = base_path / folder_name
@@ -308,6 +308,7 @@ def get_setlist_sync_status(
     setlist_name: str,
     base_path: Path,
     delete_videos: bool = True,
+    setlist_files: list | None = None,
 ) -> SyncStatus:
     """
     Calculate sync status for a single setlist within a folder.
@@ -317,6 +318,8 @@ def get_setlist_sync_status(
         setlist_name: Name of the setlist to check
         base_path: Base download path
         delete_videos: Whether to exclude video files from size calculations
+        setlist_files: This setlist's files, if the caller already has them
+            (skips filtering the whole folder's file list by prefix)
 
     Returns:
         SyncStatus with totals and synced counts for just this setlist
@@ -326,13 +329,16 @@ def get_setlist_sync_status(
     folder_name = folder.get("name", "")
     folder_path = base_path / folder_name
 
-    manifest_files = (folder.get("files") or [])
+    if setlist_files is not None:
+        manifest_files = setlist_files
+    else:
+        manifest_files = (folder.get("files") or [])
     if not manifest_files:
         return status
 
     # For folders with subfolders, filter to files with the setlist prefix
     # For flat folders (folder IS the setlist), use all files
-    if setlist_name != folder_name:
+    if setlist_files is None and setlist_name != folder_name:
         sanitized_name = sanitize_drive_name(setlist_name)
         setlist_prefix = f"{sanitized_name}/"
         manifest_files = [
@@ -370,6 +376,7 @@ def compute_setlist_stats(
     setlist_name: str,
     base_path: Path,
     user_settings=None,
+    setlist_files: list | None = None,
 ) -> CachedSetlistStats:
     """
     Compute all stats for a single setlist. This is the expensive operation - results should be cached.
@@ -381,6 +388,7 @@ def compute_setlist_stats(
         setlist_name: Name of the setlist to compute stats for
         base_path: Base download path
         user_settings: UserSettings for delete_videos preference
+        setlist_files: This setlist's files, if the caller already has them
     """
     folder_name = folder.get("name", "")
     folder_path = base_path / folder_name
@@ -391,9 +399,12 @@ def compute_setlist_stats(
     delete_videos = user_settings.delete_videos if user_settings else True
 
     # Get sync status from manifest comparison
-    has_files = folder.get("files") is not None
+    has_files = setlist_files is not None or folder.get("files") is not None
     if has_files:
-        sync_status = get_setlist_sync_status(folder, setlist_name, base_path, delete_videos=delete_videos)
+        sync_status = get_setlist_sync_status(
+            folder, setlist_name, base_path,
+            delete_videos=delete_videos, setlist_files=setlist_files,
+        )
         total_charts = sync_status.total_charts
         total_size = sync_status.total_size
         synced_charts = sync_status.synced_charts
@@ -25,7 +25,9 @@ class FileSpec:
 
 def is_archive_file(filename: str) -> bool:
     """Check if a filename is an archive type we handle."""
-    return any(filename.lower().endswith(ext) for ext in CHART_ARCHIVE_EXTENSIONS)
+    # All archive extensions are single-dot, so one set lookup on the tail suffices
+    dot = filename.rfind(".")
+    return dot >= 0 and filename[dot:].lower() in CHART_ARCHIVE_EXTENSIONS
 
 
 def is_archive_synced(
@@ -88,19 +90,27 @@ def is_file_synced(
     rel_path: str,
     manifest_size: int,
     local_path: Path = None,
+    local_size: int | None = None,
 ) -> bool:
     """
     Check if a regular (non-archive) file is synced.
 
     Logic: file exists on disk with expected size from manifest.
     .ini files get size tolerance since Clone Hero appends leaderboard data.
+
+    Pass local_size when the on-disk size is already known (e.g. from a
+    directory listing) to skip the stat.
     """
-    if not local_path or not local_path.exists():
-        return False
-    try:
-        actual_size = local_path.stat().st_size
-    except OSError:
+    if not local_path:
         return False
+    if local_size is not None:
+        actual_size = local_size
+    else:
+        # One stat answers both "exists?" and "what size?" - missing files raise
+        try:
+            actual_size = local_path.stat().st_size
+        except OSError:
+            return False
     if local_path.suffix.lower() == ".ini":
         return actual_size >= manifest_size
     return actual_size == manifest_size
@@ -5,14 +5,19 @@ Tests that cache operations are properly scoped — invalidating folder A
 doesn't blow away folder B's cache. 7+ fix commits for cache invalidation bugs.
 """
 
+import json
 import tempfile
 from pathlib import Path
-from unittest.mock import patch
+from unittest.mock import MagicMock, patch
 
 from src.sync.cache import (
     PersistentStatsCache,
     CachedSetlistStats,
     CachedFolderStats,
+    SyncCache,
+    aggregate_folder_stats,
+    clear_folder_cache,
+    scan_local_files,
 )
 
 
@@ -43,6 +48,7 @@ class TestPerSetlistInvalidation:
                 cache._cache = {}
                 cache._setlist_cache = {}
                 cache._dirty = False
+                cache._loaded = True
                 cache._path = Path(tmpdir) / "stats.json"
 
             folder_id = "drive1"
@@ -70,6 +76,7 @@ class TestPerFolderInvalidation:
                 cache._cache = {}
                 cache._setlist_cache = {}
                 cache._dirty = False
+                cache._loaded = True
                 cache._path = Path(tmpdir) / "stats.json"
 
             cache.set_setlist("driveX", "SetlistX", make_setlist_stats(total_charts=10))
@@ -93,6 +100,7 @@ class TestFullInvalidation:
                 cache._cache = {}
                 cache._setlist_cache = {}
                 cache._dirty = False
+                cache._loaded = True
                 cache._path = Path(tmpdir) / "stats.json"
 
             cache.set_setlist("drive1", "A", make_setlist_stats())
@@ -116,6 +124,7 @@ class TestCacheSetGetRoundTrip:
                 cache._cache = {}
                 cache._setlist_cache = {}
                 cache._dirty = False
+                cache._loaded = True
                 cache._path = Path(tmpdir) / "stats.json"
 
             original = make_setlist_stats(
@@ -137,6 +146,100 @@ class TestCacheSetGetRoundTrip:
             assert retrieved.disk_files == 100
             assert retrieved.disk_size == 75000
 
+    def test_save_and_reload_from_disk(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            cache = PersistentStatsCache()
+            cache._path = Path(tmpdir) / "stats.json"
+
+            cache.set_setlist("drive1", "MySetlist", make_setlist_stats(total_charts=42))
+            cache.save()
+
+            reloaded = PersistentStatsCache.__new__(PersistentStatsCache)
+            reloaded._cache = {}
+            reloaded._setlist_cache = {}
+            reloaded._dirty = False
+            reloaded._loaded = True
+            reloaded._path = cache._path
+            reloaded._load()
+
+            assert not cache._dirty
+            assert list(Path(tmpdir).glob("*.tmp")) == []
+            assert reloaded.get_setlist("drive1", "MySetlist").total_charts == 42
+
+    def test_unforced_saves_are_rate_limited(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            cache = PersistentStatsCache()
+            cache._path = Path(tmpdir) / "stats.json"
+            cache.set_setlist("drive1", "A", make_setlist_stats())
+            cache.save()
+
+            cache.set_setlist("drive1", "B", make_setlist_stats())
+            cache.save()
+            assert cache._dirty
+
+            cache.save(force=True)
+            assert not cache._dirty
+
+    def test_overlapping_saves_never_tear_the_file(self):
+        from concurrent.futures import ThreadPoolExecutor
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            cache = PersistentStatsCache()
+            cache._path = Path(tmpdir) / "stats.json"
+
+            def update_and_save(i):
+                cache.set_setlist("drive1", f"S{i}", make_setlist_stats(total_charts=i))
+                cache.save(force=True)
+
+            with ThreadPoolExecutor(max_workers=8) as pool:
+                list(pool.map(update_and_save, range(200)))
+
+            data = json.loads(cache._path.read_bytes())
+            assert len(data["_setlists"]["drive1"]) == 200
+            assert list(Path(tmpdir).glob("*.tmp")) == []
+
+    def test_unchanged_stats_do_not_dirty(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            cache = PersistentStatsCache()
+            cache._path = Path(tmpdir) / "stats.json"
+            cache.set_setlist("drive1", "MySetlist", make_setlist_stats())
+            cache._dirty = False
+
+            cache.set_setlist("drive1", "MySetlist", make_setlist_stats())
+            assert not cache._dirty
+
+            cache.set_setlist("drive1", "MySetlist", make_setlist_stats(total_charts=11))
+            assert cache._dirty
+
+    def test_file_read_on_first_use(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            with patch.object(PersistentStatsCache, '_load') as load:
+                cache = PersistentStatsCache()
+                cache._path = Path(tmpdir) / "stats.json"
+                assert not load.called
+
+                cache.get_setlist("drive1", "MySetlist")
+                cache.has_setlist_stats("drive1")
+                load.assert_called_once()
+
+    def test_loads_pre_row_format(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            with patch.object(PersistentStatsCache, '_load'):
+                cache = PersistentStatsCache.__new__(PersistentStatsCache)
+                cache._cache = {}
+                cache._setlist_cache = {}
+                cache._dirty = False
+                cache._loaded = True
+                cache._path = Path(tmpdir) / "stats.json"
+            cache._path.write_text(json.dumps({
+                "_setlists": {"drive1": {"MySetlist": {"total_charts": 7, "disk_size": 9}}},
+            }))
+
+            cache._load()
+
+            stats = cache.get_setlist("drive1", "MySetlist")
+            assert (stats.total_charts, stats.disk_size, stats.synced_charts) == (7, 9, 0)
+
 
 class TestSyncInvalidatesOnlyAffectedSetlist:
     """After sync, only the affected setlist cache is invalidated."""
@@ -148,6 +251,7 @@ class TestSyncInvalidatesOnlyAffectedSetlist:
                 cache._cache = {}
                 cache._setlist_cache = {}
                 cache._dirty = False
+                cache._loaded = True
                 cache._path = Path(tmpdir) / "stats.json"
 
             folder_id = "drive1"
@@ -173,6 +277,7 @@ class TestPurgeInvalidatesOnlyAffectedSetlists:
                 cache._cache = {}
                 cache._setlist_cache = {}
                 cache._dirty = False
+                cache._loaded = True
                 cache._path = Path(tmpdir) / "stats.json"
 
             folder_id = "drive1"
@@ -200,6 +305,7 @@ class TestSettingsHashCacheMiss:
                 cache._cache = {}
                 cache._setlist_cache = {}
                 cache._dirty = False
+                cache._loaded = True
                 cache._path = Path(tmpdir) / "stats.json"
 
             # The legacy folder-level cache uses settings_hash
@@ -217,3 +323,79 @@ class TestSettingsHashCacheMiss:
 
             # Different hash → miss
             assert cache.get("drive1", "def") is None
+
+
+class TestSyncCacheClearFolder:
+    """Clearing a folder's chart scans leaves other folders cached."""
+
+    def test_clears_folder_and_subfolders_only(self):
+        cache = SyncCache()
+        cache.add_actual_charts({
+            "/dl/Drive": (3, 30),
+            "/dl/Drive/Setlist": (1, 10),
+            "/dl/Drive/Setlist/Deep": (1, 5),
+            "/dl/Drive 2": (2, 20),
+        })
+
+        cache.clear_folder("/dl/Drive")
+
+        assert cache.actual_charts == {"/dl/Drive 2": (2, 20)}
+
+    def test_clears_descendants_of_uncached_folder(self):
+        cache = SyncCache()
+        cache.add_actual_charts({"/dl/Drive/Setlist": (1, 10)})
+
+        cache.clear_folder("/dl")
+
+        assert cache.actual_charts == {}
+
+    def test_missing_folder_remembered_until_cleared(self, tmp_path):
+        folder = tmp_path / "Drive"
+        assert scan_local_files(folder) == {}
+
+        folder.mkdir()
+        (folder / "song.ini").write_bytes(b"X")
+        assert scan_local_files(folder) == {}
+
+        clear_folder_cache(tmp_path)
+        assert scan_local_files(folder) == {"song.ini": 1}
+
+
+class TestAggregateFolderStats:
+    """Folder stats are summed from cached setlist stats by enabled state."""
+
+    def make_cache(self, tmpdir):
+        cache = PersistentStatsCache()
+        cache._path = Path(tmpdir) / "stats.json"
+        cache.set_setlist("drive1", "On", make_setlist_stats(total_charts=3, disk_files=4))
+        cache.set_setlist("drive1", "Off", make_setlist_stats(disk_files=2, disk_size=50, disk_charts=1))
+        cache.set_setlist("drive1", "OffEmpty", make_setlist_stats(disk_files=0))
+        return cache
+
+    def make_settings(self, drive_enabled):
+        settings = MagicMock()
+        settings.is_drive_enabled.return_value = drive_enabled
+        settings.get_disabled_subfolders.return_value = {"Off", "OffEmpty"}
+        return settings
+
+    def test_enabled_and_purgeable_split(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            cache = self.make_cache(tmpdir)
+
+            stats = aggregate_folder_stats(
+                "drive1", ["On", "Off", "OffEmpty", "Uncached"], self.make_settings(True), cache,
+            )
+
+            assert (stats.total_charts, stats.enabled_setlists, stats.total_setlists) == (3, 1, 4)
+            assert (stats.purgeable_files, stats.purgeable_size, stats.purgeable_charts) == (2, 50, 1)
+
+    def test_disabled_drive_is_all_purgeable(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            cache = self.make_cache(tmpdir)
+
+            stats = aggregate_folder_stats(
+                "drive1", ["On", "Off", "OffEmpty"], self.make_settings(False), cache,
+            )
+
+            assert (stats.total_charts, stats.enabled_setlists) == (0, 0)
+            assert stats.purgeable_files == 4 + 2
@@ -109,6 +109,12 @@ class TestPartialSyncStateConsistency:
         assert status.total_charts == 5
         assert status.synced_charts == 3
 
+        # Passing the setlist's own files gives the same status
+        prefiltered = get_setlist_sync_status(
+            folder, setlist, sync_env.base_path, setlist_files=files,
+        )
+        assert (prefiltered.total_charts, prefiltered.synced_charts) == (5, 3)
+
         # Planner: 2 tasks
         setlist_files = dedupe_files_by_newest(
             [f for f in files if f["path"].startswith(f"{setlist}/")]
@@ -0,0 +1,302 @@
+"""
+Tests for background setlist scanning.
+
+Tests BackgroundScanner discovery, scan progress and enable/disable
+tracking against a fake Drive tree (no network, no disk caches).
+"""
+
+import pytest
+
+from src.drive import FolderScanner
+from src.sync import background_scanner as scanner_module
+from src.sync.background_scanner import BackgroundScanner
+
+FOLDER = BackgroundScanner.FOLDER_MIME
+
+
+class FakeDriveClient:
+    """Serves folder listings from an in-memory dict."""
+
+    def __init__(self, listings: dict[str, list], failing: set[str] = None):
+        self.listings = listings
+        self.failing = failing or set()
+        self.api_calls = 0
+        self.batch_calls = 0
+        self.batch_fails = False
+        self.fail_once = False
+
+    def list_folder(self, folder_id):
+        self.api_calls += 1
+        if folder_id in self.failing:
+            if self.fail_once:
+                self.failing.discard(folder_id)
+            raise ConnectionError(folder_id)
+        return self.listings.get(folder_id, [])
+
+    def list_folders_batch(self, folder_ids):
+        self.batch_calls += 1
+        if self.batch_fails:
+            raise ConnectionError("batch")
+        return {fid: self.list_folder(fid) for fid in folder_ids}
+
+
+class MemoryScanCache:
+    """In-memory stand-in for ScanCache."""
+
+    def __init__(self):
+        self.entries = {}
+
+    def get(self, setlist_id):
+        return self.entries.get(setlist_id)
+
+    def set(self, setlist_id, files):
+        self.entries[setlist_id] = files
+
+
+@pytest.fixture(autouse=True)
+def memory_scan_cache(monkeypatch):
+    scan_cache = MemoryScanCache()
+    monkeypatch.setattr(scanner_module, "get_scan_cache", lambda: scan_cache)
+    return scan_cache
+
+
+def folder_item(folder_id, name):
+    return {"id": folder_id, "name": name, "mimeType": FOLDER}
+
+
+def file_item(file_id, name, size=1):
+    return {"id": file_id, "name": name, "mimeType": "text/plain", "size": str(size)}
+
+
+def make_scanner(listings, drives=("drive",), failing=None, **kwargs) -> BackgroundScanner:
+    folders = [{"folder_id": d, "name": d.title(), "files": None} for d in drives]
+    scanner = BackgroundScanner(folders, auth=None, api_key="", **kwargs)
+    scanner._client = FakeDriveClient(listings, failing)
+    scanner.RETRY_BACKOFF_BASE = 0  # Retry failed setlists immediately
+    scanner._discover_all_setlists()
+    return scanner
+
+
+def two_setlist_listings():
+    return {
+        "drive": [folder_item("s1", "One"), folder_item("s2", "Two")],
+        "s1": [file_item("f1", "a.zip", 10)],
+        "s2": [file_item("f2", "b.zip", 20), file_item("f3", "c.zip", 30)],
+    }
+
+
+class TestDiscovery:
+    """Tests for setlist discovery."""
+
+    def test_registers_setlists_per_drive(self):
+        scanner = make_scanner(two_setlist_listings())
+
+        assert scanner.get_discovered_setlist_names("drive") == ["One", "Two"]
+        assert scanner.get_discovered_setlist_count("drive") == (2, 2)
+        assert scanner.get_scan_progress("drive") == (0, 2)
+        assert scanner.is_scanning("drive")
+        assert not scanner.is_done()
+
+    def test_drives_listed_in_one_batch(self):
+        listings = {"d1": [folder_item("s1", "One")], "d2": [folder_item("s2", "Two")]}
+
+        scanner = make_scanner(listings, drives=("d1", "d2"))
+
+        assert scanner._client.batch_calls == 1
+        assert scanner._client.api_calls == 2
+        assert scanner.get_discovered_setlist_names("d2") == ["Two"]
+
+    def test_batch_failure_falls_back_per_drive(self):
+        folders = [{"folder_id": d, "name": d.title(), "files": None} for d in ("d1", "d2")]
+        scanner = BackgroundScanner(folders, auth=None, api_key="")
+        scanner._client = FakeDriveClient({"d1": [folder_item("s1", "One")]}, failing={"d2"})
+        scanner._client.batch_fails = True
+
+        scanner._discover_all_setlists()
+
+        assert scanner.get_discovered_setlist_names("d1") == ["One"]
+        # A drive that can't be listed is treated as a single unit
+        assert scanner.get_discovered_setlist_names("d2") == ["D2"]
+
+    def test_flat_drive_is_one_setlist(self):
+        scanner = make_scanner({"drive": [file_item("f1", "a.zip")]})
+
+        assert scanner.get_discovered_setlist_names("drive") == ["Drive"]
+
+
+class TestScanning:
+    """Tests for the scan worker and progress getters."""
+
+    def test_scan_accumulates_drive_files(self):
+        scanner = make_scanner(two_setlist_listings())
+
+        scanner._scan_worker()
+
+        drive = scanner._folders[0]
+        assert drive["file_count"] == 3
+        assert drive["total_size"] == 60
+        assert scanner.is_done()
+        assert scanner.is_scanned("drive")
+        assert scanner.is_ready_for_sync("drive")
+        assert scanner.is_all_enabled_scanned()
+        assert scanner.get_scan_progress("drive") == (2, 2)
+        assert scanner.is_setlist_scanned("drive", "One")
+        assert scanner.check_updates()
+        assert not scanner.check_updates()
+
+    def test_done_tracks_added_folders(self):
+        listings = two_setlist_listings()
+        listings["drive2"] = [folder_item("s3", "Three")]
+        scanner = make_scanner(listings)
+        scanner._scan_worker()
+        assert scanner.wait_done(timeout=0)
+
+        # Discovery of a new folder reopens the scan until it's scanned too
+        scanner._discover_folder_setlists({"folder_id": "drive2", "name": "Drive2", "files": None})
+        assert not scanner.is_done()
+
+        scanner._scan_worker()
+        assert scanner.is_done()
+        assert scanner.is_scanned("drive2")
+
+    def test_parallel_scan_completes_each_drive_once(self):
+        listings = {}
+        for d in ("d1", "d2"):
+            listings[d] = [folder_item(f"{d}-s{i}", f"Setlist {i}") for i in range(20)]
+            for i in range(20):
+                listings[f"{d}-s{i}"] = [file_item(f"{d}-f{i}", "a.zip", i)]
+        completed = []
+        scanner = make_scanner(listings, drives=("d1", "d2"), on_folder_complete=completed.append)
+
+        scanner._scan_worker()
+
+        assert sorted(d["folder_id"] for d in completed) == ["d1", "d2"]
+        assert all(d["file_count"] == 20 for d in scanner._folders)
+        assert scanner._in_progress_ids == set()
+
+    def test_scan_workers_are_daemon_threads(self):
+        import threading
+
+        scanner = make_scanner(two_setlist_listings())
+        daemon_flags = []
+        list_folder = scanner._client.list_folder
+
+        def recording_list_folder(folder_id):
+            daemon_flags.append(threading.current_thread().daemon)
+            return list_folder(folder_id)
+
+        scanner._client.list_folder = recording_list_folder
+        scanner._scan_worker()
+
+        # Exiting without stop() must not wait for in-flight scans
+        assert daemon_flags and all(daemon_flags)
+
+    def test_stop_cancels_setlist_scan_between_requests(self):
+        import threading
+
+        stop = threading.Event()
+        stop.set()
+        client = FakeDriveClient(two_setlist_listings())
+
+        result = FolderScanner(client, stop_event=stop).scan("s1")
+
+        assert result.cancelled
+        assert client.api_calls == 0
+
+    def test_failed_setlist_counts_as_done(self):
+        scanner = make_scanner(two_setlist_listings(), failing={"s2"})
+
+        scanner._scan_worker()
+
+        assert scanner.has_scan_failures()
+        assert scanner.get_failed_setlist_names("drive") == {"Two"}
+        assert scanner.is_done()
+        assert scanner.is_ready_for_sync("drive")
+        assert scanner.get_scan_progress("drive") == (2, 2)
+
+    def test_failed_setlist_retried_up_to_max_attempts(self):
+        scanner = make_scanner(two_setlist_listings(), failing={"s2"})
+
+        scanner._scan_worker()
+
+        # Discovery listing + s1 + every attempt at s2
+        assert scanner._client.api_calls == 2 + BackgroundScanner.MAX_SCAN_ATTEMPTS
+        assert scanner._failed_retries == {}
+
+    def test_retry_waits_for_backoff(self):
+        scanner = make_scanner(two_setlist_listings(), failing={"s2"})
+        scanner.RETRY_BACKOFF_BASE = 60
+
+        for setlist_id in ("s1", "s2"):
+            assert scanner._get_next_setlist_to_scan().setlist_id == setlist_id
+        scanner._scan_setlist(scanner.all_setlists["s2"], FolderScanner(scanner._client))
+        scanner._in_progress_ids.clear()
+
+        assert scanner._get_next_setlist_to_scan() is None
+        assert 59 < scanner._next_retry_delay() <= 60
+
+    def test_retry_clears_recovered_failure(self):
+        scanner = make_scanner(two_setlist_listings(), failing={"s2"})
+        scanner._client.fail_once = True
+
+        scanner._scan_worker()
+
+        assert not scanner.has_scan_failures()
+        assert scanner.get_failed_setlist_names("drive") == set()
+        assert scanner._folders[0]["file_count"] == 3
+
+    def test_progress_counts_track_partial_scan(self):
+        scanner = make_scanner(two_setlist_listings(), failing={"s2"})
+        scanner.notify_setlist_toggled("drive", "One", False)
+        setlists = scanner.all_setlists
+
+        scanner._scan_setlist(setlists["s1"], FolderScanner(scanner._client))
+
+        assert scanner.get_scan_progress("drive") == (1, 2)
+        assert scanner.is_scanning("drive")
+        assert not scanner.is_ready_for_sync("drive")
+
+        scanner._scan_setlist(setlists["s2"], FolderScanner(scanner._client))
+
+        # Failed counts toward progress but not toward "scanned"
+        assert scanner.get_scan_progress("drive") == (2, 2)
+        assert scanner.is_scanning("drive")
+        assert scanner.is_ready_for_sync("drive")
+        assert scanner.get_discovered_setlist_count("drive") == (1, 2)
+
+    def test_next_setlist_prefers_enabled_and_newly_toggled(self):
+        listings = {"drive": [folder_item(f"s{i}", f"Setlist {i}") for i in range(4)]}
+        scanner = make_scanner(listings)
+        scanner.notify_drive_toggled("drive", False)
+        scanner.notify_setlist_toggled("drive", "Setlist 1", True)
+        scanner.notify_setlist_toggled("drive", "Setlist 3", True)
+
+        claimed = []
+        while (setlist := scanner._get_next_setlist_to_scan()) is not None:
+            claimed.append(setlist.setlist_id)
+
+        assert claimed == ["s3", "s1", "s0", "s2"]
+
+    def test_stats_snapshot_reused_when_idle(self):
+        scanner = make_scanner(two_setlist_listings())
+
+        scanner._scan_worker()
+
+        stats = scanner.get_stats()
+        assert (stats.folders_done, stats.api_calls, stats.current_folder) == (2, 3, "")
+        assert scanner.get_stats() is stats
+
+        scanner._current_folder = ("Drive/One", 1.0)
+        assert scanner.get_stats().current_folder == "Drive/One"
+
+    def test_toggle_updates_enabled_getters(self):
+        scanner = make_scanner(two_setlist_listings())
+
+        scanner.notify_setlist_toggled("drive", "Two", False)
+
+        assert scanner.get_discovered_setlist_count("drive") == (1, 2)
+        assert scanner.get_enabled_setlist_count() == 1
+
+        scanner.notify_drive_toggled("drive", True)
+
+        assert scanner.get_enabled_setlist_count() == 2
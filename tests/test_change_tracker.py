@@ -0,0 +1,374 @@
+"""
+Tests for incremental manifest updates via the Changes API.
+
+Tests ChangeTracker parent-chain resolution and apply_changes() against a
+fake Drive tree - no network access.
+"""
+
+import pytest
+
+from src.drive.changes import ChangeTracker
+from src.manifest import Manifest, FolderEntry, FileEntry
+
+
+class FakeDriveClient:
+    """Serves metadata from an in-memory {id: {"name", "parents"}} tree."""
+
+    def __init__(self, tree: dict[str, dict], changes: list[dict] = None):
+        self.tree = tree
+        self.changes = changes or []
+        self.fetched: list[str] = []
+        self.api_calls = 0
+        self.single_calls = 0
+        self.batch_calls = 0
+
+    def get_file_metadata(self, file_id, fields="id,name,parents"):
+        self.single_calls += 1
+        self.api_calls += 1
+        self.fetched.append(file_id)
+        return self.tree.get(file_id)
+
+    def get_files_metadata_batch(self, file_ids, fields="id,name,parents"):
+        self.batch_calls += 1
+        self.api_calls += len(file_ids)
+        self.fetched.extend(file_ids)
+        return {fid: self.tree.get(fid) for fid in file_ids}
+
+    def get_changes(self, page_token):
+        self.api_calls += 1
+        return self.changes, "new-token"
+
+
+def make_manifest(root_id: str = "root") -> Manifest:
+    manifest = Manifest()
+    manifest.changes_token = "old-token"
+    manifest.folders = [FolderEntry(name="Root", folder_id=root_id)]
+    return manifest
+
+
+def file_change(file_id: str, parent: str, size: int = 10) -> dict:
+    return {
+        "fileId": file_id,
+        "file": {
+            "id": file_id,
+            "name": f"{file_id}.ini",
+            "mimeType": "text/plain",
+            "size": str(size),
+            "md5Checksum": f"md5-{file_id}",
+            "modifiedTime": "2024-01-01T00:00:00Z",
+            "parents": [parent],
+        },
+    }
+
+
+@pytest.fixture
+def deep_tree():
+    # root -> a -> b -> c -> d
+    return {
+        "a": {"name": "A", "parents": ["root"]},
+        "b": {"name": "B", "parents": ["a"]},
+        "c": {"name": "C", "parents": ["b"]},
+        "d": {"name": "D", "parents": ["c"]},
+    }
+
+
+class TestIsInTrackedFolders:
+    """Tests for _is_in_tracked_folders()."""
+
+    def test_deep_file_is_tracked(self, deep_tree):
+        client = FakeDriveClient(deep_tree)
+        tracker = ChangeTracker(client, Manifest())
+
+        assert tracker._is_in_tracked_folders({"parents": ["d"]}, {"root"})
+
+    def test_untracked_root(self, deep_tree):
+        client = FakeDriveClient(deep_tree)
+        tracker = ChangeTracker(client, Manifest())
+
+        assert not tracker._is_in_tracked_folders({"parents": ["d"]}, {"other"})
+
+    def test_one_request_per_level(self, deep_tree):
+        """Sibling parents at the same depth share one batched request."""
+        deep_tree["x"] = {"name": "X", "parents": ["b"]}
+        client = FakeDriveClient(deep_tree)
+        tracker = ChangeTracker(client, Manifest())
+
+        assert tracker._is_in_tracked_folders({"parents": ["d", "x"]}, {"root"})
+        assert client.single_calls == 0
+        # d,x -> c,b -> b(visited),a -> root
+        assert client.batch_calls == 3
+
+    def test_known_subfolders_skip_walk(self, deep_tree):
+        """A successful walk records the chain; siblings resolve for free."""
+        client = FakeDriveClient(deep_tree)
+        manifest = Manifest()
+        tracker = ChangeTracker(client, manifest)
+
+        assert tracker._is_in_tracked_folders({"parents": ["d"]}, {"root"})
+        assert manifest.known_subfolder_ids == {
+            "a": "root", "b": "root", "c": "root", "d": "root",
+        }
+
+        fresh = FakeDriveClient(deep_tree)
+        tracker = ChangeTracker(fresh, manifest)
+        assert tracker._is_in_tracked_folders({"parents": ["c"]}, {"root"})
+        assert fresh.api_calls == 0
+
+    def test_known_subfolder_of_untracked_root(self, deep_tree):
+        """Subfolders recorded under a root that's no longer tracked don't match."""
+        client = FakeDriveClient(deep_tree)
+        manifest = Manifest()
+        manifest.known_subfolder_ids = {"d": "old_root"}
+        tracker = ChangeTracker(client, manifest)
+
+        assert not tracker._is_in_tracked_folders({"parents": ["d"]}, {"other"})
+
+
+class TestGetFilePath:
+    """Tests for _get_file_path()."""
+
+    def test_ancestor_paths_cached(self, deep_tree):
+        deep_tree["f1"] = {"name": "f1.ini", "parents": ["d"]}
+        deep_tree["f2"] = {"name": "f2: x.ini", "parents": ["d"]}
+        tracker = ChangeTracker(FakeDriveClient(deep_tree), Manifest())
+
+        assert tracker._get_file_path("f1", "root") == "A/B/C/D/f1.ini"
+        assert tracker._path_cache["b"] == ("root", "A/B")
+
+        walked = []
+        get_parents = tracker._get_parents
+        tracker._get_parents = lambda fid: walked.append(fid) or get_parents(fid)
+        assert tracker._get_file_path("f2", "root") == "A/B/C/D/f2 - x.ini"
+        assert walked == ["f2"]
+
+    def test_cache_is_per_root(self, deep_tree):
+        deep_tree["f1"] = {"name": "f1.ini", "parents": ["d"]}
+        tracker = ChangeTracker(FakeDriveClient(deep_tree), Manifest())
+
+        assert tracker._get_file_path("f1", "root") == "A/B/C/D/f1.ini"
+        assert tracker._get_file_path("f1", "b") == "C/D/f1.ini"
+        assert tracker._get_file_path("f1", "other") is None
+
+
+class TestApplyChanges:
+    """Tests for apply_changes()."""
+
+    def test_adds_files_with_paths(self, deep_tree):
+        deep_tree["f1"] = {"name": "f1.ini", "parents": ["d"]}
+        client = FakeDriveClient(deep_tree, [file_change("f1", "d", size=7)])
+        manifest = make_manifest()
+
+        stats = ChangeTracker(client, manifest).apply_changes({"root"})
+
+        folder = manifest.folders[0]
+        assert stats.added == 1
+        assert folder.files[0]["path"] == "A/B/C/D/f1.ini"
+        assert folder.total_size == 7
+        assert manifest.changes_token == "new-token"
+
+    def test_shared_ancestors_fetched_once(self, deep_tree):
+        """Files sharing a folder chain don't re-fetch its metadata."""
+        changes = []
+        for i in range(5):
+            deep_tree[f"f{i}"] = {"name": f"f{i}.ini", "parents": ["d"]}
+            changes.append(file_change(f"f{i}", "d"))
+        client = FakeDriveClient(deep_tree, changes)
+        manifest = make_manifest()
+
+        stats = ChangeTracker(client, manifest).apply_changes({"root"})
+
+        assert stats.added == 5
+        for folder_id in ("a", "b", "c", "d"):
+            assert client.fetched.count(folder_id) == 1
+
+    def test_removes_and_modifies_existing(self, deep_tree):
+        deep_tree["keep"] = {"name": "keep.ini", "parents": ["d"]}
+        manifest = make_manifest()
+        folder = manifest.folders[0]
+        for fid, size in (("gone", 5), ("keep", 3), ("other", 2)):
+            folder.add_file({"id": fid, "path": f"A/{fid}", "name": fid, "size": size})
+        folder.file_count = 3
+        folder.total_size = 10
+
+        changes = [
+            {"fileId": "gone", "removed": True},
+            file_change("keep", "d", size=30),
+        ]
+        stats = ChangeTracker(FakeDriveClient(deep_tree, changes), manifest).apply_changes({"root"})
+
+        assert (stats.removed, stats.modified) == (1, 1)
+        assert [f["id"] for f in folder.files] == ["keep", "other"]
+        assert folder.file_count == 2
+        assert folder.total_size == 32
+
+    def test_shortcut_target_always_refetched(self, deep_tree):
+        """A shortcut's own modifiedTime says nothing about its target - fetch it."""
+        deep_tree["sc"] = {"name": "pack.zip", "parents": ["d"]}
+        deep_tree["target"] = {
+            "name": "pack.zip", "parents": ["elsewhere"],
+            "size": "70", "md5Checksum": "new", "modifiedTime": "2024-02-01T00:00:00Z",
+        }
+        manifest = make_manifest()
+        folder = manifest.folders[0]
+        folder.add_file({
+            "id": "target", "path": "A/B/C/D/pack.zip", "name": "pack.zip",
+            "size": 50, "md5": "m", "modified": "2024-01-01T00:00:00Z",
+        })
+        folder.file_count = 1
+        folder.total_size = 50
+
+        # Same timestamp as the stored entry, but the target itself changed
+        change = file_change("sc", "d")
+        change["file"]["mimeType"] = "application/vnd.google-apps.shortcut"
+        change["file"]["shortcutDetails"] = {"targetId": "target", "targetMimeType": "application/zip"}
+        client = FakeDriveClient(deep_tree, [change])
+
+        stats = ChangeTracker(client, manifest).apply_changes({"root"})
+
+        assert "target" in client.fetched
+        assert stats.modified == 1
+        assert folder.get_file("target")["size"] == 70
+        assert folder.get_file("target")["md5"] == "new"
+
+    def test_repeated_changes_collapse_to_latest(self, deep_tree):
+        """Several changes for one file in a poll apply only the last one."""
+        deep_tree["f1"] = {"name": "f1.ini", "parents": ["d"]}
+        changes = [
+            file_change("f1", "d", size=1),
+            file_change("f1", "d", size=2),
+            file_change("f1", "d", size=3),
+        ]
+        manifest = make_manifest()
+
+        stats = ChangeTracker(FakeDriveClient(deep_tree, changes), manifest).apply_changes({"root"})
+
+        folder = manifest.folders[0]
+        assert (stats.added, stats.modified) == (1, 0)
+        assert folder.total_size == 3
+
+    def test_change_then_removal_removes(self, deep_tree):
+        deep_tree["f1"] = {"name": "f1.ini", "parents": ["d"]}
+        manifest = make_manifest()
+        folder = manifest.folders[0]
+        folder.add_file({"id": "f1", "path": "A/B/C/D/f1.ini", "name": "f1.ini", "size": 4})
+        folder.file_count = 1
+        folder.total_size = 4
+        changes = [file_change("f1", "d", size=9), {"fileId": "f1", "removed": True}]
+        client = FakeDriveClient(deep_tree, changes)
+
+        stats = ChangeTracker(client, manifest).apply_changes({"root"})
+
+        assert (stats.removed, stats.modified) == (1, 0)
+        assert client.fetched == []
+        assert folder.files == []
+
+
+class TestPersistedCaches:
+    """Tests for folder metadata/paths persisted in the manifest across runs."""
+
+    def test_second_run_starts_warm(self, deep_tree, tmp_path):
+        deep_tree["f1"] = {"name": "f1.ini", "parents": ["d"]}
+        deep_tree["f2"] = {"name": "f2.ini", "parents": ["d"]}
+        manifest = make_manifest()
+        manifest.path = tmp_path / "manifest.json"
+        ChangeTracker(FakeDriveClient(deep_tree, [file_change("f1", "d")]), manifest).apply_changes({"root"})
+        manifest.save()
+
+        reloaded = Manifest.load(manifest.path)
+        client = FakeDriveClient(deep_tree, [file_change("f2", "d")])
+        ChangeTracker(client, reloaded).apply_changes({"root"})
+
+        assert reloaded.path_cache["d"] == ("root", "A/B/C/D")
+        assert not {"a", "b", "c", "d"} & set(client.fetched)
+        assert reloaded.folders[0].get_file("f2")["path"] == "A/B/C/D/f2.ini"
+
+    def test_only_tracked_folders_persisted(self, deep_tree):
+        deep_tree["x"] = {"name": "X", "parents": ["elsewhere"]}
+        deep_tree["y"] = {"name": "Y", "parents": ["x"]}
+        deep_tree["f1"] = {"name": "f1.ini", "parents": ["d"]}
+        deep_tree["f2"] = {"name": "f2.ini", "parents": ["y"]}
+        manifest = make_manifest()
+        client = FakeDriveClient(deep_tree, [file_change("f1", "d"), file_change("f2", "y")])
+        ChangeTracker(client, manifest).apply_changes({"root"})
+
+        assert set(manifest.parent_cache) == {"a", "b", "c", "d"}
+
+    def test_renamed_folder_invalidates_caches(self, deep_tree):
+        deep_tree["f1"] = {"name": "f1.ini", "parents": ["d"]}
+        deep_tree["f2"] = {"name": "f2.ini", "parents": ["d"]}
+        manifest = make_manifest()
+        ChangeTracker(FakeDriveClient(deep_tree, [file_change("f1", "d")]), manifest).apply_changes({"root"})
+
+        deep_tree["b"] = {"name": "B2", "parents": ["a"]}
+        folder_change = {
+            "fileId": "b",
+            "file": {"id": "b", "name": "B2", "mimeType": "application/vnd.google-apps.folder", "parents": ["a"]},
+        }
+        client = FakeDriveClient(deep_tree, [folder_change, file_change("f2", "d")])
+        ChangeTracker(client, manifest).apply_changes({"root"})
+
+        assert "b" in client.fetched
+        assert manifest.folders[0].get_file("f2")["path"] == "A/B2/C/D/f2.ini"
+
+
+class TestFileLookup:
+    """Tests for Manifest.build_file_lookup() staying current."""
+
+    def test_lookup_tracks_folder_mutations(self):
+        manifest = make_manifest()
+        folder = manifest.folders[0]
+        folder.add_file({"id": "a", "path": "a", "size": 1})
+
+        lookup = manifest.build_file_lookup()
+        folder.add_file({"id": "b", "path": "b", "size": 1})
+        folder.remove_file("a")
+
+        assert manifest.build_file_lookup() is lookup
+        assert lookup == {"b": folder}
+
+    def test_lookup_rebuilt_when_folders_change(self):
+        manifest = make_manifest()
+        lookup = manifest.build_file_lookup()
+
+        other = FolderEntry(name="Other", folder_id="other")
+        other.add_file({"id": "x", "path": "x", "size": 1})
+        manifest.folders.append(other)
+
+        rebuilt = manifest.build_file_lookup()
+        assert rebuilt is not lookup
+        assert rebuilt == {"x": other}
+
+    def test_removed_files_never_visible(self):
+        folder = FolderEntry(name="Root", folder_id="root")
+        folder.add_file({"id": "a", "path": "a", "size": 1})
+        folder.add_file({"id": "b", "path": "b", "size": 1})
+        folder.add_file({"id": "c", "path": "c", "size": 1})
+        folder.remove_file("a")
+
+        assert folder.to_dict()["files"] == [
+            {"id": "b", "path": "b", "size": 1}, {"id": "c", "path": "c", "size": 1}
+        ]
+        assert folder.files == [
+            {"id": "b", "path": "b", "size": 1}, {"id": "c", "path": "c", "size": 1}
+        ]
+        folder.remove_file("c")
+        assert folder.get_file("b")["path"] == "b"
+        assert [f["id"] for f in folder.files] == ["b"]
+
+    def test_default_files_not_shared(self):
+        one = FolderEntry(name="One", folder_id="one")
+        two = FolderEntry(name="Two", folder_id="two")
+        one.add_file({"id": "a", "path": "a", "size": 1})
+
+        assert two.files == []
+
+    def test_file_entry_objects_normalized_to_dicts(self):
+        folder = FolderEntry(
+            name="Root", folder_id="root",
+            files=[FileEntry(id="a", path="a.ini", name="a.ini", size=3)],
+        )
+
+        assert folder.files == [
+            {"id": "a", "path": "a.ini", "name": "a.ini", "size": 3, "md5": "", "modified": ""}
+        ]
+        assert folder.get_file("a")["size"] == 3
@@ -68,6 +68,17 @@ class TestPlanDownloadsSkipping:
             assert len(tasks) == 0, f"{ext} should be skipped"
             assert skipped == 1
 
+    def test_video_extension_match_is_case_insensitive(self, temp_dir):
+        """Uppercase video extensions are skipped; dotfiles and dotted names aren't videos."""
+        files = [
+            {"id": "1", "path": "folder/video.MP4", "size": 1000, "md5": "abc"},
+            {"id": "2", "path": "folder/.mp4", "size": 1000, "md5": "abc"},
+            {"id": "3", "path": "folder/clip.mp4.txt", "size": 1000, "md5": "abc"},
+        ]
+        tasks, skipped, _ = plan_downloads(files, temp_dir, delete_videos=True)
+        assert sorted(t.file_id for t in tasks) == ["2", "3"]
+        assert skipped == 1
+
 
 class TestPlanDownloadsArchives:
     """Tests for archive file handling."""
@@ -330,6 +341,49 @@ class TestPlanDownloadsRegularFiles:
         assert any("file3.ini" in p for p in task_paths)
         assert any("file4.ini" in p for p in task_paths)
 
+    def test_each_folder_listed_once(self, temp_dir, monkeypatch):
+        """Sizes come from one directory listing per folder, not a stat per file."""
+        import os
+        import src.sync.download_planner as dp
+
+        (temp_dir / "folder").mkdir()
+        (temp_dir / "folder" / "file1.ini").write_text("x" * 10)
+        (temp_dir / "folder" / "file2.ini").write_text("x" * 20)
+
+        listed = []
+        real_scandir = os.scandir
+
+        def counting_scandir(path):
+            listed.append(path)
+            return real_scandir(path)
+
+        monkeypatch.setattr(dp.os, "scandir", counting_scandir)
+        files = [
+            {"id": "1", "path": "folder/file1.ini", "size": 10, "md5": "a"},
+            {"id": "2", "path": "folder/file2.ini", "size": 20, "md5": "b"},
+            {"id": "3", "path": "folder/file3.ini", "size": 30, "md5": "c"},
+            {"id": "4", "path": "new/file4.ini", "size": 40, "md5": "d"},
+            {"id": "5", "path": "new/file5.ini", "size": 50, "md5": "e"},
+        ]
+        tasks, skipped, _ = plan_downloads(files, temp_dir)
+
+        assert skipped == 2
+        assert sorted(t.file_id for t in tasks) == ["3", "4", "5"]
+        assert sorted(listed) == sorted([str(temp_dir / "folder"), str(temp_dir / "new")])
+
+    def test_case_variant_on_disk_checked_by_path(self, temp_dir):
+        """A differently-cased file on disk is resolved by the filesystem, not the listing."""
+        (temp_dir / "folder").mkdir()
+        (temp_dir / "folder" / "Song.ini").write_text("x" * 10)
+
+        files = [{"id": "1", "path": "folder/song.ini", "size": 10, "md5": "a"}]
+        tasks, skipped, _ = plan_downloads(files, temp_dir)
+
+        # Case-insensitive filesystems see it as synced; case-sensitive ones don't
+        case_insensitive = (temp_dir / "folder" / "song.ini").exists()
+        assert skipped == (1 if case_insensitive else 0)
+        assert len(tasks) == (0 if case_insensitive else 1)
+
 
 class TestPlanDownloadsPathSanitization:
     """Tests that plan_downloads works with pre-sanitized paths from scanner.
@@ -418,6 +472,14 @@ class TestPlanDownloadsLongPaths:
         assert len(tasks) == 0
         assert len(long_paths) == 1
 
+    def test_long_path_with_short_components_allowed(self, temp_dir):
+        """A path over 255 chars is fine as long as every component fits."""
+        import src.sync.download_planner as dp
+        assert not dp.has_long_filename("A" * 255)
+        assert dp.has_long_filename("A" * 256)
+        assert not dp.has_long_filename(f"{'A' * 200}/{'B' * 200}\\{'C' * 255}")
+        assert dp.has_long_filename(f"{'A' * 200}\\{'B' * 256}")
+
     def test_normal_length_paths_allowed(self, temp_dir):
         """Normal length paths work fine."""
         files = [{"id": "1", "path": "folder/subfolder/chart.7z", "size": 1000, "md5": "abc"}]
@@ -0,0 +1,155 @@
+"""
+Tests for the Google Drive API client.
+
+Tests batch request handling - multipart response parsing and
+per-file fallbacks - without touching the network.
+"""
+
+import json
+from unittest.mock import patch
+
+import pytest
+import requests
+
+from src.drive.client import DriveClient, DriveClientConfig
+
+
+def make_batch_response(parts: list[tuple[str, int, dict]]) -> requests.Response:
+    """Build a multipart/mixed batch response from (content_id, status, body)."""
+    boundary = "batch_test_boundary"
+    chunks = []
+    for content_id, status, body in parts:
+        chunks.append(
+            f"--{boundary}\r\n"
+            f"Content-Type: application/http\r\n"
+            f"Content-ID: <response-{content_id}>\r\n"
+            f"\r\n"
+            f"HTTP/1.1 {status} OK\r\n"
+            f"Content-Type: application/json; charset=UTF-8\r\n"
+            f"\r\n"
+            f"{json.dumps(body)}\r\n"
+        )
+    chunks.append(f"--{boundary}--\r\n")
+
+    response = requests.Response()
+    response.status_code = 200
+    response.headers["Content-Type"] = f"multipart/mixed; boundary={boundary}"
+    response._content = "".join(chunks).encode("utf-8")
+    return response
+
+
+@pytest.fixture
+def client():
+    return DriveClient(DriveClientConfig(api_key="test", max_qps=0))
+
+
+class TestListFoldersBatch:
+    """Tests for list_folders_batch()."""
+
+    def test_parses_files_per_folder(self, client):
+        response = make_batch_response([
+            ("a", 200, {"files": [{"id": "f1"}]}),
+            ("b", 200, {"files": [{"id": "f2"}, {"id": "f3"}]}),
+        ])
+        with patch.object(client._session, "post", return_value=response):
+            results = client.list_folders_batch(["a", "b"])
+
+        assert [f["id"] for f in results["a"]] == ["f1"]
+        assert [f["id"] for f in results["b"]] == ["f2", "f3"]
+
+    def test_failed_part_retried_individually(self, client):
+        response = make_batch_response([
+            ("a", 200, {"files": [{"id": "f1"}]}),
+            ("b", 403, {"error": {}}),
+        ])
+        with patch.object(client._session, "post", return_value=response), \
+             patch.object(client, "list_folder", return_value=[{"id": "retry"}]) as list_folder:
+            results = client.list_folders_batch(["a", "b"])
+
+        list_folder.assert_called_once_with("b")
+        assert results["b"] == [{"id": "retry"}]
+
+    def test_paginated_folder_continues_from_token(self, client):
+        response = make_batch_response([
+            ("a", 200, {"files": [{"id": "f1"}], "nextPageToken": "page2"}),
+        ])
+        with patch.object(client._session, "post", return_value=response), \
+             patch.object(client, "list_folder") as list_folder, \
+             patch.object(client, "list_folder_from_token", return_value=[{"id": "f2"}]) as from_token:
+            results = client.list_folders_batch(["a"])
+
+        list_folder.assert_not_called()
+        from_token.assert_called_once_with("a", "page2")
+        assert [f["id"] for f in results["a"]] == ["f1", "f2"]
+
+
+class TestGetFilesMetadataBatch:
+    """Tests for get_files_metadata_batch()."""
+
+    def test_returns_metadata_per_id(self, client):
+        response = make_batch_response([
+            ("p1", 200, {"parents": ["root"]}),
+            ("p2", 200, {"parents": ["p1"]}),
+        ])
+        with patch.object(client._session, "post", return_value=response):
+            results = client.get_files_metadata_batch(["p1", "p2"], "parents")
+
+        assert results == {"p1": {"parents": ["root"]}, "p2": {"parents": ["p1"]}}
+
+    def test_not_found_is_none_without_retry(self, client):
+        response = make_batch_response([
+            ("gone", 404, {"error": {}}),
+        ])
+        with patch.object(client._session, "post", return_value=response), \
+             patch.object(client, "get_file_metadata") as get_meta:
+            results = client.get_files_metadata_batch(["gone"], "parents")
+
+        assert results == {"gone": None}
+        get_meta.assert_not_called()
+
+    def test_splits_into_batches(self, client):
+        ids = [f"id{i}" for i in range(150)]
+        responses = [
+            make_batch_response([(fid, 200, {"id": fid}) for fid in ids[:100]]),
+            make_batch_response([(fid, 200, {"id": fid}) for fid in ids[100:]]),
+        ]
+        with patch.object(client._session, "post", side_effect=responses) as post:
+            results = client.get_files_metadata_batch(ids, "id")
+
+        assert post.call_count == 2
+        assert all(results[fid] == {"id": fid} for fid in ids)
+
+
+class TestRateLimit:
+    """Tests for the token-bucket rate limiter."""
+
+    def test_burst_within_capacity_does_not_sleep(self):
+        client = DriveClient(DriveClientConfig(api_key="test", max_qps=10))
+        with patch("src.drive.client.time.sleep") as sleep:
+            client._acquire(10)
+        sleep.assert_not_called()
+
+    def test_batch_over_capacity_sleeps_once_for_deficit(self):
+        client = DriveClient(DriveClientConfig(api_key="test", max_qps=10))
+        with patch("src.drive.client.time.sleep") as sleep:
+            client._acquire(15)
+        sleep.assert_called_once()
+        assert sleep.call_args[0][0] == pytest.approx(0.5, abs=0.05)
+
+    def test_unlimited_never_sleeps(self, client):
+        with patch("src.drive.client.time.sleep") as sleep:
+            client._acquire(1000)
+        sleep.assert_not_called()
+
+
+class TestApiCallCounter:
+    """Tests for the shared API call counter."""
+
+    def test_concurrent_records_are_not_lost(self, client):
+        from concurrent.futures import ThreadPoolExecutor
+
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            for _ in range(8):
+                pool.submit(lambda: [client.record_api_calls(1) for _ in range(10000)])
+
+        assert client.api_calls == 80000
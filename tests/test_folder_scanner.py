@@ -0,0 +1,109 @@
+"""
+Tests for recursive Google Drive folder scanning.
+
+Tests FolderScanner (batch and parallel modes) against a fake Drive tree -
+folder recursion, shortcut handling, and path building.
+"""
+
+import pytest
+
+from src.drive.scanner import FolderScanner
+
+FOLDER = FolderScanner.FOLDER_MIME
+SHORTCUT = FolderScanner.SHORTCUT_MIME
+
+
+class FakeDriveClient:
+    """Serves folder listings and file metadata from in-memory dicts."""
+
+    def __init__(self, listings: dict[str, list], metadata: dict[str, dict]):
+        self.listings = listings
+        self.metadata = metadata
+        self.api_calls = 0
+        self.single_metadata_calls = 0
+        self.batch_metadata_calls = 0
+
+    def list_folder(self, folder_id):
+        self.api_calls += 1
+        return self.listings.get(folder_id, [])
+
+    def list_folders_batch(self, folder_ids):
+        self.api_calls += len(folder_ids)
+        return {fid: self.listings.get(fid, []) for fid in folder_ids}
+
+    def get_file_metadata(self, file_id, fields="id,name,parents"):
+        self.single_metadata_calls += 1
+        self.api_calls += 1
+        return self.metadata.get(file_id)
+
+    def get_files_metadata_batch(self, file_ids, fields="id,name,parents"):
+        self.batch_metadata_calls += 1
+        self.api_calls += len(file_ids)
+        return {fid: self.metadata.get(fid) for fid in file_ids}
+
+
+def make_scanner(client, mode: str) -> FolderScanner:
+    return FolderScanner(client, max_workers=4, use_batch=(mode == "batch"))
+
+
+def file_item(file_id, name, size=1):
+    return {"id": file_id, "name": name, "mimeType": "text/plain", "size": str(size)}
+
+
+def shortcut_item(shortcut_id, name, target_id, target_mime="text/plain"):
+    return {
+        "id": shortcut_id,
+        "name": name,
+        "mimeType": SHORTCUT,
+        "shortcutDetails": {"targetId": target_id, "targetMimeType": target_mime},
+    }
+
+
+@pytest.fixture
+def client():
+    listings = {
+        "root": [
+            {"id": "sub", "name": "Setlist: One", "mimeType": FOLDER},
+            shortcut_item("sc_dir", "Linked", "ext_dir", FOLDER),
+            file_item("f_root", "readme.txt"),
+        ],
+        "sub": [
+            file_item("f_sub", "song.ini"),
+            shortcut_item("sc1", "pack1.zip", "t1"),
+            shortcut_item("sc2", "pack2.zip", "t2"),
+            shortcut_item("sc3", "dead.zip", "missing"),
+        ],
+        "ext_dir": [file_item("f_ext", "notes.chart")],
+    }
+    metadata = {
+        "t1": {"id": "t1", "size": "100", "md5Checksum": "m1", "modifiedTime": "t"},
+        "t2": {"id": "t2", "size": "200", "md5Checksum": "m2", "modifiedTime": "t"},
+    }
+    return FakeDriveClient(listings, metadata)
+
+
+@pytest.mark.parametrize("mode", ["batch", "parallel"])
+class TestFolderScanner:
+    """Tests for FolderScanner.scan() in both modes."""
+
+    def test_finds_all_files_with_paths(self, client, mode):
+        result = make_scanner(client, mode).scan("root")
+
+        paths = {f["path"]: f for f in result.files}
+        assert set(paths) == {
+            "readme.txt",
+            "Setlist - One/song.ini",
+            "Setlist - One/pack1.zip",
+            "Setlist - One/pack2.zip",
+            "Linked/notes.chart",
+        }
+        assert paths["Setlist - One/pack2.zip"]["id"] == "t2"
+        assert paths["Setlist - One/pack2.zip"]["size"] == 200
+        assert result.shortcut_count == 1
+        assert result.folder_count == 3
+
+    def test_file_shortcuts_resolved_in_one_batch(self, client, mode):
+        make_scanner(client, mode).scan("root")
+
+        assert client.single_metadata_calls == 0
+        assert client.batch_metadata_calls == 1
@@ -0,0 +1,260 @@
+"""
+Tests for local filesystem chart statistics.
+
+Tests LocalStatsScanner - chart detection, size bubbling and caching -
+against real temp directories.
+"""
+
+import tempfile
+from pathlib import Path
+
+import pytest
+
+from src.stats.local import LocalStatsScanner, PersistentSetlistCache, _setlist_fingerprint
+
+
+def make_chart(path: Path, size: int = 10):
+    """Create a minimal chart folder (song.ini of the given size)."""
+    path.mkdir(parents=True, exist_ok=True)
+    (path / "song.ini").write_bytes(b"X" * size)
+
+
+@pytest.fixture
+def temp_dir():
+    with tempfile.TemporaryDirectory() as tmpdir:
+        yield Path(tmpdir)
+
+
+class TestScanSetlist:
+    """Tests for single-setlist scanning."""
+
+    def test_counts_deeply_nested_charts(self, temp_dir):
+        setlist = temp_dir / "Setlist"
+        make_chart(setlist / "a" / "b" / "c" / "Chart1", size=10)
+        make_chart(setlist / "a" / "Chart2", size=20)
+        (setlist / "a" / "b" / "loose.bin").write_bytes(b"Y" * 5)
+
+        stats = LocalStatsScanner().get_setlist_stats(setlist)
+
+        # Loose non-chart files outside any chart don't count toward size
+        assert (stats.chart_count, stats.total_size) == (2, 30)
+
+    def test_chart_inside_non_chart_inside_chart(self, temp_dir):
+        """Non-chart folders between charts carry size to the nearest chart."""
+        setlist = temp_dir / "Setlist"
+        make_chart(setlist / "Outer", size=1)
+        (setlist / "Outer" / "Extras" / "Deep").mkdir(parents=True)
+        (setlist / "Outer" / "Extras" / "art.png").write_bytes(b"Y" * 100)
+        make_chart(setlist / "Outer" / "Extras" / "Deep" / "Inner", size=10)
+
+        stats = LocalStatsScanner().get_setlist_stats(setlist)
+
+        assert (stats.chart_count, stats.total_size) == (2, 111)
+
+    def test_symlinked_dirs_not_followed(self, temp_dir):
+        make_chart(temp_dir / "Elsewhere" / "Chart")
+        setlist = temp_dir / "Setlist"
+        make_chart(setlist / "Real")
+        (setlist / "Link").symlink_to(temp_dir / "Elsewhere", target_is_directory=True)
+
+        stats = LocalStatsScanner().get_setlist_stats(setlist)
+
+        assert stats.chart_count == 1
+
+    def test_marker_names_case_insensitive(self, temp_dir):
+        setlist = temp_dir / "Setlist"
+        (setlist / "Chart1").mkdir(parents=True)
+        (setlist / "Chart1" / "NOTES.CHART").write_bytes(b"X")
+        (setlist / "Chart2").mkdir()
+        (setlist / "Chart2" / "Notes.Mid").write_bytes(b"X")
+        (setlist / "NotAChart").mkdir()
+        (setlist / "NotAChart" / "song.ini.bak").write_bytes(b"X")
+
+        assert LocalStatsScanner().get_setlist_stats(setlist).chart_count == 2
+
+    def test_missing_setlist_is_empty(self, temp_dir):
+        stats = LocalStatsScanner().get_setlist_stats(temp_dir / "Missing")
+
+        assert (stats.chart_count, stats.total_size) == (0, 0)
+
+
+class TestNegativeCache:
+    """Tests for remembering setlists that don't exist on disk."""
+
+    def test_missing_setlist_not_restatted(self, temp_dir, monkeypatch):
+        scanner = LocalStatsScanner()
+        missing = temp_dir / "Missing"
+        scanner.get_setlist_stats(missing)
+
+        calls = []
+        monkeypatch.setattr(
+            "src.stats.local._setlist_fingerprint", lambda p: calls.append(p)
+        )
+        assert scanner.get_setlist_stats(missing).chart_count == 0
+        assert calls == []
+
+    def test_expired_entry_rescans(self, temp_dir):
+        scanner = LocalStatsScanner()
+        setlist = temp_dir / "Setlist"
+        scanner.get_setlist_stats(setlist)
+
+        make_chart(setlist / "Chart")
+        scanner._negative_cache[str(setlist)] = 0  # expired
+
+        assert scanner.get_setlist_stats(setlist).chart_count == 1
+        assert str(setlist) not in scanner._negative_cache
+        assert str(setlist) in scanner._setlist_cache
+
+    def test_clear_cache_forgets_missing(self, temp_dir):
+        scanner = LocalStatsScanner()
+        setlist = temp_dir / "Setlist"
+        scanner.get_setlist_stats(setlist)
+
+        make_chart(setlist / "Chart")
+        scanner.clear_cache(temp_dir)
+
+        assert scanner.get_setlist_stats(setlist).chart_count == 1
+
+
+class TestClearCache:
+    """Tests for per-folder cache invalidation."""
+
+    def test_clears_only_that_folder(self, temp_dir):
+        make_chart(temp_dir / "Drive" / "Setlist" / "Chart")
+        make_chart(temp_dir / "Drive 2" / "Setlist" / "Chart")
+        scanner = LocalStatsScanner()
+        scanner.get_folder_stats(temp_dir / "Drive")
+        scanner.get_folder_stats(temp_dir / "Drive 2")
+
+        scanner.clear_cache(temp_dir / "Drive")
+
+        assert str(temp_dir / "Drive" / "Setlist") not in scanner._setlist_cache
+        assert str(temp_dir / "Drive 2" / "Setlist") in scanner._setlist_cache
+        assert str(temp_dir / "Drive") not in scanner._folder_to_setlist_keys
+
+    def test_clears_nested_folders(self, temp_dir):
+        setlist = temp_dir / "Drive" / "Setlist"
+        scanner = LocalStatsScanner()
+        scanner.get_setlist_stats(setlist)
+
+        scanner.clear_cache(temp_dir)
+
+        assert str(setlist) not in scanner._negative_cache
+
+
+class TestScanFolder:
+    """Tests for whole-folder scanning."""
+
+    def test_totals_across_many_setlists(self, temp_dir):
+        for i in range(20):
+            make_chart(temp_dir / f"Setlist {i:02d}" / "Chart", size=i)
+
+        scanner = LocalStatsScanner()
+        stats = scanner.get_folder_stats(temp_dir)
+
+        assert stats.total_charts == 20
+        assert stats.total_size == sum(range(20))
+        assert stats.setlists["Setlist 05"].total_size == 5
+        # Individual setlists are cached too
+        assert scanner.get_setlist_stats(temp_dir / "Setlist 05") is stats.setlists["Setlist 05"]
+
+    def test_missing_folder_is_empty(self, temp_dir):
+        stats = LocalStatsScanner().get_folder_stats(temp_dir / "Missing")
+
+        assert (stats.total_charts, stats.setlists) == (0, {})
+
+    def test_disabled_setlists_filtered(self, temp_dir):
+        make_chart(temp_dir / "Keep" / "Chart", size=3)
+        make_chart(temp_dir / "Drop - Me" / "Chart", size=4)
+        scanner = LocalStatsScanner()
+
+        stats = scanner.get_folder_stats(temp_dir, disabled_setlists={"Drop: Me"})
+
+        assert list(stats.setlists) == ["Keep"]
+        assert (stats.total_charts, stats.total_size) == (1, 3)
+
+    def test_absent_disabled_setlists_reuse_cached_stats(self, temp_dir):
+        make_chart(temp_dir / "Keep" / "Chart")
+        scanner = LocalStatsScanner()
+
+        full = scanner.get_folder_stats(temp_dir)
+
+        assert scanner.get_folder_stats(temp_dir, disabled_setlists={"Not Here"}) is full
+
+    def test_filtered_view_reused_until_disabled_set_changes(self, temp_dir):
+        make_chart(temp_dir / "Keep" / "Chart")
+        make_chart(temp_dir / "Drop" / "Chart")
+        scanner = LocalStatsScanner()
+
+        first = scanner.get_folder_stats(temp_dir, disabled_setlists={"Drop"})
+
+        assert scanner.get_folder_stats(temp_dir, disabled_setlists={"Drop"}) is first
+        assert scanner.get_folder_stats(temp_dir, disabled_setlists={"Keep"}) is not first
+        scanner.clear_cache(temp_dir)
+        assert scanner.get_folder_stats(temp_dir, disabled_setlists={"Drop"}) is not first
+
+
+class TestPersistentSetlistCache:
+    """Tests for setlist stats persisted across runs."""
+
+    def test_unchanged_setlist_served_from_disk(self, temp_dir):
+        setlist = temp_dir / "Drive" / "Setlist"
+        make_chart(setlist / "Chart", size=5)
+        cache_path = temp_dir / "local_stats.json"
+
+        LocalStatsScanner(disk_cache=PersistentSetlistCache(cache_path)).get_folder_stats(temp_dir / "Drive")
+        assert cache_path.exists()
+
+        # Planted values prove the walk was skipped
+        disk_cache = PersistentSetlistCache(cache_path)
+        disk_cache.put(str(setlist), 99, 999, _setlist_fingerprint(str(setlist)))
+        stats = LocalStatsScanner(disk_cache=disk_cache).get_setlist_stats(setlist)
+
+        assert (stats.chart_count, stats.total_size) == (99, 999)
+
+    def test_new_chart_invalidates_entry(self, temp_dir):
+        setlist = temp_dir / "Setlist"
+        make_chart(setlist / "Pack" / "Chart1")
+        disk_cache = PersistentSetlistCache(temp_dir / "local_stats.json")
+        LocalStatsScanner(disk_cache=disk_cache).get_setlist_stats(setlist)
+
+        make_chart(setlist / "Pack" / "Chart2")
+        stats = LocalStatsScanner(disk_cache=disk_cache).get_setlist_stats(setlist)
+
+        assert stats.chart_count == 2
+
+    def test_clear_cache_drops_persisted_entries(self, temp_dir):
+        setlist = temp_dir / "Drive" / "Setlist"
+        make_chart(setlist / "Chart")
+        cache_path = temp_dir / "local_stats.json"
+        scanner = LocalStatsScanner(disk_cache=PersistentSetlistCache(cache_path))
+        scanner.get_folder_stats(temp_dir / "Drive")
+
+        scanner.clear_cache(temp_dir / "Drive")
+
+        reloaded = PersistentSetlistCache(cache_path)
+        assert reloaded.get(str(setlist), _setlist_fingerprint(str(setlist))) is None
+
+    def test_nested_chart_change_invalidates_entry(self, temp_dir):
+        setlist = temp_dir / "Setlist"
+        make_chart(setlist / "Artist" / "Album" / "Chart1")
+        disk_cache = PersistentSetlistCache(temp_dir / "local_stats.json")
+        LocalStatsScanner(disk_cache=disk_cache).get_setlist_stats(setlist)
+
+        # Two levels below the setlist's direct subfolders
+        make_chart(setlist / "Artist" / "Album" / "Chart2")
+        stats = LocalStatsScanner(disk_cache=disk_cache).get_setlist_stats(setlist)
+
+        assert stats.chart_count == 2
+
+    def test_invalidate_keeps_sibling_with_shared_prefix(self, temp_dir):
+        disk_cache = PersistentSetlistCache(temp_dir / "local_stats.json")
+        drive = str(temp_dir / "Drive")
+        drive2 = str(temp_dir / "Drive 2")
+        disk_cache.put(str(Path(drive) / "Setlist"), 1, 10, 1)
+        disk_cache.put(str(Path(drive2) / "Setlist"), 2, 20, 2)
+
+        disk_cache.invalidate(drive)
+
+        assert disk_cache.get(str(Path(drive) / "Setlist"), 1) is None
+        assert disk_cache.get(str(Path(drive2) / "Setlist"), 2) == (2, 20)
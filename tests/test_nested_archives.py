@@ -311,6 +311,37 @@ class TestCacheNestedChartScanning:
 
         assert count == 5, f"Expected 5 charts, got {count}"
 
+    def test_disk_stats_match_chart_scan(self, temp_dir):
+        """scan_disk_stats counts charts like the chart scan, plus all files."""
+        from src.sync.cache import _scan_actual_charts_uncached, scan_disk_stats
+
+        base = temp_dir / "GameRip"
+        self._create_chart_folder(base)
+        self._create_chart_folder(base / "Track01")
+        (base / "Extras").mkdir()
+        (base / "Extras" / "SONG.INI.txt").write_bytes(b"X" * 5)
+        (temp_dir / "GameRip" / "Track01" / "NOTES.CHART").write_bytes(b"X")
+
+        chart_count, chart_size, file_count, disk_size = scan_disk_stats(base)
+
+        assert (chart_count, chart_size) == _scan_actual_charts_uncached(base)
+        assert (chart_count, file_count, disk_size) == (2, 6, 46)
+
+    def test_local_file_scan_also_caches_chart_counts(self, temp_dir):
+        """scan_local_files fills the chart cache with the chart scan's result."""
+        from src.sync.cache import _scan_actual_charts_uncached, get_cache, scan_local_files
+
+        base = temp_dir / "GameRip"
+        self._create_chart_folder(base)
+        self._create_chart_folder(base / "Disc1" / "Track01")
+        (base / "Disc1" / "cover.png").write_bytes(b"X" * 7)
+        (temp_dir / "loose.txt").write_bytes(b"X")
+
+        local_files = scan_local_files(temp_dir)
+
+        assert local_files["GameRip/Disc1/cover.png"] == 7
+        assert get_cache().actual_charts[str(temp_dir)] == _scan_actual_charts_uncached(temp_dir)
+
 
 class TestNestedChartFolders:
     """Tests for nested chart folders (chart folder containing other chart folders)."""
@@ -0,0 +1,101 @@
+"""
+Tests for admin chart-count overrides.
+
+Tests ManifestOverrides loading and lookups from a JSON overrides file.
+"""
+
+import json
+import tempfile
+from pathlib import Path
+
+import pytest
+
+from src.stats import ManifestOverrides, get_best_stats
+from src.stats.overrides import FolderOverride, SetlistOverride
+from src.stats.local import LocalStatsScanner
+
+
+@pytest.fixture
+def overrides_path():
+    with tempfile.TemporaryDirectory() as tmpdir:
+        path = Path(tmpdir) / "manifest_overrides.json"
+        path.write_text(json.dumps({
+            "overrides": {
+                "Game Rips": {
+                    "_folder_id": "abc",
+                    "_description": "Nested archives",
+                    "setlists": {
+                        "Rock Band 1": {"chart_count": 58},
+                        "Unknown": {},
+                    },
+                },
+            },
+        }))
+        yield path
+
+
+class TestManifestOverrides:
+    """Tests for loading and querying overrides."""
+
+    def test_loads_folders_and_setlists(self, overrides_path):
+        overrides = ManifestOverrides.load(overrides_path)
+
+        folder = overrides.get_folder_override("Game Rips")
+        assert (folder.folder_id, folder.description) == ("abc", "Nested archives")
+        assert overrides.get_setlist_override("Game Rips", "Rock Band 1").chart_count == 58
+        assert overrides.get_setlist_override("Game Rips", "Unknown").chart_count is None
+
+    def test_missing_entries_are_none(self, overrides_path):
+        overrides = ManifestOverrides.load(overrides_path)
+
+        assert overrides.get_setlist_override("Game Rips", "Nope") is None
+        assert overrides.get_setlist_override("Other", "Rock Band 1") is None
+        assert not overrides.has_override("Other", "Rock Band 1")
+        assert overrides.get_chart_count("Other", "x", default=7) == 7
+
+    def test_invalid_json_loads_empty(self, overrides_path):
+        overrides_path.write_text("{not json")
+
+        overrides = ManifestOverrides.load(overrides_path)
+
+        assert overrides.overrides == {}
+        assert overrides.get_setlist_override("Game Rips", "Rock Band 1") is None
+
+    def test_has_override(self, overrides_path):
+        overrides = ManifestOverrides.load(overrides_path)
+
+        assert overrides.has_override("Game Rips", "Rock Band 1")
+        assert overrides.has_override("Game Rips", "Unknown")
+        assert not overrides.has_override("Game Rips", "Nope")
+
+    def test_lookups_see_direct_mutation(self, overrides_path):
+        overrides = ManifestOverrides.load(overrides_path)
+        assert overrides.get_setlist_override("B", "t") is None
+
+        overrides.overrides["B"] = FolderOverride(setlists={"t": SetlistOverride(chart_count=3)})
+        overrides.overrides["Game Rips"].setlists["New"] = SetlistOverride(chart_count=1)
+
+        assert overrides.get_setlist_override("B", "t").chart_count == 3
+        assert overrides.has_override("B", "t")
+        assert overrides.get_chart_count("Game Rips", "New") == 1
+
+
+class TestBestStats:
+    """Tests for combining local scan, overrides and Drive API data."""
+
+    def test_priority_order(self, overrides_path, tmp_path):
+        (tmp_path / "Rock Band 2" / "Chart").mkdir(parents=True)
+        (tmp_path / "Rock Band 2" / "Chart" / "song.ini").write_bytes(b"X" * 4)
+        scanner = LocalStatsScanner()
+        overrides = ManifestOverrides.load(overrides_path)
+
+        def best_stats(folder, setlist, charts, size, local_path=None):
+            return get_best_stats(
+                folder, setlist, charts, size, local_path,
+                scanner=scanner, overrides=overrides,
+            )
+
+        # Local charts win, then the override count, then Drive data
+        assert best_stats("Game Rips", "Rock Band 2", 9, 900, tmp_path) == (1, 4)
+        assert best_stats("Game Rips", "Rock Band 1", 9, 900, tmp_path) == (58, 900)
+        assert best_stats("Game Rips", "Unknown", 9, 900) == (9, 900)
@@ -8,7 +8,7 @@ setlist filtering, download planning, purge planning, and cache operations.
 
 import tempfile
 from pathlib import Path
-from unittest.mock import MagicMock
+from unittest.mock import MagicMock, patch
 
 import pytest
 
@@ -70,10 +70,10 @@ class TestChangesAPISanitization:
     def test_changes_path_components_sanitized(self):
         """_get_file_path should produce sanitized path components."""
         from src.drive.changes import ChangeTracker
+        from src.manifest import Manifest
 
         mock_client = MagicMock()
-        mock_manifest = MagicMock()
-        tracker = ChangeTracker(mock_client, mock_manifest)
+        tracker = ChangeTracker(mock_client, Manifest())
 
         root_id = "root_folder"
         file_id = "file_123"
@@ -153,6 +153,24 @@ class TestDisabledSetlistAsFilesystemPath:
         count, size = scan_actual_charts(tmp_path, disabled)
         assert count == 0
 
+    def test_several_uncached_disabled_setlists(self, tmp_path):
+        """Disabled setlists scanned together are each subtracted once."""
+        for name in ("A", "B", "C"):
+            chart_dir = tmp_path / name / "chart"
+            chart_dir.mkdir(parents=True)
+            (chart_dir / "song.ini").write_bytes(b"\x00" * 10)
+
+        assert scan_actual_charts(tmp_path, {"A", "B", "Missing"}) == (1, 10)
+        assert scan_actual_charts(tmp_path, {"A"}) == (2, 20)
+
+    def test_empty_folder_skips_disabled_setlist_scans(self, tmp_path):
+        """Nothing to subtract from a folder with no charts."""
+        assert scan_actual_charts(tmp_path) == (0, 0)
+
+        with patch("src.sync.cache.scan_chart_tree") as scan:
+            assert scan_actual_charts(tmp_path, {"A", "B"}) == (0, 0)
+        scan.assert_not_called()
+
 
 class TestDownloadPlannerWithSanitizedPaths:
     """Download planner receives pre-sanitized paths from manifest."""
@@ -222,6 +240,15 @@ class TestScanCacheVersioning:
         assert len(result) == 1
         assert result[0]["id"] == "1"
 
+    def test_missing_or_corrupt_cache_returns_none(self, tmp_path):
+        """Missing and unparseable entries are misses, not errors."""
+        cache = ScanCache()
+        cache._dir = tmp_path
+        (tmp_path / "broken.json").write_text("{not json")
+
+        assert cache.get("missing") is None
+        assert cache.get("broken") is None
+
 
 class TestGetSyncStatusWithDisabledSetlists:
     """Integration: get_sync_status filters disabled setlists correctly."""
@@ -0,0 +1,80 @@
+"""
+Tests for the one-time unsanitized path migration.
+
+Tests migrate_unsanitized_paths() - bottom-up renames under Sync Charts/.
+"""
+
+import tempfile
+from pathlib import Path
+
+import pytest
+
+from src.core.paths import migrate_unsanitized_paths
+
+
+@pytest.fixture
+def app_dir(monkeypatch):
+    with tempfile.TemporaryDirectory() as tmpdir:
+        monkeypatch.setenv("SYNCHOTIC_ROOT", tmpdir)
+        yield Path(tmpdir)
+
+
+class TestMigrateUnsanitizedPaths:
+    """Tests for renaming legacy unsanitized names on disk."""
+
+    def test_renames_nested_dirs_and_files(self, app_dir):
+        """Nested dirs and files are renamed bottom-up."""
+        chart = app_dir / "Sync Charts" / "Drive: One" / "Song: Name"
+        chart.mkdir(parents=True)
+        (chart / "notes?.chart").write_text("x")
+
+        renamed = migrate_unsanitized_paths()
+
+        expected = app_dir / "Sync Charts" / "Drive - One" / "Song - Name"
+        assert (expected / "notes.chart").exists()
+        assert len(renamed) == 3
+
+    def test_renames_across_many_drives(self, app_dir):
+        """Every top-level drive subtree is processed."""
+        root = app_dir / "Sync Charts"
+        for i in range(10):
+            (root / f"Drive {i}" / "Set: List").mkdir(parents=True)
+
+        renamed = migrate_unsanitized_paths()
+
+        assert len(renamed) == 10
+        for i in range(10):
+            assert (root / f"Drive {i}" / "Set - List").is_dir()
+
+    def test_skips_when_target_exists(self, app_dir):
+        """Never clobber an existing sanitized sibling."""
+        drive = app_dir / "Sync Charts" / "Drive"
+        drive.mkdir(parents=True)
+        (drive / "a:b.txt").write_text("old")
+        (drive / "a -b.txt").write_text("new")
+
+        assert migrate_unsanitized_paths() == []
+        assert (drive / "a:b.txt").read_text() == "old"
+        assert (drive / "a -b.txt").read_text() == "new"
+
+    def test_skips_symlinks(self, app_dir):
+        """Symlinks are neither renamed nor followed."""
+        outside = app_dir / "Library"
+        (outside / "Song: Inside").mkdir(parents=True)
+        drive = app_dir / "Sync Charts" / "Drive"
+        drive.mkdir(parents=True)
+        (drive / "Linked: Lib").symlink_to(outside, target_is_directory=True)
+
+        assert migrate_unsanitized_paths() == []
+        assert (drive / "Linked: Lib").is_symlink()
+        assert (outside / "Song: Inside").exists()
+
+    def test_runs_once(self, app_dir):
+        """Flag file prevents a second walk."""
+        drive = app_dir / "Sync Charts" / "Drive"
+        drive.mkdir(parents=True)
+        migrate_unsanitized_paths()
+
+        (drive / "late:file.txt").write_text("x")
+        (app_dir / "Sync Charts" / "New: Drive").mkdir()
+        assert migrate_unsanitized_paths() == []
@@ -56,6 +56,12 @@ class TestIsArchiveFile:
         assert is_archive_file("notes.mid") is False
         assert is_archive_file("song.ogg") is False
 
+    def test_only_final_extension_counts(self):
+        assert is_archive_file("Setlist/chart.zip") is True
+        assert is_archive_file("chart.zip.part") is False
+        assert is_archive_file("zip") is False
+        assert is_archive_file("chart.tar.7z") is True
+
 
 class TestIsArchiveSynced:
     """Tests for is_archive_synced() - core archive sync checking."""
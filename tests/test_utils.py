@@ -9,6 +9,7 @@ from src.core.formatting import (
     sanitize_path,
     escape_name_slashes,
     normalize_fs_name,
+    normalize_path_key,
     dedupe_files_by_newest,
     normalize_manifest_files,
     format_size,
@@ -153,6 +154,20 @@ class TestNormalizeFsName:
         assert normalize_fs_name("Pokémon") == "Pokémon"
 
 
+class TestNormalizePathKey:
+    """Tests for normalize_path_key() - case/unicode-insensitive path keys."""
+
+    def test_ascii_lowercased(self):
+        assert normalize_path_key("Setlist/Song.INI") == "setlist/song.ini"
+
+    def test_nfd_and_nfc_share_a_key(self):
+        import unicodedata
+
+        name = "Setlist/Pokémon"
+        nfd = unicodedata.normalize("NFD", name)
+        assert normalize_path_key(nfd) == normalize_path_key(name) == "setlist/pokémon"
+
+
 class TestEscapeNameSlashes:
     """Tests for escape_name_slashes() - escaping literal slashes in Drive names."""
 
@@ -523,5 +538,76 @@ class TestCrossPlatformPaths:
         assert "Setlist/ChartB" in parents
 
 
+
+class TestJsonio:
+    """Tests for the shared JSON helpers (orjson or stdlib fallback)."""
+
+    def test_round_trip_compact_bytes(self):
+        from src.core.jsonio import json_dumps, json_loads
+
+        data = {"a": [1, 2], "name": "Pokémon"}
+        encoded = json_dumps(data)
+
+        assert isinstance(encoded, bytes)
+        assert b" " not in encoded.replace("Pokémon".encode(), b"")
+        assert json_loads(encoded) == data
+
+    def test_stdlib_fallback_matches(self, monkeypatch):
+        import builtins
+        import importlib
+
+        import src.core.jsonio as jsonio
+
+        real_import = builtins.__import__
+
+        def no_orjson(name, *args, **kwargs):
+            if name == "orjson":
+                raise ImportError(name)
+            return real_import(name, *args, **kwargs)
+
+        monkeypatch.setattr(builtins, "__import__", no_orjson)
+        try:
+            fallback = importlib.reload(jsonio)
+            assert fallback.orjson is None
+            assert fallback.json_dumps({"a": [1, 2]}) == b'{"a":[1,2]}'
+            assert fallback.json_loads(b'{"a":[1,2]}') == {"a": [1, 2]}
+        finally:
+            monkeypatch.undo()
+            importlib.reload(jsonio)
+
+
+
+class TestWriteAtomic:
+    """Tests for write_atomic() - temp file + rename writes."""
+
+    def test_replaces_contents_without_leftovers(self, tmp_path):
+        from src.core.files import write_atomic
+
+        target = tmp_path / "data.json"
+        target.write_bytes(b"old")
+        write_atomic(target, b"new")
+
+        assert target.read_bytes() == b"new"
+        assert [p.name for p in tmp_path.iterdir()] == ["data.json"]
+
+    def test_failed_write_keeps_old_file(self, tmp_path, monkeypatch):
+        import os
+
+        from src.core.files import write_atomic
+
+        target = tmp_path / "data.json"
+        target.write_bytes(b"old")
+
+        def fail_replace(src, dst):
+            raise OSError("disk full")
+
+        monkeypatch.setattr(os, "replace", fail_replace)
+        with pytest.raises(OSError):
+            write_atomic(target, b"new")
+
+        assert target.read_bytes() == b"old"
+        assert [p.name for p in tmp_path.iterdir()] == ["data.json"]
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])